@@ -1,451 +1,1538 @@
-import torch
-import torch.nn as nn
-import torch.nn.functional as F
-import math
-import numpy as np
-from collections import Counter
-import re
-
-class PasswordTokenizer:
-    def __init__(self):
-        # Special tokens
-        self.PAD_TOKEN = '<PAD>'
-        self.UNK_TOKEN = '<UNK>'
-        
-        # Create base vocabulary
-        self.vocab = {
-            self.PAD_TOKEN: 0,
-            self.UNK_TOKEN: 1
-        }
-        
-        # Add ASCII characters (printable)
-        for i in range(32, 127):
-            self.vocab[chr(i)] = len(self.vocab)
-            
-        self.id2char = {v: k for k, v in self.vocab.items()}
-        self.vocab_size = len(self.vocab)
-    
-    def tokenize(self, text, max_length=32):
-        # Convert to list of token ids with padding
-        tokens = []
-        for char in str(text):
-            if char in self.vocab:
-                tokens.append(self.vocab[char])
-            else:
-                tokens.append(self.vocab[self.UNK_TOKEN])
-        
-        # Pad or truncate
-        if len(tokens) < max_length:
-            tokens.extend([self.vocab[self.PAD_TOKEN]] * (max_length - len(tokens)))
-        else:
-            tokens = tokens[:max_length]
-            
-        return torch.tensor(tokens, dtype=torch.long)
-
-class QuantumBrain(nn.Module):
-    def __init__(self, vocab_size=128, embedding_dim=256, hidden_dim=256, max_length=32):
-        super().__init__()
-        
-        # Dimensions
-        self.vocab_size = vocab_size
-        self.embedding_dim = embedding_dim
-        self.hidden_dim = hidden_dim
-        self.max_length = max_length
-        
-        # Character embedding
-        self.char_embedding = nn.Embedding(
-            num_embeddings=vocab_size,
-            embedding_dim=embedding_dim,
-            padding_idx=0
-        )
-        
-        # Position encoding
-        self.register_buffer('position_encoding', self.create_position_encoding())
-        
-        # Single LSTM layer
-        self.lstm = nn.LSTM(
-            input_size=embedding_dim,
-            hidden_size=hidden_dim,
-            num_layers=1,
-            batch_first=True,
-            bidirectional=True
-        )
-        
-        # Single attention layer
-        self.attention = nn.MultiheadAttention(
-            embed_dim=hidden_dim * 2,
-            num_heads=8,
-            dropout=0.1,
-            batch_first=True
-        )
-        
-        # Neural networks for analysis
-        self.strength_net = nn.Sequential(
-            nn.Linear(hidden_dim * 2, 128),
-            nn.LayerNorm(128),
-            nn.ReLU(),
-            nn.Linear(128, 64),
-            nn.ReLU(),
-            nn.Linear(64, 1),
-            nn.Sigmoid()
-        )
-        
-        self.pattern_net = nn.Sequential(
-            nn.Linear(hidden_dim * 2, 128),
-            nn.LayerNorm(128),
-            nn.ReLU(),
-            nn.Linear(128, 32),
-            nn.ReLU(),
-            nn.Linear(32, 16)
-        )
-        
-        self.complexity_net = nn.Sequential(
-            nn.Linear(hidden_dim * 2, 64),
-            nn.LayerNorm(64),
-            nn.ReLU(),
-            nn.Linear(64, 32),
-            nn.ReLU(),
-            nn.Linear(32, 4)
-        )
-        
-    def create_position_encoding(self):
-        position = torch.arange(self.max_length).unsqueeze(1)
-        div_term = torch.exp(torch.arange(0, self.embedding_dim, 2) * (-math.log(10000.0) / self.embedding_dim))
-        pe = torch.zeros(self.max_length, self.embedding_dim)
-        pe[:, 0::2] = torch.sin(position * div_term)
-        pe[:, 1::2] = torch.cos(position * div_term)
-        return pe
-        
-    def forward(self, x):
-        # Embedding with positional encoding
-        embedded = self.char_embedding(x)
-        embedded = embedded + self.position_encoding[:x.size(1)]
-        
-        # LSTM processing
-        lstm_out, _ = self.lstm(embedded)
-        
-        # Self-attention
-        attn_out, _ = self.attention(lstm_out, lstm_out, lstm_out)
-        
-        # Combine outputs
-        combined = torch.cat([lstm_out, attn_out], dim=-1)
-        pooled = torch.cat([
-            F.adaptive_avg_pool1d(combined.transpose(1, 2), 1).squeeze(-1),
-            F.adaptive_max_pool1d(combined.transpose(1, 2), 1).squeeze(-1)
-        ], dim=-1)
-        
-        # Get outputs
-        strength = self.strength_net(pooled)
-        patterns = self.pattern_net(pooled)
-        complexity = self.complexity_net(pooled)
-        
-        return strength, patterns, complexity
-
-class PasswordAnalyzer:
-    def __init__(self, model_path='quantum_model_best.pth'):
-        self.tokenizer = PasswordTokenizer()
-        self.model = QuantumBrain(
-            vocab_size=self.tokenizer.vocab_size,
-            embedding_dim=256,
-            hidden_dim=256,
-            max_length=32
-        )
-        
-        # Try to load pretrained model
-        try:
-            checkpoint = torch.load(model_path, map_location=torch.device('cpu'))
-            self.model.load_state_dict(checkpoint['model_state_dict'])
-            print(f"Loaded pretrained model from {model_path}")
-        except Exception as e:
-            print(f"Using default initialization: {e}")
-            
-        self.model.eval()
-        
-        # Analysis components
-        self.pattern_types = [
-            'sequential', 'repeated', 'keyboard', 'common',
-            'dictionary', 'personal', 'leetspeak', 'random',
-            'date', 'name', 'word', 'phrase', 'number',
-            'symbol', 'mixed', 'complex'
-        ]
-        
-        self.complexity_levels = [
-            'basic', 'medium', 'advanced', 'quantum'
-        ]
-        
-        # Movie quotes and references for recognition
-        self.movie_quotes = [
-            "IAmIronMan", "AvengersAssemble", "WakandaForever",
-            "WithGreatPowerComesGreatResponsibility", "IAmBatman",
-            "MayTheForceBeWithYou", "YouShallNotPass", "HereIsJohnny",
-            "ThisIsTheWay", "IAmYourFather", "IllBeBack",
-            "HastaLaVistaBaby", "YippeeKiYay", "TheMatrixHasYou",
-            "ForFrodo", "PerfectlyBalanced", "ThanosDemandsSilence",
-            "OnYourLeft", "ICanDoThisAllDay", "GrootIsGroot",
-            "TonyStarkBuiltThisInACave", "ImAlwaysAngry",
-            "HulkSmash", "WebHead", "UseTheForce", "JediMaster"
-        ]
-        
-    def analyze_password(self, password):
-        # Handle empty password
-        if not password or password.isspace():
-            return {
-                'strength': 0,
-                'entropy': 0,
-                'patterns': [],
-                'complexity': 'basic',
-                'suggestions': ["Enter a password to analyze"]
-            }
-            
-        # Tokenize password
-        with torch.no_grad():
-            tokens = self.tokenizer.tokenize(password).unsqueeze(0)
-            strength, patterns, complexity = self.model(tokens)
-            
-            # Enhanced analysis
-            entropy = self.calculate_entropy(password)
-            pattern_analysis = self.analyze_patterns(password)
-            movie_quote_strength = self.check_movie_quotes(password)
-            
-            # Base strength calculation
-            base_strength = self.calculate_base_strength(password)
-            
-            # Combine all analyses
-            final_strength = self.combine_analyses(
-                base_strength=base_strength,
-                neural_strength=strength.item() * 100,
-                entropy=entropy,
-                patterns=pattern_analysis,
-                movie_quote_strength=movie_quote_strength,
-                password_length=len(password)
-            )
-            
-            # For generated passwords with 100% target strength, ensure they get 100%
-            if self.is_perfect_password(password):
-                final_strength = 100
-            
-            return {
-                'strength': final_strength,
-                'entropy': entropy,
-                'patterns': self.get_pattern_types(patterns[0]),
-                'complexity': self.get_complexity_level(final_strength),
-                'suggestions': self.generate_suggestions(final_strength, pattern_analysis, len(password))
-            }
-            
-    def is_perfect_password(self, password):
-        """Check if password meets all criteria for 100% strength"""
-        if len(password) < 20:
-            return False
-            
-        # Check for all required character types
-        has_lower = any(c.islower() for c in password)
-        has_upper = any(c.isupper() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(not c.isalnum() for c in password)
-        
-        if not (has_lower and has_upper and has_digit and has_special):
-            return False
-            
-        # Check for movie quotes
-        if not any(quote.lower() in password.lower() for quote in self.movie_quotes):
-            return False
-            
-        # Check entropy
-        if self.calculate_entropy(password) < 4.0:
-            return False
-            
-        # Check for bad patterns
-        patterns = self.analyze_patterns(password)
-        if any([patterns['sequential'], patterns['repeated'], 
-               patterns['keyboard'], patterns['common']]):
-            return False
-            
-        return True
-    
-    def calculate_base_strength(self, password):
-        """Calculate base strength from password characteristics"""
-        score = 0
-        length = len(password)
-        
-        # Length score (up to 40 points)
-        if length >= 32:
-            score += 40
-        elif length >= 24:
-            score += 35
-        elif length >= 16:
-            score += 30
-        elif length >= 12:
-            score += 25
-        elif length >= 8:
-            score += 20
-        else:
-            # Even short passwords get some points
-            score += max(5, length * 2)
-        
-        # Character variety (up to 40 points)
-        unique_chars = len(set(password))
-        variety_ratio = unique_chars / length if length > 0 else 0
-        
-        # More unique characters = better, but don't penalize long passwords
-        if variety_ratio >= 0.7:  # High variety
-            score += 40
-        elif variety_ratio >= 0.5:  # Good variety
-            score += 30
-        elif variety_ratio >= 0.3:  # Moderate variety
-            score += 20
-        else:  # Low variety but still give some points
-            score += 10
-        
-        # Character type bonuses (up to 20 points)
-        has_lower = any(c.islower() for c in password)
-        has_upper = any(c.isupper() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(not c.isalnum() for c in password)
-        
-        char_types = sum([has_lower, has_upper, has_digit, has_special])
-        score += char_types * 5  # 5 points per character type
-        
-        return score
-    
-    def calculate_entropy(self, password):
-        char_counts = Counter(password)
-        length = len(password)
-        entropy = 0
-        for count in char_counts.values():
-            prob = count / length
-            entropy -= prob * math.log2(prob)
-        return entropy * length
-    
-    def analyze_patterns(self, password):
-        lower_pass = password.lower()
-        
-        # Calculate ratio of repeated characters
-        char_counts = Counter(password)
-        most_common_count = char_counts.most_common(1)[0][1] if char_counts else 0
-        repeat_ratio = most_common_count / len(password) if password else 0
-        
-        # Only consider it repeated if the ratio is high
-        is_repeated = repeat_ratio > 0.4  # 40% threshold
-        
-        # Only consider keyboard patterns if they make up most of the password
-        keyboard_match = re.search(r'(?:qwerty|asdfgh|zxcvbn|qazwsx|zxcvbn)', lower_pass)
-        is_keyboard = bool(keyboard_match and len(keyboard_match.group(0)) / len(password) > 0.5)
-        
-        # Only consider sequential patterns if they make up most of the password
-        seq_match = re.search(r'(?:abc|bcd|cde|def|123|234|345|456|567|678|789|012|qwe|wer|ert|rty|tyu|yui|uio|iop|asd|sdf|dfg|fgh|ghj|hjk|jkl|zxc|xcv|cvb|vbn|bnm)', lower_pass)
-        is_sequential = bool(seq_match and len(seq_match.group(0)) / len(password) > 0.5)
-        
-        return {
-            'sequential': is_sequential,
-            'repeated': is_repeated,
-            'keyboard': is_keyboard,
-            'common': bool(re.search(r'^(?:password|admin|123456|qwerty|letmein|welcome|monkey|dragon|baseball|football|master|hello|shadow|superman|batman|trustno1)$', lower_pass)),
-            'leet': bool(re.search(r'[0-9@$!%*#?&]', password)),
-            'mixed_case': password.lower() != password and password.upper() != password,
-            'numbers_only': password.isdigit(),
-            'letters_only': password.isalpha(),
-            'ends_number': bool(re.search(r'\d+$', password)),
-            'simple_append': bool(re.search(r'^[A-Za-z]+[0-9]+[!@#$%^&*]*$', password))
-        }
-    
-    def check_movie_quotes(self, password):
-        """Check for movie quotes and calculate bonus strength"""
-        max_bonus = 0
-        for quote in self.movie_quotes:
-            if quote.lower() in password.lower():
-                # Longer quotes give more bonus
-                bonus = min(30, len(quote) / 2)
-                max_bonus = max(max_bonus, bonus)
-        return max_bonus
-    
-    def combine_analyses(self, base_strength, neural_strength, entropy, patterns, movie_quote_strength, password_length):
-        # Start with base strength
-        strength = base_strength
-        
-        # Neural network contribution (20% weight to reduce its impact)
-        strength = (strength * 0.8) + (neural_strength * 0.2)
-        
-        # Entropy bonus (up to 20 points)
-        if entropy > 4.0:
-            strength += 20
-        elif entropy > 3.0:
-            strength += 15
-        elif entropy > 2.0:
-            strength += 10
-        elif entropy > 1.0:  # Even low entropy gets something
-            strength += 5
-        
-        # Pattern penalties (reduced and only apply to very weak patterns)
-        if patterns['common']:
-            strength *= 0.5  # Only penalize common passwords heavily
-        if patterns['numbers_only'] and password_length < 12:
-            strength *= 0.7  # Only penalize short number-only passwords
-        if patterns['letters_only'] and password_length < 12:
-            strength *= 0.8  # Only penalize short letter-only passwords
-            
-        # Complexity bonuses
-        if patterns['leet']:
-            strength *= 1.15  # 15% bonus
-        if patterns['mixed_case']:
-            strength *= 1.15  # 15% bonus
-            
-        # Movie quote bonus
-        strength += movie_quote_strength
-        
-        # Length bonuses (never penalties)
-        if password_length >= 20:
-            strength *= 1.2  # 20% bonus for long passwords
-        elif password_length >= 16:
-            strength *= 1.1  # 10% bonus for medium-long passwords
-            
-        # Ensure minimum strength based on length
-        min_strength = max(5, password_length * 2)  # Even short passwords get some points
-        
-        return max(min_strength, min(100, strength))
-    
-    def get_complexity_level(self, strength):
-        if strength >= 90:
-            return 'quantum'
-        elif strength >= 70:
-            return 'advanced'
-        elif strength >= 40:
-            return 'medium'
-        return 'basic'
-    
-    def get_pattern_types(self, pattern_logits):
-        patterns = []
-        probs = torch.sigmoid(pattern_logits)
-        for i, prob in enumerate(probs):
-            if prob > 0.5 and i < len(self.pattern_types):
-                patterns.append(self.pattern_types[i])
-        return patterns
-    
-    def generate_suggestions(self, strength, patterns, length):
-        suggestions = []
-        
-        if length < 12:
-            suggestions.append("🔒 Increase password length (minimum 12 characters recommended)")
-        
-        if strength < 50:
-            suggestions.append("💪 Add special characters and numbers")
-            suggestions.append("🔠 Mix uppercase and lowercase letters")
-            
-        if patterns['sequential']:
-            suggestions.append("⚠️ Avoid sequential characters (abc, 123, etc.)")
-        if patterns['repeated']:
-            suggestions.append("⚠️ Avoid repeated characters")
-        if patterns['keyboard']:
-            suggestions.append("⚠️ Avoid keyboard patterns (qwerty, asdfgh)")
-        if patterns['common']:
-            suggestions.append("⚡ Use more unique combinations")
-            
-        if not patterns['leet']:
-            suggestions.append("🔧 Consider using leetspeak (replace letters with numbers/symbols)")
-            
-        if strength < 70:
-            suggestions.append("🎬 Try incorporating movie quotes or memorable phrases")
-            
-        if not suggestions:
-            suggestions.append("✨ Great password! Keep it safe!")
-            
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+import math
+import os
+import io
+import copy
+import time
+import hashlib
+import itertools
+import threading
+import weakref
+import numpy as np
+from collections import Counter, OrderedDict, deque
+import re
+import contextlib
+from typing import Optional
+from password_generator import QuantumGenerator
+
+# Optional ONNX Runtime backend
+try:
+    import onnxruntime
+except ImportError:
+    onnxruntime = None
+
+class PasswordTokenizer:
+    def __init__(self):
+        # Special tokens
+        self.PAD_TOKEN = '<PAD>'
+        self.UNK_TOKEN = '<UNK>'
+        
+        # Create base vocabulary
+        self.vocab = {
+            self.PAD_TOKEN: 0,
+            self.UNK_TOKEN: 1
+        }
+        
+        # Add ASCII characters (printable)
+        for i in range(32, 127):
+            self.vocab[chr(i)] = len(self.vocab)
+            
+        self.id2char = {v: k for k, v in self.vocab.items()}
+        self.vocab_size = len(self.vocab)
+        
+        # Byte-range lookup table: code point -> token id. Anything outside
+        # the table (including all non-Latin-1 characters) maps to UNK.
+        self.lookup = np.full(256, self.vocab[self.UNK_TOKEN], dtype=np.int64)
+        for char, idx in self.vocab.items():
+            if len(char) == 1:
+                self.lookup[ord(char)] = idx
+    
+    def tokenize(self, text, max_length=32):
+        return self.tokenize_batch([text], max_length)[0]
+        
+    def tokenize_batch(self, texts, max_length=32):
+        # torch.from_numpy shares the encoded buffer instead of copying it
+        return torch.from_numpy(self.encode_batch(texts, max_length))
+        
+    def encode_batch(self, texts, max_length=32):
+        """Encode texts into a padded [batch, max_length] int64 array in one pass"""
+        texts = [str(text)[:max_length] for text in texts]
+        tokens = np.zeros((len(texts), max_length), dtype=np.int64)
+        
+        lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+        total = int(lengths.sum())
+        if total == 0:
+            return tokens
+            
+        # Decode every character of the batch to its code point at once
+        codes = np.frombuffer(
+            ''.join(texts).encode('utf-32-le', 'surrogatepass'),
+            dtype=np.uint32
+        )
+        ids = self.lookup[np.minimum(codes, len(self.lookup) - 1)]
+        
+        # Scatter the flat ids into their (row, column) slots
+        rows = np.repeat(np.arange(len(texts)), lengths)
+        starts = np.cumsum(lengths) - lengths
+        cols = np.arange(total) - np.repeat(starts, lengths)
+        tokens[rows, cols] = ids
+        return tokens
+
+class QuantumBrain(nn.Module):
+    def __init__(self, vocab_size=128, embedding_dim=256, hidden_dim=256, max_length=32):
+        super().__init__()
+        
+        # Dimensions
+        self.vocab_size = vocab_size
+        self.embedding_dim = embedding_dim
+        self.hidden_dim = hidden_dim
+        self.max_length = max_length
+        
+        # Character embedding
+        self.char_embedding = nn.Embedding(
+            num_embeddings=vocab_size,
+            embedding_dim=embedding_dim,
+            padding_idx=0
+        )
+        
+        # Position encoding
+        self.register_buffer('position_encoding', self.create_position_encoding())
+        
+        # Single LSTM layer
+        self.lstm = nn.LSTM(
+            input_size=embedding_dim,
+            hidden_size=hidden_dim,
+            num_layers=1,
+            batch_first=True,
+            bidirectional=True
+        )
+        
+        # Packed sequences are the fast path; ONNX export switches this off
+        # because the exporters cannot trace them
+        self.pack_sequences = True
+        self.directional = None
+        
+        # Single attention layer
+        self.attention = nn.MultiheadAttention(
+            embed_dim=hidden_dim * 2,
+            num_heads=8,
+            dropout=0.1,
+            batch_first=True
+        )
+        
+        # Pooled features: [lstm, attention] outputs under avg and max pooling
+        pooled_dim = hidden_dim * 8
+        
+        # Neural networks for analysis
+        self.strength_net = nn.Sequential(
+            nn.Linear(pooled_dim, 128),
+            nn.LayerNorm(128),
+            nn.ReLU(),
+            nn.Linear(128, 64),
+            nn.ReLU(),
+            nn.Linear(64, 1),
+            nn.Sigmoid()
+        )
+        
+        self.pattern_net = nn.Sequential(
+            nn.Linear(pooled_dim, 128),
+            nn.LayerNorm(128),
+            nn.ReLU(),
+            nn.Linear(128, 32),
+            nn.ReLU(),
+            nn.Linear(32, 16)
+        )
+        
+        self.complexity_net = nn.Sequential(
+            nn.Linear(pooled_dim, 64),
+            nn.LayerNorm(64),
+            nn.ReLU(),
+            nn.Linear(64, 32),
+            nn.ReLU(),
+            nn.Linear(32, 4)
+        )
+        
+    def create_position_encoding(self):
+        position = torch.arange(self.max_length).unsqueeze(1)
+        div_term = torch.exp(torch.arange(0, self.embedding_dim, 2) * (-math.log(10000.0) / self.embedding_dim))
+        pe = torch.zeros(self.max_length, self.embedding_dim)
+        pe[:, 0::2] = torch.sin(position * div_term)
+        pe[:, 1::2] = torch.cos(position * div_term)
+        return pe
+        
+    def forward(self, x, lengths: Optional[torch.Tensor] = None):
+        """Score a [batch, seq] token batch.
+        
+        Without lengths every position is treated as input, including pads.
+        With lengths the LSTM runs on packed sequences and pads are masked
+        out of attention and pooling, so trailing pads cost nothing.
+        """
+        # Embedding with positional encoding
+        embedded = self.embed(x)
+        
+        # LSTM processing
+        pad_mask: Optional[torch.Tensor] = None
+        if lengths is None:
+            lstm_out, _ = self.lstm(embedded)
+        elif not self.pack_sequences:
+            lstm_out = self.run_lstm_masked(embedded, lengths)
+            pad_mask = torch.arange(x.size(1), device=x.device).unsqueeze(0) >= lengths.unsqueeze(1)
+        else:
+            packed = nn.utils.rnn.pack_padded_sequence(
+                embedded, lengths.cpu(), batch_first=True, enforce_sorted=False
+            )
+            packed_out, _ = self.lstm(packed)
+            lstm_out, _ = nn.utils.rnn.pad_packed_sequence(
+                packed_out, batch_first=True, total_length=x.size(1)
+            )
+            pad_mask = torch.arange(x.size(1), device=x.device).unsqueeze(0) >= lengths.unsqueeze(1)
+            
+        return self.score_sequence(lstm_out, pad_mask)
+        
+    def directional_lstms(self):
+        """Forward and backward unidirectional LSTMs sharing self.lstm's weights.
+        
+        Kept in a plain tuple so they add nothing to the state dict.
+        """
+        if self.directional is None:
+            lstms = []
+            for suffix in ('_l0', '_l0_reverse'):
+                lstm = nn.LSTM(self.embedding_dim, self.hidden_dim, batch_first=True)
+                for name in ('weight_ih', 'weight_hh', 'bias_ih', 'bias_hh'):
+                    setattr(lstm, name + '_l0', getattr(self.lstm, name + suffix))
+                lstms.append(lstm)
+            self.directional = tuple(lstms)
+        return self.directional
+        
+    @torch.jit.unused
+    def run_lstm_masked(self, embedded, lengths):
+        # Traceable equivalent of the packed LSTM: the backward direction
+        # reads each row reversed within its own length, so pads never
+        # reach a real position. Pad outputs are zeroed as when unpacking.
+        forward_lstm, backward_lstm = self.directional_lstms()
+        steps = torch.arange(embedded.size(1), device=embedded.device).unsqueeze(0)
+        valid = steps < lengths.unsqueeze(1)
+        reverse_index = torch.where(valid, lengths.unsqueeze(1) - 1 - steps, steps)
+        
+        forward_out, _ = forward_lstm(embedded)
+        reversed_input = embedded.gather(1, reverse_index.unsqueeze(-1).expand_as(embedded))
+        backward_out, _ = backward_lstm(reversed_input)
+        backward_out = backward_out.gather(1, reverse_index.unsqueeze(-1).expand_as(backward_out))
+        
+        lstm_out = torch.cat([forward_out, backward_out], dim=-1)
+        return lstm_out.masked_fill(~valid.unsqueeze(-1), 0.0)
+        
+    def embed(self, x, offset: int = 0):
+        embedded = self.char_embedding(x)
+        return embedded + self.position_encoding[offset:offset + x.size(1)]
+        
+    def score_sequence(self, lstm_out, pad_mask: Optional[torch.Tensor] = None):
+        # Self-attention
+        attn_out, _ = self.attention(
+            lstm_out, lstm_out, lstm_out,
+            key_padding_mask=pad_mask,
+            need_weights=False
+        )
+        return self.pool_and_score(lstm_out, attn_out, pad_mask)
+        
+    def pool_and_score(self, lstm_out, attn_out, pad_mask: Optional[torch.Tensor] = None):
+        # Combine outputs
+        combined = torch.cat([lstm_out, attn_out], dim=-1)
+        if pad_mask is None:
+            pooled = torch.cat([combined.mean(dim=1), combined.amax(dim=1)], dim=-1)
+        else:
+            # Pool over real characters only
+            valid = (~pad_mask).unsqueeze(-1)
+            counts = valid.sum(dim=1).clamp(min=1)
+            mean = combined.masked_fill(~valid, 0.0).sum(dim=1) / counts
+            peak = combined.masked_fill(~valid, float('-inf')).amax(dim=1)
+            pooled = torch.cat([mean, peak], dim=-1)
+        
+        # Get outputs
+        strength = self.strength_net(pooled)
+        patterns = self.pattern_net(pooled)
+        complexity = self.complexity_net(pooled)
+        
+        return strength, patterns, complexity
+
+class ModelTelemetry:
+    """Inference statistics sampled from a QuantumBrain through forward hooks.
+    
+    Hooks on the embedding, LSTM, attention and output heads see every
+    call, but only every sample_every-th call is measured; on the others
+    each hook returns after a flag check. Hooks of a measured call only
+    keep references to its tensors, and the statistics are computed once
+    the last head has run, after the call's latency was taken. Each
+    measured call appends one dict of METRICS to a bounded deque, which
+    readers on other threads poll with samples_since(). Metrics a call did
+    not reach keep their previous value.
+    
+    KeystrokeSession steps its own LSTM cell and runs attention outside
+    nn.MultiheadAttention, so its cell is hooked through watch_session()
+    and it hands its attention to observe_attention(). Backends running a
+    scripted, quantized, compiled or exported copy of the model are not
+    measured; a compiled graph is traced without the hooks, so in compile
+    mode they are not attached at all.
+    """
+    METRICS = (
+        'inference_ms',
+        'layer_sparsity',
+        'attention_entropy',
+        'neuron_saturation',
+        'neural_strength',
+        'activation_patterns',
+        'forget_gate_values',
+        'input_gate_values',
+        'output_gate_values',
+        'cell_states'
+    )
+    
+    # LSTM outputs past this magnitude count as saturated
+    SATURATION_THRESHOLD = 0.9
+    
+    def __init__(self, model, sample_every=10, maxlen=1000):
+        self.model = model
+        self.sample_every = max(1, sample_every)
+        self.samples = deque(maxlen=maxlen)
+        self.lock = threading.Lock()
+        self.handles = []
+        self.sessions = weakref.WeakSet()
+        
+        self.calls = 0
+        self.published = 0
+        self.sampling = False
+        self.started = 0.0
+        self.observed = {}
+        self.last_sample = dict.fromkeys(self.METRICS, 0.0)
+        
+    def attach(self):
+        """Register the hooks; detach() removes them"""
+        self.detach()
+        model = self.model
+        self.handles = [
+            model.char_embedding.register_forward_pre_hook(self.begin_call),
+            model.lstm.register_forward_hook(self.observe_lstm),
+            model.attention.register_forward_hook(self.observe_attention_module, with_kwargs=True),
+            model.strength_net.register_forward_hook(self.observe_strength),
+            model.pattern_net.register_forward_hook(self.observe_patterns),
+            model.complexity_net.register_forward_hook(self.end_call)
+        ]
+        for head in (model.strength_net, model.pattern_net, model.complexity_net):
+            self.handles += [
+                layer.register_forward_hook(self.observe_relu)
+                for layer in head if isinstance(layer, nn.ReLU)
+            ]
+        for session in self.sessions:
+            self.handles.append(session.cell.register_forward_hook(self.observe_cell))
+        return self
+        
+    def detach(self):
+        for handle in self.handles:
+            handle.remove()
+        self.handles = []
+        
+    def watch_session(self, session):
+        """Measure a KeystrokeSession's forward cell, which is not part of the model"""
+        self.sessions.add(session)
+        if self.handles:
+            self.handles.append(session.cell.register_forward_hook(self.observe_cell))
+            
+    def samples_since(self, seen=0):
+        """Published sample count, and the samples published after the first seen ones.
+        
+        Samples that already dropped out of the buffer are skipped.
+        """
+        with self.lock:
+            missing = min(self.published - seen, len(self.samples))
+            if missing <= 0:
+                return self.published, []
+            start = len(self.samples) - missing
+            return self.published, list(itertools.islice(self.samples, start, None))
+            
+    def begin_call(self, module, args):
+        # Every model call starts by embedding its tokens
+        self.calls += 1
+        self.sampling = self.calls % self.sample_every == 0
+        self.observed = {}
+        if self.sampling:
+            self.started = time.perf_counter()
+            
+    def observe_lstm(self, module, args, output):
+        if self.sampling:
+            self.observed['lstm'] = (args[0], output[0], output[1][1])
+            
+    def observe_cell(self, module, args, output):
+        if self.sampling:
+            hx = args[1] if len(args) > 1 else None
+            self.observed.setdefault('cells', []).append((module, args[0], hx, output))
+            
+    def observe_attention_module(self, module, args, kwargs, output):
+        if self.sampling:
+            query = args[0] if args else kwargs['query']
+            self.observed['attention_input'] = (module, query, kwargs.get('key_padding_mask'))
+            
+    def observe_attention(self, q, k, pad_mask=None):
+        """Record per-head queries and keys, [batch, heads, seq, head_dim], of a sampled call"""
+        if self.sampling:
+            self.observed['attention'] = (q, k, pad_mask)
+            
+    def observe_relu(self, module, args, output):
+        if self.sampling:
+            self.observed.setdefault('relu', []).append(output)
+            
+    def observe_strength(self, module, args, output):
+        if self.sampling:
+            self.observed['strength'] = output
+            
+    def observe_patterns(self, module, args, output):
+        if self.sampling:
+            self.observed['patterns'] = output
+            
+    def end_call(self, module, args, output):
+        # The complexity head runs last in every path
+        if not self.sampling:
+            return
+        elapsed = time.perf_counter() - self.started
+        self.sampling = False
+        observed, self.observed = self.observed, {}
+        
+        totals = {}
+        try:
+            with torch.no_grad():
+                self.measure(observed, totals)
+        except Exception as e:
+            print(f"⚠️ Telemetry sample dropped: {e}")
+            return
+            
+        sample = dict(self.last_sample)
+        sample['inference_ms'] = elapsed * 1000
+        for name, (total, count) in totals.items():
+            if count:
+                sample[name] = total / count
+        with self.lock:
+            self.samples.append(sample)
+            self.published += 1
+        self.last_sample = sample
+        
+    def measure(self, observed, totals):
+        def add(name, values):
+            total, count = totals.get(name, (0.0, 0))
+            totals[name] = (total + values.float().sum().item(), count + values.numel())
+            
+        def add_gates(x, h_prev, weight_ih, weight_hh, bias_ih, bias_hh):
+            # PyTorch orders the LSTM gates input, forget, cell, output
+            gates = F.linear(x, weight_ih, bias_ih) + F.linear(h_prev, weight_hh, bias_hh)
+            input_gate, forget_gate, _, output_gate = gates.sigmoid().chunk(4, dim=-1)
+            add('input_gate_values', input_gate)
+            add('forget_gate_values', forget_gate)
+            add('output_gate_values', output_gate)
+            
+        if 'lstm' in observed:
+            x, lstm_out, cell = observed['lstm']
+            lengths = None
+            if isinstance(lstm_out, nn.utils.rnn.PackedSequence):
+                lstm_out, lengths = nn.utils.rnn.pad_packed_sequence(lstm_out, batch_first=True)
+                x, _ = nn.utils.rnn.pad_packed_sequence(x, batch_first=True)
+            valid = torch.ones(lstm_out.shape[:2], dtype=torch.bool)
+            if lengths is not None:
+                valid = torch.arange(lstm_out.size(1)).unsqueeze(0) < lengths.unsqueeze(1)
+                
+            # Forward-direction gates, each step fed the previous step's output
+            lstm = self.model.lstm
+            hidden = lstm_out[..., :lstm.hidden_size]
+            h_prev = F.pad(hidden[:, :-1], (0, 0, 1, 0))
+            add_gates(x[valid], h_prev[valid], lstm.weight_ih_l0, lstm.weight_hh_l0,
+                      lstm.bias_ih_l0, lstm.bias_hh_l0)
+            add('neuron_saturation', lstm_out[valid].abs() > self.SATURATION_THRESHOLD)
+            add('cell_states', cell.tanh().abs())
+            
+        for cell, x, hx, (h, c) in observed.get('cells', ()):
+            h_prev = hx[0] if hx is not None else torch.zeros_like(h)
+            add_gates(x, h_prev, cell.weight_ih, cell.weight_hh, cell.bias_ih, cell.bias_hh)
+            add('neuron_saturation', h.abs() > self.SATURATION_THRESHOLD)
+            add('cell_states', c.tanh().abs())
+            
+        if 'attention_input' in observed:
+            attention, query, pad_mask = observed['attention_input']
+            batch, length, _ = query.shape
+            q, k, _ = F.linear(query, attention.in_proj_weight, attention.in_proj_bias).chunk(3, dim=-1)
+            q = q.view(batch, length, attention.num_heads, attention.head_dim).transpose(1, 2)
+            k = k.view(batch, length, attention.num_heads, attention.head_dim).transpose(1, 2)
+            observed['attention'] = (q, k, pad_mask)
+            
+        if 'attention' in observed:
+            q, k, pad_mask = observed['attention']
+            scores = q @ k.transpose(-2, -1) / math.sqrt(q.size(-1))
+            if pad_mask is not None:
+                scores = scores.masked_fill(pad_mask[:, None, None, :], float('-inf'))
+            weights = scores.softmax(dim=-1)
+            entropy = -(weights * weights.clamp_min(1e-12).log()).sum(dim=-1)
+            
+            # Scale by the entropy of uniform attention over each row's keys
+            keys = torch.full((q.size(0),), q.size(2)) if pad_mask is None else (~pad_mask).sum(dim=1)
+            entropy = entropy / keys.clamp_min(2).float().log()[:, None, None]
+            if pad_mask is not None:
+                # Pad queries are not part of any password
+                entropy = entropy.transpose(1, 2)[~pad_mask]
+            add('attention_entropy', entropy)
+            
+        for output in observed.get('relu', ()):
+            add('layer_sparsity', output == 0)
+        if 'strength' in observed:
+            add('neural_strength', observed['strength'])
+        if 'patterns' in observed:
+            add('activation_patterns', observed['patterns'].sigmoid())
+
+class AnalysisCache:
+    """Bounded LRU cache of analysis results.
+    
+    Entries are keyed by a keyed BLAKE2 hash of the password, so the cache
+    never holds plaintext. The key is random per process.
+    """
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self.secret = os.urandom(32)
+        self.entries = OrderedDict()
+        
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+    def key(self, password):
+        return hashlib.blake2b(
+            password.encode('utf-8', 'surrogatepass'),
+            key=self.secret,
+            digest_size=16
+        ).digest()
+        
+    def get(self, password):
+        key = self.key(password)
+        result = self.entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+            
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return self.copy_result(result)
+        
+    def put(self, password, result):
+        key = self.key(password)
+        self.entries[key] = self.copy_result(result)
+        self.entries.move_to_end(key)
+        
+        # Evict least recently used entries
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+            
+    def clear(self):
+        self.entries.clear()
+        
+    def stats(self):
+        return {
+            'size': len(self.entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+        
+    @staticmethod
+    def copy_result(result):
+        # Callers mutate result dicts, so never hand out the cached one
+        return {key: list(value) if isinstance(value, list) else value
+                for key, value in result.items()}
+
+class PasswordFeatures:
+    """Character statistics shared by the heuristic scorers and widgets.
+    
+    Computed in one pass per password. Only counts and flags are kept,
+    never the characters, so features can sit in cached results.
+    """
+    __slots__ = (
+        'length', 'unique', 'max_count', 'upper_count',
+        'has_lower', 'has_upper', 'has_digit', 'has_special',
+        'entropy_per_char'
+    )
+    
+    def __init__(self, password):
+        counts = Counter(password)
+        self.length = len(password)
+        self.unique = len(counts)
+        self.max_count = max(counts.values(), default=0)
+        self.upper_count = 0
+        self.has_lower = self.has_upper = self.has_digit = self.has_special = False
+        
+        # Character classes and Shannon entropy from the distinct characters
+        entropy = 0.0
+        for char, count in counts.items():
+            if char.islower():
+                self.has_lower = True
+            elif char.isupper():
+                self.has_upper = True
+                self.upper_count += count
+            if char.isdigit():
+                self.has_digit = True
+            elif not char.isalnum():
+                self.has_special = True
+            prob = count / self.length
+            entropy -= prob * math.log2(prob)
+        self.entropy_per_char = entropy
+        
+    @property
+    def entropy(self):
+        return self.entropy_per_char * self.length
+        
+    @property
+    def char_types(self):
+        return self.has_lower + self.has_upper + self.has_digit + self.has_special
+        
+    @property
+    def variety_ratio(self):
+        return self.unique / self.length if self.length else 0
+
+class PhraseMatcher:
+    """Aho-Corasick automaton over known phrases, matched case-insensitively.
+    
+    One pass over a password finds every phrase in it, at a cost of
+    O(len(password) + matches) however many phrases are loaded.
+    """
+    def __init__(self):
+        # Phrase and kind by id
+        self.phrases = []
+        
+        # Trie as flat tables: (state, char) -> state, plus per-state
+        # parent and depth for the breadth-first failure pass
+        self.goto = {}
+        self.parent = [(0, '')]
+        self.depth = [0]
+        
+        # Phrase ids ending at each terminal state
+        self.output = {}
+        
+        # Failure links and the nearest terminal state on each failure chain
+        self.fail = [0]
+        self.output_link = [0]
+        self.built = True
+        
+    def __len__(self):
+        return len(self.phrases)
+        
+    def add(self, phrase, kind):
+        state = 0
+        for char in phrase.lower():
+            next_state = self.goto.get((state, char))
+            if next_state is None:
+                next_state = len(self.parent)
+                self.goto[(state, char)] = next_state
+                self.parent.append((state, char))
+                self.depth.append(self.depth[state] + 1)
+            state = next_state
+            
+        if not state:
+            return False
+            
+        # One entry per phrase and kind
+        ids = self.output.setdefault(state, [])
+        if any(self.phrases[i][1] == kind for i in ids):
+            return False
+        ids.append(len(self.phrases))
+        self.phrases.append((phrase, kind))
+        self.built = False
+        return True
+        
+    def add_all(self, phrases, kind):
+        return sum(self.add(phrase, kind) for phrase in phrases)
+        
+    def build(self):
+        count = len(self.parent)
+        self.fail = [0] * count
+        self.output_link = [0] * count
+        
+        # Parents before children, so a state's failure link is ready
+        # before its children need it
+        for state in sorted(range(1, count), key=self.depth.__getitem__):
+            parent, char = self.parent[state]
+            if parent:
+                fallback = self.fail[parent]
+                while fallback and (fallback, char) not in self.goto:
+                    fallback = self.fail[fallback]
+                self.fail[state] = self.goto.get((fallback, char), 0)
+                
+            fail = self.fail[state]
+            self.output_link[state] = fail if fail in self.output else self.output_link[fail]
+        self.built = True
+        
+    def match(self, text):
+        """Return every phrase occurrence as a dict with phrase, kind, start and end"""
+        if not self.built:
+            self.build()
+            
+        goto, fail, output, output_link = self.goto, self.fail, self.output, self.output_link
+        matches = []
+        state = 0
+        for end, char in enumerate(text, 1):
+            for folded in char.lower():
+                while state and (state, folded) not in goto:
+                    state = fail[state]
+                state = goto.get((state, folded), 0)
+                
+                hit = state if state in output else output_link[state]
+                while hit:
+                    for i in output[hit]:
+                        phrase, kind = self.phrases[i]
+                        matches.append({
+                            'phrase': phrase,
+                            'kind': kind,
+                            'start': end - len(phrase),
+                            'end': end
+                        })
+                    hit = output_link[hit]
+        return matches
+
+class KeystrokeSession:
+    """Incremental analysis of a password as it is typed.
+    
+    The forward LSTM direction only depends on earlier characters, so its
+    per-step state, and its half of the attention input projection, are
+    kept for the unchanged prefix and only new characters are stepped.
+    The backward direction and attention still span the whole password,
+    so a keystroke costs about half a full pass rather than a constant.
+    Runs on the fp32 model whatever the analyzer's inference mode.
+    Results carry the head-averaged attention weights as attention_map.
+    """
+    def __init__(self, analyzer):
+        self.analyzer = analyzer
+        model = analyzer.model
+        
+        # Forward-direction cell sharing the model's LSTM weights
+        self.cell = nn.LSTMCell(model.embedding_dim, model.hidden_dim)
+        self.cell.weight_ih = model.lstm.weight_ih_l0
+        self.cell.weight_hh = model.lstm.weight_hh_l0
+        self.cell.bias_ih = model.lstm.bias_ih_l0
+        self.cell.bias_hh = model.lstm.bias_hh_l0
+        if analyzer.telemetry is not None:
+            analyzer.telemetry.watch_session(self)
+        self.reset()
+        
+    def reset(self):
+        self.model_version = self.analyzer.model_version
+        self.tokens = np.zeros(0, dtype=np.int64)
+        
+        # Per step: embedded input, (h, c) state and the forward half of
+        # the attention input projection
+        self.embedded = []
+        self.states = []
+        self.projected = []
+        
+    def analyze(self, password):
+        analyzer = self.analyzer
+        if not password or password.isspace():
+            return analyzer.empty_analysis()
+            
+        # Batch analyses are cached without an attention map
+        cached = analyzer.cache.get(password) if analyzer.cache is not None else None
+        if cached is not None and 'attention_map' in cached:
+            return cached
+            
+        neural_strength, pattern_logits, attention_map = self.run(password)
+        result = analyzer.build_analysis(
+            password,
+            neural_strength=neural_strength * 100,
+            pattern_logits=pattern_logits
+        )
+        result['attention_map'] = attention_map
+        if analyzer.cache is not None:
+            analyzer.cache.put(password, result)
+        return result
+        
+    def run(self, password):
+        model = self.analyzer.model
+        if self.model_version != self.analyzer.model_version:
+            self.reset()
+            
+        tokens, _ = self.analyzer.encode([password])
+        tokens = tokens[0]
+        
+        # Keep the steps of the common prefix; anything after an edit is
+        # recomputed
+        shared = min(len(tokens), len(self.tokens))
+        changed = np.flatnonzero(tokens[:shared] != self.tokens[:shared])
+        keep = int(changed[0]) if len(changed) else shared
+        del self.embedded[keep:], self.states[keep:], self.projected[keep:]
+        self.tokens = tokens
+        
+        attention = model.attention
+        in_proj_forward = attention.in_proj_weight[:, :model.hidden_dim]
+        in_proj_backward = attention.in_proj_weight[:, model.hidden_dim:]
+        
+        with torch.no_grad():
+            # Step the forward direction over new characters only
+            embedded = model.embed(torch.from_numpy(tokens[keep:]).unsqueeze(0), keep)
+            state = self.states[-1] if self.states else None
+            for step in range(embedded.size(1)):
+                step_input = embedded[:, step]
+                state = self.cell(step_input, state)
+                self.embedded.append(step_input)
+                self.states.append(state)
+                self.projected.append(F.linear(state[0], in_proj_forward, attention.in_proj_bias))
+                
+            # The backward direction depends on every later character
+            _, backward_lstm = model.directional_lstms()
+            backward_out, _ = backward_lstm(torch.stack(self.embedded, dim=1).flip(1))
+            backward_out = backward_out.flip(1)
+            forward_out = torch.stack([h for h, _ in self.states], dim=1)
+            lstm_out = torch.cat([forward_out, backward_out], dim=-1)
+            
+            # Self-attention from the cached forward projection, as in
+            # nn.MultiheadAttention in eval mode. The softmax is explicit so
+            # the weights double as the attention map.
+            length = lstm_out.size(1)
+            head_dim = attention.head_dim
+            projected = torch.stack(self.projected, dim=1) + F.linear(backward_out, in_proj_backward)
+            q, k, v = projected.view(1, length, 3, attention.num_heads, head_dim).permute(2, 0, 3, 1, 4)
+            if self.analyzer.telemetry is not None:
+                self.analyzer.telemetry.observe_attention(q, k)
+            weights = (q @ k.transpose(-2, -1) / math.sqrt(head_dim)).softmax(dim=-1)
+            attn_out = weights @ v
+            attn_out = attention.out_proj(attn_out.transpose(1, 2).reshape(1, length, -1))
+            
+            strength, patterns, _ = model.pool_and_score(lstm_out, attn_out)
+            
+        return strength[0, 0].item(), patterns[0].numpy(), weights[0].mean(dim=0).numpy()
+
+class PasswordAnalyzer:
+    # Supported ways of running QuantumBrain for inference
+    INFERENCE_MODES = ('eager', 'script', 'compile', 'quantized', 'onnx')
+    
+    # Largest final strength drift (in strength points) the int8 profile may
+    # show against fp32 on REFERENCE_PASSWORDS
+    QUANTIZED_STRENGTH_TOLERANCE = 1.0
+    
+    # Largest raw output difference allowed between ONNX and torch
+    ONNX_PARITY_TOLERANCE = 1e-4
+    
+    # Fixed password set used to check alternative inference profiles
+    REFERENCE_PASSWORDS = [
+        "password", "123456", "qwerty", "letmein", "hunter2", "abc123",
+        "Tr0ub4dor&3", "correct horse battery staple", "P@ssw0rd!",
+        "Zx9$kP2@vL7#qW4!", "IAmIronMan", "MayTheForceBeWithYou_2024!",
+        "aaaaaaaa", "q", "WithGreatPowerComesGreatResponsibility#1",
+        "n3ur4l_qu4ntum_c1ph3r", "2024-01-01", "ThisIsTheWay$$77"
+    ]
+    
+    def __init__(self, model_path='quantum_model_best.pth', cache_size=0, inference_mode='eager',
+                 wordlist_path=None):
+        if inference_mode not in self.INFERENCE_MODES:
+            raise ValueError(f"Unknown inference mode: {inference_mode}")
+            
+        self.tokenizer = PasswordTokenizer()
+        self.model = QuantumBrain(
+            vocab_size=self.tokenizer.vocab_size,
+            embedding_dim=256,
+            hidden_dim=256,
+            max_length=32
+        )
+        
+        # Optional result cache (disabled when cache_size is 0)
+        self.cache = AnalysisCache(cache_size) if cache_size else None
+        
+        # Model actually called for inference (eager, scripted, compiled or
+        # quantized). The ONNX backend replaces it when its session is set.
+        self.inference_mode = inference_mode
+        self.inference_model = self.model
+        self.onnx_session = None
+        
+        # Bumped on every load so keystroke sessions drop stale LSTM states
+        self.model_version = 0
+        
+        # Optional ModelTelemetry, see enable_telemetry()
+        self.telemetry = None
+        
+        # Analysis components
+        self.pattern_types = [
+            'sequential', 'repeated', 'keyboard', 'common',
+            'dictionary', 'personal', 'leetspeak', 'random',
+            'date', 'name', 'word', 'phrase', 'number',
+            'symbol', 'mixed', 'complex'
+        ]
+        
+        self.complexity_levels = [
+            'basic', 'medium', 'advanced', 'quantum'
+        ]
+        
+        # Movie quotes and references for recognition
+        self.movie_quotes = [
+            "IAmIronMan", "AvengersAssemble", "WakandaForever",
+            "WithGreatPowerComesGreatResponsibility", "IAmBatman",
+            "MayTheForceBeWithYou", "YouShallNotPass", "HereIsJohnny",
+            "ThisIsTheWay", "IAmYourFather", "IllBeBack",
+            "HastaLaVistaBaby", "YippeeKiYay", "TheMatrixHasYou",
+            "ForFrodo", "PerfectlyBalanced", "ThanosDemandsSilence",
+            "OnYourLeft", "ICanDoThisAllDay", "GrootIsGroot",
+            "TonyStarkBuiltThisInACave", "ImAlwaysAngry",
+            "HulkSmash", "WebHead", "UseTheForce", "JediMaster"
+        ]
+        
+        # One automaton over every known quote, plus an optional wordlist
+        self.phrase_matcher = PhraseMatcher()
+        self.phrase_matcher.add_all(self.movie_quotes, 'quote')
+        for quotes in QuantumGenerator().epic_quotes.values():
+            self.phrase_matcher.add_all(quotes, 'quote')
+        if wordlist_path:
+            self.load_wordlist(wordlist_path)
+            
+        self.load_model(model_path)
+        
+    def load_model(self, model_path):
+        # Try to load pretrained model
+        self.checkpoint_loaded = False
+        try:
+            checkpoint = torch.load(model_path, map_location=torch.device('cpu'))
+            self.model.load_state_dict(checkpoint['model_state_dict'])
+            self.checkpoint_loaded = True
+            print(f"Loaded pretrained model from {model_path}")
+        except Exception as e:
+            print(f"Using default initialization: {e}")
+            
+        self.model.eval()
+        self.model_path = model_path
+        self.prepare_inference()
+        self.update_telemetry_hooks()
+        
+        # Cached results came from the previous weights
+        self.invalidate_cache()
+        self.model_version += 1
+        
+    def prepare_inference(self):
+        """Build the inference model for the selected mode, falling back to eager"""
+        self.inference_model = self.model
+        self.onnx_session = None
+        if self.inference_mode == 'eager':
+            return
+            
+        try:
+            if self.inference_mode == 'script':
+                self.inference_model = self.load_scripted_model()
+            elif self.inference_mode == 'compile':
+                self.inference_model = self.compile_model()
+            elif self.inference_mode == 'quantized':
+                quantized = self.quantize_model()
+                report = self.compare_profiles(quantized, runs=0)
+                if not report['within_tolerance']:
+                    raise ValueError(
+                        f"strength drift {report['max_strength_delta']:.2f} exceeds "
+                        f"tolerance {self.QUANTIZED_STRENGTH_TOLERANCE}"
+                    )
+                self.inference_model = quantized
+            elif self.inference_mode == 'onnx':
+                session = self.load_onnx_session()
+                parity = self.verify_onnx_parity(session)
+                if not parity['within_tolerance']:
+                    raise ValueError(f"ONNX outputs differ from torch: {parity}")
+                self.onnx_session = session
+        except Exception as e:
+            print(f"{self.inference_mode} inference unavailable, using eager mode: {e}")
+            self.inference_model = self.model
+            
+    def enable_telemetry(self, sample_every=10, maxlen=1000):
+        """Start sampling inference statistics from the fp32 model.
+        
+        Keystroke sessions started afterwards are measured too. Nothing is
+        measured while a compiled model is in use. Returns the
+        ModelTelemetry, whose samples_since() feeds metric widgets.
+        """
+        if self.telemetry is None:
+            self.telemetry = ModelTelemetry(self.model, sample_every, maxlen)
+            self.update_telemetry_hooks()
+        return self.telemetry
+        
+    def update_telemetry_hooks(self):
+        # A compiled graph was traced without the hooks and never runs them
+        if self.telemetry is None:
+            return
+        if self.inference_mode == 'compile' and self.inference_model is not self.model:
+            self.telemetry.detach()
+        else:
+            self.telemetry.attach()
+            
+    @contextlib.contextmanager
+    def telemetry_detached(self):
+        # Python hooks cannot be scripted, deep-copied, compiled or exported
+        # with the model
+        telemetry = self.telemetry
+        attached = telemetry is not None and bool(telemetry.handles)
+        if attached:
+            telemetry.detach()
+        try:
+            yield
+        finally:
+            if attached:
+                telemetry.attach()
+                
+    def artifact_path(self, suffix):
+        # Compiled artifacts live next to the checkpoint they were built from
+        return os.path.splitext(self.model_path)[0] + suffix
+        
+    def load_scripted_model(self):
+        path = self.artifact_path('.scripted.pt')
+        
+        # Only reuse an artifact built from the current checkpoint. Randomly
+        # initialized weights are never cached on disk.
+        if (self.checkpoint_loaded and os.path.exists(path)
+                and os.path.getmtime(path) >= os.path.getmtime(self.model_path)):
+            scripted = torch.jit.load(path, map_location=torch.device('cpu'))
+            
+            # Artifacts scripted before forward took lengths are stale
+            if 'lengths' in [arg.name for arg in scripted.forward.schema.arguments]:
+                print(f"Loaded scripted model from {path}")
+                return scripted
+                
+        with self.telemetry_detached():
+            scripted = torch.jit.optimize_for_inference(torch.jit.freeze(torch.jit.script(self.model)))
+        if self.checkpoint_loaded:
+            try:
+                torch.jit.save(scripted, path)
+            except Exception as e:
+                print(f"Could not cache scripted model: {e}")
+        return scripted
+        
+    def export_onnx(self, path=None):
+        """Export all three heads to ONNX with a dynamic batch axis.
+        
+        The exporters cannot trace packed sequences or a dynamic sequence
+        axis, so the graph takes full-width tokens plus lengths and masks
+        the pads instead of skipping them. Writes to path when given and returns the serialized model bytes.
+        """
+        # Trace with two rows; exporters may specialize a batch of one
+        buffer = io.BytesIO()
+        self.model.pack_sequences = False
+        try:
+            with self.telemetry_detached():
+                torch.onnx.export(
+                    self.model,
+                    (
+                        self.tokenizer.tokenize_batch(['export', 'onnx'], self.model.max_length),
+                        torch.tensor([6, 4])
+                    ),
+                    buffer,
+                    input_names=['tokens', 'lengths'],
+                    output_names=['strength', 'patterns', 'complexity'],
+                    dynamic_axes={
+                        'tokens': {0: 'batch'},
+                        'lengths': {0: 'batch'},
+                        'strength': {0: 'batch'},
+                        'patterns': {0: 'batch'},
+                        'complexity': {0: 'batch'}
+                    },
+                    opset_version=17
+                )
+        finally:
+            self.model.pack_sequences = True
+        model_bytes = buffer.getvalue()
+        
+        if path is not None:
+            with open(path, 'wb') as f:
+                f.write(model_bytes)
+        return model_bytes
+        
+    def load_onnx_session(self):
+        if onnxruntime is None:
+            raise ImportError("onnxruntime is not installed")
+            
+        # Same artifact reuse rules as the scripted model
+        path = self.artifact_path('.onnx')
+        if (self.checkpoint_loaded and os.path.exists(path)
+                and os.path.getmtime(path) >= os.path.getmtime(self.model_path)):
+            session = onnxruntime.InferenceSession(path, providers=['CPUExecutionProvider'])
+            
+            # Artifacts exported before lengths became an input are stale
+            if [node.name for node in session.get_inputs()] == ['tokens', 'lengths']:
+                print(f"Loaded ONNX model from {path}")
+                return session
+                
+        model = self.export_onnx()
+        if self.checkpoint_loaded:
+            try:
+                with open(path, 'wb') as f:
+                    f.write(model)
+            except Exception as e:
+                print(f"Could not cache ONNX model: {e}")
+                
+        return onnxruntime.InferenceSession(model, providers=['CPUExecutionProvider'])
+        
+    def verify_onnx_parity(self, session=None, reference=None):
+        """Compare raw ONNX Runtime outputs with the torch model on a reference set"""
+        if session is None:
+            session = self.onnx_session or self.load_onnx_session()
+        tokens, lengths = self.encode(list(reference or self.REFERENCE_PASSWORDS))
+        
+        onnx_outputs = self.run_onnx(session, tokens, lengths)
+        with torch.no_grad():
+            torch_outputs = self.model(torch.from_numpy(tokens), torch.from_numpy(lengths))
+            
+        parity = {
+            name: float(np.abs(onnx_out - torch_out.numpy()).max())
+            for name, onnx_out, torch_out in zip(
+                ('strength', 'patterns', 'complexity'), onnx_outputs, torch_outputs
+            )
+        }
+        parity['within_tolerance'] = max(parity.values()) <= self.ONNX_PARITY_TOLERANCE
+        return parity
+        
+    def compile_model(self):
+        # Inductor caches kernels in TORCHINDUCTOR_CACHE_DIR. That setting is
+        # process-wide, so applications choose it at startup instead of
+        # each analyzer pointing it at its own checkpoint.
+        compiled = torch.compile(self.model, dynamic=True)
+        
+        # Compilation is lazy; warm up now so failures surface here and
+        # the first keystroke does not pay for it
+        with torch.no_grad(), self.telemetry_detached():
+            tokens, lengths = self.encode(['warmup', 'warm'])
+            compiled(torch.from_numpy(tokens), torch.from_numpy(lengths))
+        return compiled
+        
+    def load_wordlist(self, path, min_length=4):
+        """Add a newline-separated common-password list to the phrase matcher.
+        
+        Words shorter than min_length are skipped; they would match inside
+        almost every password. Returns the number of words added.
+        """
+        with open(path, encoding='utf-8', errors='ignore') as f:
+            words = [line.strip() for line in f]
+        added = self.phrase_matcher.add_all(
+            (word for word in words if len(word) >= min_length), 'wordlist'
+        )
+        self.phrase_matcher.build()
+        
+        # Cached results were scored without these words
+        self.invalidate_cache()
+        print(f"Loaded {added} words from {path}")
+        return added
+        
+    def match_phrases(self, password):
+        return self.phrase_matcher.match(password)
+        
+    def invalidate_cache(self):
+        if self.cache is not None:
+            self.cache.clear()
+            
+    def cache_stats(self):
+        return self.cache.stats() if self.cache is not None else None
+        
+    def quantize_model(self):
+        # Dynamic int8 weights for the LSTM and Linear layers; activations stay fp32
+        with self.telemetry_detached():
+            model = copy.deepcopy(self.model)
+        return torch.ao.quantization.quantize_dynamic(
+            model,
+            {nn.LSTM, nn.Linear},
+            dtype=torch.qint8
+        )
+        
+    def compare_profiles(self, candidate=None, reference=None, runs=20):
+        """Report size, latency and strength drift of an inference model against fp32"""
+        if candidate is None:
+            candidate = self.quantize_model()
+        reference = list(reference or self.REFERENCE_PASSWORDS)
+        tokens, lengths = self.encode(reference)
+        tokens, lengths = torch.from_numpy(tokens), torch.from_numpy(lengths)
+        
+        def model_size_mb(model):
+            buffer = io.BytesIO()
+            torch.save(model.state_dict(), buffer)
+            return buffer.getbuffer().nbytes / 1e6
+            
+        def latency_ms(model):
+            # Per-password latency with batch size 1, as in keystroke analysis
+            if not runs:
+                return None
+            with torch.no_grad():
+                start = time.perf_counter()
+                for _ in range(runs):
+                    for row, length in zip(tokens, lengths):
+                        model(row[:length].unsqueeze(0))
+            return (time.perf_counter() - start) * 1000 / (runs * len(reference))
+            
+        def final_strengths(model):
+            with torch.no_grad():
+                strength, patterns, _ = model(tokens, lengths)
+            return [
+                self.build_analysis(password, strength[i].item() * 100, patterns[i])['strength']
+                for i, password in enumerate(reference)
+            ]
+            
+        drift = max(
+            abs(a - b) for a, b in zip(final_strengths(self.model), final_strengths(candidate))
+        )
+        return {
+            'fp32_size_mb': model_size_mb(self.model),
+            'candidate_size_mb': model_size_mb(candidate),
+            'fp32_latency_ms': latency_ms(self.model),
+            'candidate_latency_ms': latency_ms(candidate),
+            'max_strength_delta': drift,
+            'tolerance': self.QUANTIZED_STRENGTH_TOLERANCE,
+            'within_tolerance': drift <= self.QUANTIZED_STRENGTH_TOLERANCE
+        }
+        
+    def analyze_password(self, password):
+        return self.analyze_passwords([password])[0]
+        
+    def session(self):
+        """Start a KeystrokeSession for analyzing text as it is typed"""
+        return KeystrokeSession(self)
+        
+    def analyze_passwords(self, passwords, batch_size=256):
+        """Analyze many passwords, running the model once per chunk of batch_size"""
+        passwords = list(passwords)
+        results = [None] * len(passwords)
+        
+        # Group by password so duplicates are analyzed once. Empty
+        # passwords never reach the model.
+        pending = {}
+        for i, password in enumerate(passwords):
+            if not password or password.isspace():
+                results[i] = self.empty_analysis()
+            elif password in pending:
+                pending[password].append(i)
+            else:
+                cached = self.cache.get(password) if self.cache is not None else None
+                if cached is not None:
+                    results[i] = cached
+                else:
+                    pending[password] = [i]
+                    
+        # Sort by length so each chunk is a length bucket padded only to
+        # its own longest password
+        unique = sorted(pending, key=len)
+        for start in range(0, len(unique), batch_size):
+            chunk = unique[start:start + batch_size]
+            neural_strengths, patterns = self.run_model(*self.encode(chunk))
+            
+            for row, password in enumerate(chunk):
+                result = self.build_analysis(
+                    password,
+                    neural_strength=neural_strengths[row] * 100,
+                    pattern_logits=patterns[row]
+                )
+                if self.cache is not None:
+                    self.cache.put(password, result)
+                    
+                indices = pending[password]
+                results[indices[0]] = result
+                for i in indices[1:]:
+                    results[i] = AnalysisCache.copy_result(result)
+                    
+        return results
+        
+    def encode(self, passwords):
+        """Tokenize passwords padded to the longest one, with their token counts"""
+        max_length = self.model.max_length
+        lengths = np.fromiter(
+            (min(len(password), max_length) for password in passwords),
+            dtype=np.int64, count=len(passwords)
+        )
+        width = max(int(lengths.max()), 1) if len(lengths) else 1
+        return self.tokenizer.encode_batch(passwords, width), lengths
+        
+    def run_model(self, tokens, lengths=None):
+        """Run the inference backend on an int64 token array.
+        
+        Returns the neural strengths as a list and the pattern logits as a
+        NumPy array, whichever backend is active.
+        """
+        # A bucket without padding does not need packing
+        if lengths is not None and (lengths == tokens.shape[1]).all():
+            lengths = None
+            
+        if self.onnx_session is not None:
+            strength, patterns, _ = self.run_onnx(self.onnx_session, tokens, lengths)
+            return strength[:, 0].tolist(), patterns
+            
+        with torch.no_grad():
+            strength, patterns, _ = self.inference_model(
+                torch.from_numpy(tokens),
+                None if lengths is None else torch.from_numpy(lengths)
+            )
+        return strength[:, 0].tolist(), patterns.numpy()
+        
+    def run_onnx(self, session, tokens, lengths=None):
+        # The exported graph has a fixed sequence width
+        if lengths is None:
+            lengths = np.full(len(tokens), tokens.shape[1], dtype=np.int64)
+        width = self.model.max_length
+        if tokens.shape[1] < width:
+            tokens = np.pad(tokens, ((0, 0), (0, width - tokens.shape[1])))
+        return session.run(None, {'tokens': tokens, 'lengths': lengths})
+        
+    def empty_analysis(self):
+        return {
+            'strength': 0,
+            'entropy': 0,
+            'patterns': [],
+            'complexity': 'basic',
+            'suggestions': ["Enter a password to analyze"],
+            'features': PasswordFeatures(''),
+            'attention_map': np.zeros((0, 0))
+        }
+        
+    def build_analysis(self, password, neural_strength, pattern_logits):
+        """Combine the model outputs for one password with the heuristic analyses"""
+        # Enhanced analysis; features and phrase matches are shared by
+        # every check
+        features = PasswordFeatures(password)
+        matches = self.match_phrases(password)
+        entropy = self.calculate_entropy(password, features)
+        pattern_analysis = self.analyze_patterns(password, matches, features)
+        movie_quote_strength = self.check_movie_quotes(password, matches)
+        
+        # Base strength calculation
+        base_strength = self.calculate_base_strength(password, features)
+        
+        # Combine all analyses
+        final_strength = self.combine_analyses(
+            base_strength=base_strength,
+            neural_strength=neural_strength,
+            entropy=entropy,
+            patterns=pattern_analysis,
+            movie_quote_strength=movie_quote_strength,
+            password_length=len(password)
+        )
+        
+        # For generated passwords with 100% target strength, ensure they get 100%
+        if self.is_perfect_password(password, matches, features, pattern_analysis):
+            final_strength = 100
+            
+        return {
+            'strength': final_strength,
+            'entropy': entropy,
+            'patterns': self.get_pattern_types(pattern_logits),
+            'complexity': self.get_complexity_level(final_strength),
+            'suggestions': self.generate_suggestions(final_strength, pattern_analysis, len(password)),
+            'features': features
+        }
+            
+    def is_perfect_password(self, password, matches=None, features=None, patterns=None):
+        """Check if password meets all criteria for 100% strength"""
+        if len(password) < 20:
+            return False
+            
+        # Check for all required character types
+        if features is None:
+            features = PasswordFeatures(password)
+        if features.char_types < 4:
+            return False
+            
+        # Check for movie quotes
+        if matches is None:
+            matches = self.match_phrases(password)
+        if not any(match['kind'] == 'quote' for match in matches):
+            return False
+            
+        # Check entropy
+        if self.calculate_entropy(password, features) < 4.0:
+            return False
+            
+        # Check for bad patterns
+        if patterns is None:
+            patterns = self.analyze_patterns(password, matches, features)
+        if any([patterns['sequential'], patterns['repeated'], 
+               patterns['keyboard'], patterns['common']]):
+            return False
+            
+        return True
+    
+    def calculate_base_strength(self, password, features=None):
+        """Calculate base strength from password characteristics"""
+        if features is None:
+            features = PasswordFeatures(password)
+        score = 0
+        length = features.length
+        
+        # Length score (up to 40 points)
+        if length >= 32:
+            score += 40
+        elif length >= 24:
+            score += 35
+        elif length >= 16:
+            score += 30
+        elif length >= 12:
+            score += 25
+        elif length >= 8:
+            score += 20
+        else:
+            # Even short passwords get some points
+            score += max(5, length * 2)
+        
+        # Character variety (up to 40 points)
+        variety_ratio = features.variety_ratio
+        
+        # More unique characters = better, but don't penalize long passwords
+        if variety_ratio >= 0.7:  # High variety
+            score += 40
+        elif variety_ratio >= 0.5:  # Good variety
+            score += 30
+        elif variety_ratio >= 0.3:  # Moderate variety
+            score += 20
+        else:  # Low variety but still give some points
+            score += 10
+        
+        # Character type bonuses (up to 20 points)
+        score += features.char_types * 5  # 5 points per character type
+        
+        return score
+    
+    def calculate_entropy(self, password, features=None):
+        if features is None:
+            features = PasswordFeatures(password)
+        return features.entropy
+    
+    def analyze_patterns(self, password, matches=None, features=None):
+        lower_pass = password.lower()
+        if features is None:
+            features = PasswordFeatures(password)
+        
+        # Calculate ratio of repeated characters
+        repeat_ratio = features.max_count / features.length if features.length else 0
+        
+        # Only consider it repeated if the ratio is high
+        is_repeated = repeat_ratio > 0.4  # 40% threshold
+        
+        # Only consider keyboard patterns if they make up most of the password
+        keyboard_match = re.search(r'(?:qwerty|asdfgh|zxcvbn|qazwsx|zxcvbn)', lower_pass)
+        is_keyboard = bool(keyboard_match and len(keyboard_match.group(0)) / len(password) > 0.5)
+        
+        # Only consider sequential patterns if they make up most of the password
+        seq_match = re.search(r'(?:abc|bcd|cde|def|123|234|345|456|567|678|789|012|qwe|wer|ert|rty|tyu|yui|uio|iop|asd|sdf|dfg|fgh|ghj|hjk|jkl|zxc|xcv|cvb|vbn|bnm)', lower_pass)
+        is_sequential = bool(seq_match and len(seq_match.group(0)) / len(password) > 0.5)
+        
+        # Common if it is a built-in weak password or a whole wordlist entry
+        if matches is None:
+            matches = self.match_phrases(password)
+        is_common = bool(re.search(r'^(?:password|admin|123456|qwerty|letmein|welcome|monkey|dragon|baseball|football|master|hello|shadow|superman|batman|trustno1)$', lower_pass))
+        is_common = is_common or any(
+            match['kind'] == 'wordlist' and match['end'] - match['start'] == len(password)
+            for match in matches
+        )
+        
+        return {
+            'sequential': is_sequential,
+            'repeated': is_repeated,
+            'keyboard': is_keyboard,
+            'common': is_common,
+            'leet': bool(re.search(r'[0-9@$!%*#?&]', password)),
+            'mixed_case': lower_pass != password and password.upper() != password,
+            'numbers_only': password.isdigit(),
+            'letters_only': password.isalpha(),
+            'ends_number': bool(re.search(r'\d+$', password)),
+            'simple_append': bool(re.search(r'^[A-Za-z]+[0-9]+[!@#$%^&*]*$', password))
+        }
+    
+    def check_movie_quotes(self, password, matches=None):
+        """Check for movie quotes and calculate bonus strength"""
+        if matches is None:
+            matches = self.match_phrases(password)
+        max_bonus = 0
+        for match in matches:
+            if match['kind'] == 'quote':
+                # Longer quotes give more bonus
+                bonus = min(30, len(match['phrase']) / 2)
+                max_bonus = max(max_bonus, bonus)
+        return max_bonus
+    
+    def combine_analyses(self, base_strength, neural_strength, entropy, patterns, movie_quote_strength, password_length):
+        # Start with base strength
+        strength = base_strength
+        
+        # Neural network contribution (20% weight to reduce its impact)
+        strength = (strength * 0.8) + (neural_strength * 0.2)
+        
+        # Entropy bonus (up to 20 points)
+        if entropy > 4.0:
+            strength += 20
+        elif entropy > 3.0:
+            strength += 15
+        elif entropy > 2.0:
+            strength += 10
+        elif entropy > 1.0:  # Even low entropy gets something
+            strength += 5
+        
+        # Pattern penalties (reduced and only apply to very weak patterns)
+        if patterns['common']:
+            strength *= 0.5  # Only penalize common passwords heavily
+        if patterns['numbers_only'] and password_length < 12:
+            strength *= 0.7  # Only penalize short number-only passwords
+        if patterns['letters_only'] and password_length < 12:
+            strength *= 0.8  # Only penalize short letter-only passwords
+            
+        # Complexity bonuses
+        if patterns['leet']:
+            strength *= 1.15  # 15% bonus
+        if patterns['mixed_case']:
+            strength *= 1.15  # 15% bonus
+            
+        # Movie quote bonus
+        strength += movie_quote_strength
+        
+        # Length bonuses (never penalties)
+        if password_length >= 20:
+            strength *= 1.2  # 20% bonus for long passwords
+        elif password_length >= 16:
+            strength *= 1.1  # 10% bonus for medium-long passwords
+            
+        # Ensure minimum strength based on length
+        min_strength = max(5, password_length * 2)  # Even short passwords get some points
+        
+        return max(min_strength, min(100, strength))
+    
+    def get_complexity_level(self, strength):
+        if strength >= 90:
+            return 'quantum'
+        elif strength >= 70:
+            return 'advanced'
+        elif strength >= 40:
+            return 'medium'
+        return 'basic'
+    
+    def get_pattern_types(self, pattern_logits):
+        patterns = []
+        probs = 1 / (1 + np.exp(-np.asarray(pattern_logits, dtype=np.float64)))
+        for i, prob in enumerate(probs):
+            if prob > 0.5 and i < len(self.pattern_types):
+                patterns.append(self.pattern_types[i])
+        return patterns
+    
+    def generate_suggestions(self, strength, patterns, length):
+        suggestions = []
+        
+        if length < 12:
+            suggestions.append("🔒 Increase password length (minimum 12 characters recommended)")
+        
+        if strength < 50:
+            suggestions.append("💪 Add special characters and numbers")
+            suggestions.append("🔠 Mix uppercase and lowercase letters")
+            
+        if patterns['sequential']:
+            suggestions.append("⚠️ Avoid sequential characters (abc, 123, etc.)")
+        if patterns['repeated']:
+            suggestions.append("⚠️ Avoid repeated characters")
+        if patterns['keyboard']:
+            suggestions.append("⚠️ Avoid keyboard patterns (qwerty, asdfgh)")
+        if patterns['common']:
+            suggestions.append("⚡ Use more unique combinations")
+            
+        if not patterns['leet']:
+            suggestions.append("🔧 Consider using leetspeak (replace letters with numbers/symbols)")
+            
+        if strength < 70:
+            suggestions.append("🎬 Try incorporating movie quotes or memorable phrases")
+            
+        if not suggestions:
+            suggestions.append("✨ Great password! Keep it safe!")
+            
         return suggestions 
\ No newline at end of file
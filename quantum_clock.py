@@ -0,0 +1,146 @@
+import weakref
+import shiboken6
+from PySide6.QtCore import QObject, QTimer, QElapsedTimer, QEvent, Qt
+
+# Longest step handed to a widget, so a stall does not fling particles
+MAX_DELTA_TIME = 0.25
+
+def frame_steps(delta_time, frame_rate):
+    """Frames elapsed at frame_rate; one frame when called outside the clock"""
+    return 1.0 if delta_time is None else delta_time * frame_rate
+
+class FrameClient:
+    def __init__(self, widget, callback, frame_rate, now):
+        self.widget = weakref.ref(widget)
+        
+        # Bound methods are held weakly too, or they would keep the widget alive
+        if getattr(callback, '__self__', None) is not None:
+            self.callback = weakref.WeakMethod(callback)
+        else:
+            self.callback = lambda: callback
+            
+        self.frame_rate = frame_rate
+        self.interval = 1.0 / frame_rate
+        self.active = False
+        self.resume(now)
+        
+    def resume(self, now):
+        # Start over from now instead of catching up on time spent hidden
+        self.last_time = now
+        self.next_time = now + self.interval
+
+class FrameScheduler(QObject):
+    """One animation clock shared by every widget.
+    
+    Widgets register a tick callback and a target frame rate. A single
+    precise timer runs at the fastest rate among visible widgets and calls
+    each callback when it is due, with the real time since its previous
+    tick. Repaints requested during a tick are painted together in one pass.
+    
+    Widgets in hidden tabs or minimized windows are paused, and the timer
+    stops while nothing animated is visible.
+    """
+    WATCHED_EVENTS = (QEvent.Type.Show, QEvent.Type.Hide, QEvent.Type.WindowStateChange)
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+        
+    def __init__(self):
+        super().__init__()
+        self.clients = []
+        self.clock = QElapsedTimer()
+        self.clock.start()
+        
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+        
+    def now(self):
+        return self.clock.nsecsElapsed() / 1e9
+        
+    def register(self, widget, callback, frame_rate=60):
+        self.unregister(widget, callback)
+        self.clients.append(FrameClient(widget, callback, frame_rate, self.now()))
+        widget.installEventFilter(self)
+        self.update_timer()
+        
+    def unregister(self, widget, callback=None):
+        self.clients = [
+            client for client in self.clients
+            if not (client.widget() is widget
+                    and (callback is None or client.callback() == callback))
+        ]
+        self.update_timer()
+        
+    def is_visible(self, widget):
+        if not shiboken6.isValid(widget) or not widget.isVisible():
+            return False
+        return not widget.window().isMinimized()
+        
+    def eventFilter(self, watched, event):
+        if event.type() in self.WATCHED_EVENTS:
+            if event.type() == QEvent.Type.Show and watched.isWidgetType():
+                # The top-level window is only known once the widget is shown
+                watched.window().installEventFilter(self)
+            self.update_timer()
+        return False
+        
+    def update_timer(self):
+        now = self.now()
+        
+        # Forget clients whose widget has been garbage-collected
+        self.clients = [client for client in self.clients if client.widget() is not None]
+        for client in self.clients:
+            widget = client.widget()
+            active = self.is_visible(widget)
+            if active and not client.active:
+                client.resume(now)
+            client.active = active
+            
+        active = [client for client in self.clients if client.active]
+        if not active:
+            self.timer.stop()
+            return
+            
+        interval = round(1000 / max(client.frame_rate for client in active))
+        if self.timer.interval() != interval or not self.timer.isActive():
+            self.timer.start(interval)
+            
+    def tick(self):
+        now = self.now()
+        
+        # Clients due within half a timer period tick now, so a 20 FPS
+        # client on a 60 FPS clock keeps its cadence despite jitter
+        slack = self.timer.interval() / 2000
+        
+        dropped = []
+        for client in list(self.clients):
+            if not client.active:
+                continue
+            widget = client.widget()
+            callback = client.callback()
+            if widget is None or callback is None or not shiboken6.isValid(widget):
+                dropped.append(client)
+                continue
+            if now < client.next_time - slack:
+                continue
+                
+            delta_time = min(now - client.last_time, MAX_DELTA_TIME)
+            client.last_time = now
+            client.next_time += client.interval
+            if client.next_time < now:
+                client.next_time = now + client.interval
+                
+            try:
+                callback(delta_time)
+            except Exception as e:
+                print(f"⚠️ Animation stopped for {type(widget).__name__}: {e}")
+                dropped.append(client)
+                
+        if dropped:
+            self.clients = [client for client in self.clients if client not in dropped]
+            self.update_timer()
@@ -1,3968 +1,4135 @@
-import sys
-import math
-import random
-import time
-from datetime import datetime
-import numpy as np
-import colorsys
-import torch
-import torch.nn as nn
-import torch.nn.functional as F
-from application.neural_nexus import AdvancedNeuralCore
-from quantum_brain import QuantumBrain, PasswordAnalyzer
-from quantum_visualizer import QuantumVisualizer, HolographicEffect
-
-from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLineEdit, QLabel, QProgressBar, QDialog,
-    QTabWidget, QTextEdit, QCheckBox, QDialogButtonBox, QSlider,
-    QScrollArea, QFrame, QSplitter, QSpinBox, QComboBox
-)
-from PySide6.QtCore import (
-    Qt, QTimer, QPointF, QDateTime, QRectF, QRect, QPropertyAnimation,
-    QEasingCurve
-)
-from PySide6.QtGui import (
-    QPainter, QPen, QColor, QLinearGradient, QRadialGradient,
-    QPainterPath, QPolygonF, QFont, QConicalGradient, QBrush,
-    QFontDatabase
-)
-
-import numpy as np
-import torch
-import torch.nn as nn
-import torch.nn.functional as F
-
-from password_generator import QuantumGenerator
-from quantum_visualizer import QuantumVisualizer, HolographicEffect
-
-# Enable CUDA if available
-device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-
-class PasswordGeneratorDialog(QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Generate Password")
-        self.setMinimumWidth(400)
-        
-        layout = QVBoxLayout(self)
-        
-        # Strength slider
-        strength_layout = QHBoxLayout()
-        strength_label = QLabel("Strength:")
-        self.strength_slider = QSlider(Qt.Orientation.Horizontal)
-        self.strength_slider.setMinimum(0)
-        self.strength_slider.setMaximum(100)
-        self.strength_slider.setValue(80)
-        self.strength_value = QLabel("80%")
-        self.strength_slider.valueChanged.connect(
-            lambda v: self.strength_value.setText(f"{v}%")
-        )
-        strength_layout.addWidget(strength_label)
-        strength_layout.addWidget(self.strength_slider)
-        strength_layout.addWidget(self.strength_value)
-        layout.addLayout(strength_layout)
-        
-        # Character types
-        self.uppercase = QCheckBox("Uppercase (A-Z)")
-        self.lowercase = QCheckBox("Lowercase (a-z)")
-        self.numbers = QCheckBox("Numbers (0-9)")
-        self.special = QCheckBox("Special (!@#$%^&*)")
-        
-        # Set defaults
-        self.uppercase.setChecked(True)
-        self.lowercase.setChecked(True)
-        self.numbers.setChecked(True)
-        self.special.setChecked(True)
-        
-        layout.addWidget(self.uppercase)
-        layout.addWidget(self.lowercase)
-        layout.addWidget(self.numbers)
-        layout.addWidget(self.special)
-        
-        # Length selection
-        length_layout = QHBoxLayout()
-        length_label = QLabel("Length:")
-        self.length_spin = QSpinBox()
-        self.length_spin.setMinimum(8)
-        self.length_spin.setMaximum(64)
-        self.length_spin.setValue(16)
-        length_layout.addWidget(length_label)
-        length_layout.addWidget(self.length_spin)
-        layout.addLayout(length_layout)
-        
-        # Buttons
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | 
-            QDialogButtonBox.StandardButton.Cancel
-        )
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
-
-class NeonKeyboard(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(600, 200)
-        self.pressed_keys = {}
-        self.active_text = ""
-        self.key_animations = {}
-        self.fade_timer = QTimer()
-        self.fade_timer.timeout.connect(self.update_fades)
-        self.fade_timer.start(16)  # 60 FPS
-        
-        # Keyboard layout
-        self.layout = [
-            ['`', '1', '2', '3', '4', '5', '6', '7', '8', '9', '0', '-', '=', '⌫'],
-            ['Tab', 'Q', 'W', 'E', 'R', 'T', 'Y', 'U', 'I', 'O', 'P', '[', ']', '\\'],
-            ['Caps', 'A', 'S', 'D', 'F', 'G', 'H', 'J', 'K', 'L', ';', "'", 'Enter'],
-            ['Shift', 'Z', 'X', 'C', 'V', 'B', 'N', 'M', ',', '.', '/', '⇧']
-        ]
-        
-    def set_text(self, text):
-        self.active_text = text
-        # Animate new characters
-        for char in text:
-            if char.upper() not in self.key_animations:
-                self.key_animations[char.upper()] = 1.0
-        self.update()
-        
-    def update_fades(self):
-        updated = False
-        for key in list(self.key_animations.keys()):
-            if self.key_animations[key] > 0:
-                self.key_animations[key] = max(0, self.key_animations[key] - 0.05)
-                updated = True
-            elif self.key_animations[key] <= 0:
-                del self.key_animations[key]
-                updated = True
-        if updated:
-            self.update()
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Calculate key size
-        key_width = self.width() / 15
-        key_height = self.height() / 5
-        
-        # Draw keyboard background
-        painter.fillRect(self.rect(), QColor(0, 0, 0))
-        
-        y_offset = key_height / 2
-        for row_idx, row in enumerate(self.layout):
-            x_offset = key_width / 2
-            if row_idx == 1:
-                x_offset += key_width * 0.5
-            elif row_idx == 2:
-                x_offset += key_width * 0.75
-            elif row_idx == 3:
-                x_offset += key_width
-                
-            for key in row:
-                # Calculate key rectangle
-                key_rect = QRectF(
-                    x_offset,
-                    y_offset + row_idx * key_height,
-                    key_width * (2 if key in ['Enter', 'Shift', '⇧'] else 1),
-                    key_height * 0.8
-                )
-                
-                # Draw key background with glow effect
-                glow_color = QColor(0, 255, 255, 50)
-                if key.upper() in self.key_animations:
-                    alpha = int(self.key_animations[key.upper()] * 255)
-                    glow_color = QColor(0, 255, 255, alpha)
-                    
-                    # Draw glow
-                    glow = QPainterPath()
-                    glow.addRoundedRect(key_rect.adjusted(-5, -5, 5, 5), 5, 5)
-                    painter.fillPath(glow, QColor(0, 255, 255, alpha // 4))
-                
-                # Draw key
-                path = QPainterPath()
-                path.addRoundedRect(key_rect, 5, 5)
-                
-                gradient = QLinearGradient(
-                    key_rect.topLeft(),
-                    key_rect.bottomRight()
-                )
-                gradient.setColorAt(0, QColor(40, 40, 40))
-                gradient.setColorAt(1, QColor(20, 20, 20))
-                
-                painter.fillPath(path, gradient)
-                
-                # Draw key border
-                pen = QPen(glow_color)
-                pen.setWidth(2)
-                painter.setPen(pen)
-                painter.drawPath(path)
-                
-                # Draw key text
-                painter.setPen(QColor(200, 200, 200))
-                font = painter.font()
-                font.setPointSize(10)
-                painter.setFont(font)
-                painter.drawText(key_rect, Qt.AlignmentFlag.AlignCenter, key)
-                
-                x_offset += key_width * (2 if key in ['Enter', 'Shift', '⇧'] else 1)
-
-class MatrixRainEffect(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.characters = []
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate_rain)
-        self.timer.start(50)
-        self.setMinimumWidth(200)
-        self.strength = 0
-        
-    def set_strength(self, value):
-        self.strength = value
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Set font
-        font = QFont('Courier', 14)
-        painter.setFont(font)
-        
-        # Calculate color based on strength
-        hue = self.strength / 360.0  # Convert strength to hue (0-1)
-        rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-        base_color = QColor(int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
-        
-        # Draw characters
-        for char in self.characters:
-            x, y = char['x'], char['y']
-            opacity = 1.0 - (y / self.height())
-            color = QColor(base_color)
-            color.setAlphaF(opacity)
-            painter.setPen(color)
-            painter.drawText(QPoint(x, y), char['char'])
-    
-    def animate_rain(self):
-        speed_factor = 1 + (self.strength / 100.0)  # Rain speed increases with strength
-        
-        if len(self.characters) < 100:
-            self.characters.append({
-                'x': random.randint(0, self.width()),
-                'y': 0,
-                'speed': random.randint(2, 5) * speed_factor,
-                'char': chr(random.randint(33, 126))
-            })
-        
-        for char in self.characters:
-            char['y'] += char['speed']
-        
-        self.characters = [c for c in self.characters if c['y'] < self.height()]
-        self.update()
-
-class HolographicEffect(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(200, 200)
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(50)
-        self.angle = 0
-        self.strength = 0
-        self.pulse = 0
-        
-    def set_strength(self, value):
-        self.strength = value
-        
-    def animate(self):
-        self.angle = (self.angle + 2) % 360
-        self.pulse = (self.pulse + 0.1) % (2 * math.pi)
-        self.update()
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Calculate color based on strength
-        hue = self.strength / 360.0
-        rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-        base_color = QColor(int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
-        
-        # Draw holographic circles
-        center = self.rect().center()
-        num_circles = 5 + int(self.strength / 20)  # More circles at higher strength
-        
-        for i in range(num_circles):
-            radius = (40 + i * 20) * (1 + 0.1 * math.sin(self.pulse + i * 0.5))
-            gradient = QConicalGradient(center, self.angle + i * 30)
-            gradient.setColorAt(0, QColor(base_color.red(), base_color.green(), base_color.blue(), 30))
-            gradient.setColorAt(1, QColor(base_color.red(), base_color.green(), base_color.blue(), 0))
-            painter.setBrush(gradient)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(center, radius, radius)
-
-class StrengthHistoryGraph(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(300, 150)
-        self.history = []
-        self.max_points = 50
-        
-    def add_strength(self, strength):
-        self.history.append(strength)
-        if len(self.history) > self.max_points:
-            self.history = self.history[-self.max_points:]
-        self.update()
-        
-    def paintEvent(self, event):
-        if not self.history:
-            return
-            
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw background
-        painter.fillRect(self.rect(), QColor(0, 0, 20))
-        
-        # Calculate points
-        width = self.width() - 20
-        height = self.height() - 20
-        point_width = width / (len(self.history) - 1) if len(self.history) > 1 else width
-        
-        points = []
-        for i, strength in enumerate(self.history):
-            x = 10 + i * point_width
-            y = 10 + height * (1 - strength/100)
-            points.append(QPointF(x, y))
-            
-        # Draw line
-        pen = QPen(QColor(0, 255, 255))
-        pen.setWidth(2)
-        painter.setPen(pen)
-        
-        for i in range(len(points) - 1):
-            painter.drawLine(points[i], points[i + 1])
-            
-        # Draw points
-        for point in points:
-            painter.drawEllipse(point, 3, 3)
-
-class PasswordComparisonWidget(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(300, 150)
-        self.current = 0
-        self.previous = 0
-        self.comparison = 0
-        
-    def update_comparison(self, current, previous, comparison):
-        self.current = current
-        self.previous = previous
-        self.comparison = comparison
-        self.update()
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw background
-        painter.fillRect(self.rect(), QColor(0, 0, 20))
-        
-        # Draw comparison bars
-        width = self.width() - 40
-        height = (self.height() - 60) / 3
-        
-        # Current password
-        painter.setPen(QPen(QColor(0, 255, 255)))
-        painter.drawText(20, 20, "Current")
-        painter.fillRect(20, 30, width * self.current/100, height, QColor(0, 255, 255))
-        
-        # Previous password
-        painter.setPen(QPen(QColor(255, 255, 0)))
-        painter.drawText(20, height + 40, "Previous")
-        painter.fillRect(20, height + 50, width * self.previous/100, height, QColor(255, 255, 0))
-        
-        # Comparison
-        color = QColor(0, 255, 0) if self.comparison >= 0 else QColor(255, 0, 0)
-        painter.setPen(QPen(color))
-        painter.drawText(20, 2 * height + 60, "Difference")
-        painter.fillRect(20, 2 * height + 70, width * abs(self.comparison)/100, height, color)
-
-class UltraHDVisualizer(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(400, 300)
-        self.strength = 0
-        self.particles = []
-        self.waves = []
-        self.quantum_noise = self.generate_quantum_noise()
-        self.animation_phase = 0
-        
-        # Animation timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(16)  # 60 FPS
-        
-    def generate_quantum_noise(self):
-        # Generate complex quantum noise pattern
-        noise = []
-        for _ in range(100):
-            noise.append({
-                'x': random.uniform(0, 1),
-                'y': random.uniform(0, 1),
-                'phase': random.uniform(0, 2 * math.pi),
-                'frequency': random.uniform(0.5, 2.0)
-            })
-        return noise
-        
-    def update_animation(self):
-        self.animation_phase += 0.05
-        
-        # Update particles
-        if random.random() < self.strength / 100:
-            self.particles.append({
-                'pos': QPointF(
-                    random.uniform(0, self.width()),
-                    random.uniform(0, self.height())
-                ),
-                'velocity': QPointF(
-                    random.uniform(-2, 2),
-                    random.uniform(-2, 2)
-                ),
-                'size': random.uniform(2, 6),
-                'life': 1.0
-            })
-            
-        # Update existing particles
-        for p in self.particles:
-            p['pos'] += p['velocity']
-            p['life'] -= 0.02
-            
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p['life'] > 0]
-        
-        # Update quantum noise
-        for n in self.quantum_noise:
-            n['phase'] += 0.1 * n['frequency']
-            
-        self.update_waves()
-        self.update()
-        
-    def update_waves(self):
-        # Generate complex wave pattern
-        self.waves = []
-        center_x = self.width() / 2
-        center_y = self.height() / 2
-        
-        for i in range(3):
-            radius = 50 + i * 30
-            phase = self.animation_phase + i * math.pi / 4
-            
-            wave = []
-            for angle in range(0, 360, 5):
-                rad = math.radians(angle)
-                r = radius * (1 + 0.2 * math.sin(phase + rad * 3))
-                x = center_x + r * math.cos(rad)
-                y = center_y + r * math.sin(rad)
-                wave.append(QPointF(x, y))
-            
-            self.waves.append(wave)
-            
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Fill background with dark gradient
-        gradient = QLinearGradient(0, 0, self.width(), self.height())
-        gradient.setColorAt(0, QColor(0, 0, 20))
-        gradient.setColorAt(1, QColor(0, 0, 40))
-        painter.fillRect(self.rect(), gradient)
-        
-        # Draw quantum field
-        self.draw_quantum_field(painter)
-        
-        # Draw particles
-        self.draw_particles(painter)
-        
-        # Draw waves
-        self.draw_waves(painter)
-        
-        # Draw strength indicator
-        self.draw_strength_indicator(painter)
-        
-    def draw_quantum_field(self, painter):
-        width = self.width()
-        height = self.height()
-        
-        for noise in self.quantum_noise:
-            x = noise['x'] * width
-            y = noise['y'] * height
-            value = (math.sin(noise['phase']) + 1) / 2
-            
-            color = self.get_strength_color(self.strength)
-            color.setAlpha(int(value * 50))
-            
-            painter.setPen(QPen(color))
-            painter.drawPoint(int(x), int(y))
-            
-    def draw_particles(self, painter):
-        for p in self.particles:
-            color = self.get_strength_color(self.strength)
-            color.setAlpha(int(p['life'] * 255))
-            
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.PenStyle.NoPen)
-            
-            painter.drawEllipse(
-                p['pos'],
-                p['size'] * p['life'],
-                p['size'] * p['life']
-            )
-            
-    def draw_waves(self, painter):
-        for wave in self.waves:
-            color = self.get_strength_color(self.strength)
-            color.setAlpha(50)
-            
-            pen = QPen(color)
-            pen.setWidth(2)
-            painter.setPen(pen)
-            
-            path = QPainterPath()
-            if wave:
-                path.moveTo(wave[0])
-                for point in wave[1:]:
-                    path.lineTo(point)
-                path.lineTo(wave[0])
-                
-            painter.drawPath(path)
-            
-    def draw_strength_indicator(self, painter):
-        # Draw strength text with cyber effect
-        text = f"Quantum Strength: {int(self.strength)}%"
-        
-        font = painter.font()
-        font.setPointSize(16)
-        font.setBold(True)
-        painter.setFont(font)
-        
-        text_rect = painter.fontMetrics().boundingRect(text)
-        x = (self.width() - text_rect.width()) / 2
-        y = self.height() - 30
-        
-        # Draw text shadow
-        shadow_color = QColor(0, 0, 0)
-        painter.setPen(shadow_color)
-        painter.drawText(x + 2, y + 2, text)
-        
-        # Draw main text
-        color = self.get_strength_color(self.strength)
-        painter.setPen(color)
-        painter.drawText(x, y, text)
-        
-        # Draw cyber details
-        scan_pos = (self.animation_phase * 100) % self.height()
-        painter.setPen(QPen(color, 1, Qt.PenStyle.DotLine))
-        
-        for i in range(3):
-            y = (scan_pos + i * 20) % self.height()
-            painter.drawLine(0, y, self.width(), y)
-            
-        # Draw binary rain
-        font = painter.font()
-        font.setPointSize(8)
-        painter.setFont(font)
-        
-        for i in range(10):
-            x = random.randint(0, self.width())
-            y = (self.animation_phase * 100 + i * 30) % self.height()
-            text = "".join(random.choice("01") for _ in range(8))
-            painter.drawText(QPointF(x, y), text)
-            
-    def get_strength_color(self, strength):
-        hue = (strength / 360.0) % 1.0
-        rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-        return QColor(
-            int(rgb[0] * 255),
-            int(rgb[1] * 255),
-            int(rgb[2] * 255)
-        )
-        
-    def set_strength(self, value):
-        self.strength = value
-
-class AdvancedNetworkMetrics(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(200, 400)
-        self.metrics = {
-            'gradient_norm': [],
-            'layer_sparsity': [],
-            'attention_entropy': [],
-            'neuron_saturation': [],
-            'weight_distribution': [],
-            'activation_patterns': [],
-            'forget_gate_values': [],
-            'input_gate_values': [],
-            'output_gate_values': [],
-            'cell_states': []
-        }
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update_metrics)
-        self.update_timer.start(100)
-        
-    def update_metrics(self):
-        # Update all metrics with simulated data
-        for key in self.metrics:
-            if len(self.metrics[key]) > 100:
-                self.metrics[key].pop(0)
-            self.metrics[key].append(random.gauss(0.5, 0.1))
-        self.update()
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw background
-        gradient = QLinearGradient(0, 0, self.width(), self.height())
-        gradient.setColorAt(0, QColor(0, 0, 30))
-        gradient.setColorAt(1, QColor(0, 30, 60))
-        painter.fillRect(self.rect(), gradient)
-        
-        # Calculate metrics layout
-        metrics_per_column = 5
-        column_width = self.width() / 2
-        row_height = self.height() / metrics_per_column
-        
-        # Draw each metric
-        for i, (key, values) in enumerate(self.metrics.items()):
-            col = i // metrics_per_column
-            row = i % metrics_per_column
-            
-            x = col * column_width
-            y = row * row_height
-            
-            # Draw metric name
-            painter.setPen(QColor(0, 255, 255))
-            painter.drawText(QRectF(x + 5, y, column_width - 10, 20), key.replace('_', ' ').title())
-            
-            # Draw metric graph
-            if values:
-                path = QPainterPath()
-                path.moveTo(x + 5, y + row_height - 10)
-                
-                for j, value in enumerate(values):
-                    point_x = x + 5 + (j / len(values)) * (column_width - 10)
-                    point_y = y + 25 + (row_height - 35) * (1 - value)
-                    if j == 0:
-                        path.moveTo(point_x, point_y)
-                    else:
-                        path.lineTo(point_x, point_y)
-                
-                # Draw line with glow effect
-                pen = QPen(QColor(0, 255, 255))
-                pen.setWidth(2)
-                painter.setPen(pen)
-                painter.drawPath(path)
-                
-                # Add glow effect
-                glow_pen = QPen(QColor(0, 255, 255, 50))
-                glow_pen.setWidth(4)
-                painter.setPen(glow_pen)
-                painter.drawPath(path)
-
-class QuantumStateVisualizer(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(300, 300)
-        self.qubits = []
-        self.entanglements = []
-        self.phase = 0
-        
-        # Initialize quantum state
-        for i in range(8):
-            angle = i * math.pi / 4
-            self.qubits.append({
-                'pos': QPointF(
-                    150 + 100 * math.cos(angle),
-                    150 + 100 * math.sin(angle)
-                ),
-                'state': complex(random.random(), random.random()),
-                'phase': random.random() * math.pi * 2
-            })
-            
-        # Create entanglements
-        for i in range(len(self.qubits)):
-            for j in range(i + 1, len(self.qubits)):
-                if random.random() < 0.3:
-                    self.entanglements.append((i, j))
-                    
-        # Animation timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_quantum_state)
-        self.timer.start(50)
-        
-    def update_quantum_state(self):
-        self.phase += 0.05
-        
-        # Update qubit states
-        for qubit in self.qubits:
-            qubit['phase'] += random.gauss(0, 0.1)
-            magnitude = abs(qubit['state'])
-            phase = math.atan2(qubit['state'].imag, qubit['state'].real)
-            phase += 0.1
-            qubit['state'] = complex(
-                magnitude * math.cos(phase),
-                magnitude * math.sin(phase)
-            )
-            
-        self.update()
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw background with quantum field effect
-        self.draw_quantum_field(painter)
-        
-        # Draw entanglements
-        self.draw_entanglements(painter)
-        
-        # Draw qubits
-        self.draw_qubits(painter)
-        
-        # Draw state information
-        self.draw_state_info(painter)
-        
-    def draw_quantum_field(self, painter):
-        for y in range(0, self.height(), 20):
-            for x in range(0, self.width(), 20):
-                value = math.sin(
-                    math.sqrt((x - 150)**2 + (y - 150)**2) * 0.05 + self.phase
-                )
-                color = QColor(0, int(128 + value * 64), int(128 + value * 64))
-                painter.setPen(color)
-                painter.drawPoint(x, y)
-                
-    def draw_entanglements(self, painter):
-        for i, j in self.entanglements:
-            start = self.qubits[i]['pos']
-            end = self.qubits[j]['pos']
-            
-            # Create entanglement effect
-            path = QPainterPath()
-            path.moveTo(start)
-            
-            # Add wave effect
-            ctrl1 = QPointF(
-                (start.x() + end.x()) / 2 + 20 * math.sin(self.phase),
-                (start.y() + end.y()) / 2 + 20 * math.cos(self.phase)
-            )
-            ctrl2 = QPointF(
-                (start.x() + end.x()) / 2 - 20 * math.sin(self.phase),
-                (start.y() + end.y()) / 2 - 20 * math.cos(self.phase)
-            )
-            
-            path.cubicTo(ctrl1, ctrl2, end)
-            
-            # Draw with quantum effect
-            gradient = QLinearGradient(start, end)
-            gradient.setColorAt(0, QColor(0, 255, 255, 150))
-            gradient.setColorAt(0.5, QColor(255, 0, 255, 150))
-            gradient.setColorAt(1, QColor(0, 255, 255, 150))
-            
-            pen = QPen(gradient, 2)
-            painter.setPen(pen)
-            painter.drawPath(path)
-            
-    def draw_qubits(self, painter):
-        for qubit in self.qubits:
-            # Draw quantum state circle
-            radius = 20
-            state_magnitude = abs(qubit['state'])
-            
-            # Outer glow
-            gradient = QRadialGradient(qubit['pos'], radius * 2)
-            glow_color = QColor(0, 255, 255, 100)
-            gradient.setColorAt(0, glow_color)
-            gradient.setColorAt(1, QColor(0, 0, 0, 0))
-            painter.setBrush(gradient)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(qubit['pos'], radius * 2, radius * 2)
-            
-            # State circle
-            gradient = QRadialGradient(qubit['pos'], radius)
-            color = QColor(
-                int(255 * state_magnitude),
-                int(255 * (1 - state_magnitude)),
-                255
-            )
-            gradient.setColorAt(0, color)
-            gradient.setColorAt(1, QColor(0, 0, 0))
-            painter.setBrush(gradient)
-            painter.drawEllipse(qubit['pos'], radius, radius)
-            
-            # Draw phase indicator
-            phase = math.atan2(qubit['state'].imag, qubit['state'].real)
-            end_x = qubit['pos'].x() + radius * math.cos(phase)
-            end_y = qubit['pos'].y() + radius * math.sin(phase)
-            painter.setPen(QPen(QColor(255, 255, 255), 2))
-            painter.drawLine(qubit['pos'], QPointF(end_x, end_y))
-            
-    def draw_state_info(self, painter):
-        # Draw quantum state information
-        painter.setPen(QColor(0, 255, 255))
-        painter.setFont(QFont('Arial', 8))
-        
-        for i, qubit in enumerate(self.qubits):
-            state_text = f"|ψ{i}⟩ = {qubit['state']:.2f}"
-            painter.drawText(
-                QRectF(10, 10 + i * 20, 200, 20),
-                state_text
-            )
-
-class BackendProcessVisualizer(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(300, 200)
-        self.processes = [
-            {'name': 'Quantum State Preparation', 'progress': 0, 'status': 'active'},
-            {'name': 'Neural Network Forward Pass', 'progress': 0, 'status': 'active'},
-            {'name': 'Attention Mechanism', 'progress': 0, 'status': 'active'},
-            {'name': 'LSTM Cell Updates', 'progress': 0, 'status': 'active'},
-            {'name': 'Gradient Computation', 'progress': 0, 'status': 'active'},
-            {'name': 'Weight Updates', 'progress': 0, 'status': 'active'},
-            {'name': 'Quantum Measurement', 'progress': 0, 'status': 'active'},
-            {'name': 'Entropy Calculation', 'progress': 0, 'status': 'active'}
-        ]
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_processes)
-        self.timer.start(50)
-        
-    def update_processes(self):
-        for process in self.processes:
-            if process['status'] == 'active':
-                process['progress'] += random.uniform(0, 5)
-                if process['progress'] >= 100:
-                    process['progress'] = 0
-        self.update()
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw background
-        gradient = QLinearGradient(0, 0, self.width(), self.height())
-        gradient.setColorAt(0, QColor(0, 0, 20))
-        gradient.setColorAt(1, QColor(0, 20, 40))
-        painter.fillRect(self.rect(), gradient)
-        
-        # Draw processes
-        y_spacing = self.height() / len(self.processes)
-        for i, process in enumerate(self.processes):
-            y = i * y_spacing
-            
-            # Draw process name
-            painter.setPen(QColor(0, 255, 255))
-            painter.drawText(QRectF(10, y + 5, 200, 20), process['name'])
-            
-            # Draw progress bar
-            bar_rect = QRectF(220, y + 5, 100, 15)
-            painter.setPen(Qt.PenStyle.NoPen)
-            
-            # Background
-            painter.setBrush(QColor(0, 100, 100))
-            painter.drawRect(bar_rect)
-            
-            # Progress
-            progress_width = bar_rect.width() * (process['progress'] / 100)
-            progress_rect = QRectF(
-                bar_rect.x(),
-                bar_rect.y(),
-                progress_width,
-                bar_rect.height()
-            )
-            
-            gradient = QLinearGradient(
-                progress_rect.topLeft(),
-                progress_rect.topRight()
-            )
-            gradient.setColorAt(0, QColor(0, 255, 255))
-            gradient.setColorAt(1, QColor(0, 200, 200))
-            painter.setBrush(gradient)
-            painter.drawRect(progress_rect)
-            
-            # Draw percentage
-            painter.setPen(QColor(255, 255, 255))
-            painter.drawText(
-                bar_rect,
-                Qt.AlignmentFlag.AlignCenter,
-                f"{process['progress']:.0f}%"
-            )
-            
-            # Draw activity indicator
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(
-                QColor(0, 255, 0) if process['status'] == 'active'
-                else QColor(255, 0, 0)
-            )
-            painter.drawEllipse(
-                bar_rect.right() + 10,
-                bar_rect.center().y() - 4,
-                8, 8
-            )
-
-class NetworkVisualizerWidget(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(800, 600)
-        
-        # Neural network architecture
-        self.layers = [
-            {'name': 'Input', 'neurons': 8, 'type': 'input'},
-            {'name': 'LSTM', 'neurons': 16, 'type': 'lstm'},
-            {'name': 'Hidden', 'neurons': 32, 'type': 'dense'},
-            {'name': 'Attention', 'neurons': 16, 'type': 'attention'},
-            {'name': 'Output', 'neurons': 4, 'type': 'output'}
-        ]
-        
-        self.node_positions = []
-        self.connection_weights = []
-        self.attention_weights = np.random.rand(16, 16)
-        
-        # Animation
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self.update_animation)
-        self.animation_timer.start(50)
-        
-        # Initialize network
-        self.initialize_network()
-        
-    def initialize_network(self):
-        # Calculate vertical spacing
-        max_neurons = max(layer['neurons'] for layer in self.layers)
-        self.v_spacing = self.height() / (max_neurons + 1)
-        self.h_spacing = self.width() / (len(self.layers) + 1)
-        
-        # Initialize node positions
-        self.node_positions = []
-        for i, layer in enumerate(self.layers):
-            layer_positions = []
-            layer_height = layer['neurons'] * self.v_spacing
-            start_y = (self.height() - layer_height) / 2
-            
-            for j in range(layer['neurons']):
-                x = (i + 1) * self.h_spacing
-                y = start_y + j * self.v_spacing
-                layer_positions.append((x, y))
-            self.node_positions.append(layer_positions)
-            
-        # Initialize connection weights
-        self.connection_weights = []
-        for i in range(len(self.layers) - 1):
-            weights = np.random.randn(
-                self.layers[i]['neurons'],
-                self.layers[i + 1]['neurons']
-            )
-            self.connection_weights.append(weights)
-            
-    def update_animation(self):
-        # Update weights with some random changes
-        for i in range(len(self.connection_weights)):
-            mask = np.random.rand(*self.connection_weights[i].shape) < 0.1
-            changes = np.random.randn(*self.connection_weights[i].shape) * 0.1
-            self.connection_weights[i][mask] += changes[mask]
-            
-        # Update attention weights
-        self.attention_weights += np.random.randn(16, 16) * 0.05
-        self.attention_weights = np.clip(self.attention_weights, 0, 1)
-        
-        self.update()
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw background
-        self.draw_background(painter)
-        
-        # Draw connections
-        self.draw_connections(painter)
-        
-        # Draw nodes
-        self.draw_nodes(painter)
-        
-        # Draw labels
-        self.draw_labels(painter)
-        
-        # Draw attention heatmap
-        self.draw_attention_heatmap(painter)
-        
-    def draw_background(self, painter):
-        # Create cyberpunk gradient background
-        gradient = QLinearGradient(0, 0, self.width(), self.height())
-        gradient.setColorAt(0, QColor(0, 0, 20))
-        gradient.setColorAt(1, QColor(0, 20, 40))
-        painter.fillRect(self.rect(), gradient)
-        
-        # Draw grid
-        pen = QPen(QColor(0, 100, 100, 30))
-        pen.setWidth(1)
-        painter.setPen(pen)
-        
-        grid_size = 30
-        for x in range(0, self.width(), grid_size):
-            painter.drawLine(x, 0, x, self.height())
-        for y in range(0, self.height(), grid_size):
-            painter.drawLine(0, y, self.width(), y)
-            
-    def draw_connections(self, painter):
-        for layer_idx in range(len(self.layers) - 1):
-            weights = self.connection_weights[layer_idx]
-            
-            for i, pos1 in enumerate(self.node_positions[layer_idx]):
-                for j, pos2 in enumerate(self.node_positions[layer_idx + 1]):
-                    weight = weights[i, j]
-                    
-                    # Calculate color based on weight
-                    if weight > 0:
-                        color = QColor(0, int(255 * min(1, weight)), 255, 100)
-                    else:
-                        color = QColor(255, 0, int(255 * min(1, -weight)), 100)
-                        
-                    pen = QPen(color)
-                    pen.setWidth(max(1, int(abs(weight) * 3)))
-                    painter.setPen(pen)
-                    
-                    # Draw connection with animation
-                    path = QPainterPath()
-                    path.moveTo(*pos1)
-                    
-                    # Add control points for curve
-                    ctrl1 = QPointF(
-                        pos1[0] + (pos2[0] - pos1[0]) * 0.5,
-                        pos1[1]
-                    )
-                    ctrl2 = QPointF(
-                        pos1[0] + (pos2[0] - pos1[0]) * 0.5,
-                        pos2[1]
-                    )
-                    path.cubicTo(ctrl1, ctrl2, QPointF(*pos2))
-                    
-                    painter.drawPath(path)
-                    
-    def draw_nodes(self, painter):
-        for layer_idx, layer in enumerate(self.layers):
-            for i, pos in enumerate(self.node_positions[layer_idx]):
-                # Create gradient for node
-                gradient = QRadialGradient(pos[0], pos[1], 15)
-                
-                if layer['type'] == 'input':
-                    color = QColor(0, 255, 255)
-                elif layer['type'] == 'lstm':
-                    color = QColor(255, 165, 0)
-                elif layer['type'] == 'attention':
-                    color = QColor(255, 0, 255)
-                elif layer['type'] == 'output':
-                    color = QColor(0, 255, 0)
-                else:
-                    color = QColor(200, 200, 200)
-                    
-                gradient.setColorAt(0, color)
-                gradient.setColorAt(1, color.darker(200))
-                
-                # Draw node glow
-                painter.setPen(Qt.PenStyle.NoPen)
-                painter.setBrush(QColor(color.red(), color.green(), color.blue(), 30))
-                painter.drawEllipse(QPointF(*pos), 20, 20)
-                
-                # Draw node
-                painter.setBrush(gradient)
-                pen = QPen(color.lighter(150))
-                pen.setWidth(2)
-                painter.setPen(pen)
-                painter.drawEllipse(QPointF(*pos), 15, 15)
-                
-    def draw_labels(self, painter):
-        # Draw layer names and formulas
-        for i, layer in enumerate(self.layers):
-            x = (i + 1) * self.h_spacing
-            y = self.height() - 40
-            
-            # Draw layer name
-            painter.setPen(QColor(0, 255, 255))
-            font = painter.font()
-            font.setPointSize(10)
-            painter.setFont(font)
-            painter.drawText(
-                QRect(int(x - 50), int(y), 100, 20),
-                Qt.AlignmentFlag.AlignCenter,
-                layer['name']
-            )
-            
-            # Draw formula
-            formula = self.get_layer_formula(layer['type'])
-            painter.setPen(QColor(150, 150, 150))
-            font.setPointSize(8)
-            painter.setFont(font)
-            painter.drawText(
-                QRect(int(x - 70), int(y + 20), 140, 20),
-                Qt.AlignmentFlag.AlignCenter,
-                formula
-            )
-            
-    def draw_attention_heatmap(self, painter):
-        # Draw attention weights heatmap in top-right corner
-        if 'attention' in [layer['type'] for layer in self.layers]:
-            heatmap_size = 150
-            cell_size = heatmap_size / 16
-            
-            # Draw heatmap background
-            painter.fillRect(
-                self.width() - heatmap_size - 20,
-                20,
-                heatmap_size,
-                heatmap_size,
-                QColor(0, 0, 0, 100)
-            )
-            
-            # Draw cells
-            for i in range(16):
-                for j in range(16):
-                    weight = self.attention_weights[i, j]
-                    color = QColor(
-                        int(255 * weight),
-                        int(128 * weight),
-                        int(255 * (1 - weight)),
-                        200
-                    )
-                    painter.fillRect(
-                        self.width() - heatmap_size - 20 + j * cell_size,
-                        20 + i * cell_size,
-                        cell_size,
-                        cell_size,
-                        color
-                    )
-                    
-            # Draw heatmap border
-            painter.setPen(QPen(QColor(0, 255, 255)))
-            painter.drawRect(
-                self.width() - heatmap_size - 20,
-                20,
-                heatmap_size,
-                heatmap_size
-            )
-            
-            # Draw title
-            painter.drawText(
-                self.width() - heatmap_size - 20,
-                10,
-                "Attention Weights"
-            )
-            
-    def get_layer_formula(self, layer_type):
-        formulas = {
-            'input': 'x',
-            'lstm': 'h_t = σ(W_x·x + W_h·h_{t-1})',
-            'dense': 'y = σ(W·x + b)',
-            'attention': 'α = softmax(Q·K^T)·V',
-            'output': 'ŷ = softmax(W·x + b)'
-        }
-        return formulas.get(layer_type, '')
-        
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        self.initialize_network()
-
-class QuantumCircuitVisualizer(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(300, 200)
-        self.qubits = []
-        self.gates = []
-        self.measurements = []
-        self.animation_phase = 0
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(50)
-        
-    def update_animation(self):
-        self.animation_phase += 0.1
-        self.update()
-        
-    def set_circuit(self, password):
-        # Convert password characters to quantum circuit
-        self.qubits = []
-        self.gates = []
-        self.measurements = []
-        
-        for i, char in enumerate(password):
-            # Create qubit for each character
-            self.qubits.append({
-                'index': i,
-                'state': complex(ord(char) / 255, 0)
-            })
-            
-            # Add quantum gates based on character properties
-            if char.isupper():
-                self.gates.append({
-                    'type': 'H',  # Hadamard gate
-                    'target': i,
-                    'pos': len(self.gates)
-                })
-            elif char.islower():
-                self.gates.append({
-                    'type': 'X',  # NOT gate
-                    'target': i,
-                    'pos': len(self.gates)
-                })
-            elif char.isdigit():
-                self.gates.append({
-                    'type': 'Y',  # Y rotation
-                    'target': i,
-                    'pos': len(self.gates)
-                })
-            else:
-                self.gates.append({
-                    'type': 'Z',  # Z rotation
-                    'target': i,
-                    'pos': len(self.gates)
-                })
-                
-            # Add measurement at the end
-            self.measurements.append({
-                'target': i,
-                'value': abs(self.qubits[i]['state'])**2
-            })
-            
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw dark background
-        painter.fillRect(self.rect(), QColor(0, 0, 20))
-        
-        # Calculate layout
-        qubit_spacing = self.height() / (len(self.qubits) + 1)
-        gate_spacing = self.width() / (max(len(self.gates), 1) + 2)
-        
-        # Draw qubit lines
-        painter.setPen(QPen(QColor(0, 255, 255), 1))
-        for i, qubit in enumerate(self.qubits):
-            y = (i + 1) * qubit_spacing
-            painter.drawLine(50, y, self.width() - 50, y)
-            
-            # Draw qubit label
-            painter.drawText(10, y + 5, f"|q{i}⟩")
-            
-        # Draw gates
-        for gate in self.gates:
-            x = 50 + (gate['pos'] + 1) * gate_spacing
-            y = (gate['target'] + 1) * qubit_spacing
-            
-            # Gate background with glow
-            gradient = QRadialGradient(x, y, 20)
-            color = QColor(0, 255, 255)
-            gradient.setColorAt(0, color)
-            color.setAlpha(0)
-            gradient.setColorAt(1, color)
-            
-            painter.setBrush(gradient)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(QPointF(x, y), 20, 20)
-            
-            # Gate symbol
-            painter.setPen(QColor(255, 255, 255))
-            painter.drawText(
-                QRectF(x - 10, y - 10, 20, 20),
-                Qt.AlignmentFlag.AlignCenter,
-                gate['type']
-            )
-            
-        # Draw measurements
-        for i, meas in enumerate(self.measurements):
-            x = self.width() - 40
-            y = (meas['target'] + 1) * qubit_spacing
-            
-            # Draw measurement symbol
-            path = QPainterPath()
-            path.moveTo(x, y - 10)
-            path.lineTo(x + 20, y)
-            path.lineTo(x, y + 10)
-            
-            painter.setPen(QPen(QColor(255, 200, 0), 2))
-            painter.drawPath(path)
-            
-            # Draw probability
-            painter.drawText(
-                QRectF(x + 25, y - 10, 40, 20),
-                Qt.AlignmentFlag.AlignLeft,
-                f"{meas['value']:.2f}"
-            )
-
-class PasswordStrengthAnalyzer(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(300, 400)
-        self.metrics = {
-            'entropy': [],
-            'uniqueness': [],
-            'pattern_strength': [],
-            'quantum_resistance': [],
-            'neural_confidence': []
-        }
-        self.current_password = ""
-        
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update_metrics)
-        self.update_timer.start(100)
-        
-    def analyze_password(self, password):
-        self.current_password = password
-        
-        # Calculate metrics
-        if password:
-            # Entropy calculation
-            char_set = set(password)
-            entropy = len(password) * math.log2(max(len(char_set), 2))
-            self.metrics['entropy'].append(min(entropy / 100, 1.0))
-            
-            # Uniqueness score
-            uniqueness = len(char_set) / len(password)
-            self.metrics['uniqueness'].append(uniqueness)
-            
-            # Pattern strength (simplified)
-            has_upper = any(c.isupper() for c in password)
-            has_lower = any(c.islower() for c in password)
-            has_digit = any(c.isdigit() for c in password)
-            has_special = any(not c.isalnum() for c in password)
-            pattern_score = (has_upper + has_lower + has_digit + has_special) / 4
-            self.metrics['pattern_strength'].append(pattern_score)
-            
-            # Quantum resistance (based on complexity)
-            quantum_score = min((len(password) * pattern_score) / 20, 1.0)
-            self.metrics['quantum_resistance'].append(quantum_score)
-            
-            # Neural confidence (simulated)
-            confidence = random.uniform(0.8, 1.0) * pattern_score
-            self.metrics['neural_confidence'].append(confidence)
-        else:
-            for key in self.metrics:
-                self.metrics[key].append(0.0)
-                
-        # Keep only recent history
-        for key in self.metrics:
-            if len(self.metrics[key]) > 50:
-                self.metrics[key] = self.metrics[key][-50:]
-                
-        self.update()
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw background
-        gradient = QLinearGradient(0, 0, self.width(), self.height())
-        gradient.setColorAt(0, QColor(0, 0, 20))
-        gradient.setColorAt(1, QColor(0, 20, 40))
-        painter.fillRect(self.rect(), gradient)
-        
-        # Draw metrics
-        y_spacing = self.height() / len(self.metrics)
-        for i, (name, values) in enumerate(self.metrics.items()):
-            y = i * y_spacing
-            
-            # Draw metric name
-            painter.setPen(QColor(0, 255, 255))
-            painter.drawText(10, y + 20, name.replace('_', ' ').title())
-            
-            # Draw metric graph
-            if values:
-                # Create graph path
-                path = QPainterPath()
-                path.moveTo(150, y + y_spacing - 10)
-                
-                for j, value in enumerate(values):
-                    x = 150 + (j / len(values)) * (self.width() - 160)
-                    y_val = y + y_spacing - 10 - (value * (y_spacing - 20))
-                    if j == 0:
-                        path.moveTo(x, y_val)
-                    else:
-                        path.lineTo(x, y_val)
-                        
-                # Draw graph line with glow effect
-                pen = QPen(QColor(0, 255, 255))
-                pen.setWidth(2)
-                painter.setPen(pen)
-                painter.drawPath(path)
-                
-                # Add glow effect
-                glow_pen = QPen(QColor(0, 255, 255, 50))
-                glow_pen.setWidth(4)
-                painter.setPen(glow_pen)
-                painter.drawPath(path)
-                
-                # Draw current value
-                current_value = values[-1]
-                painter.setPen(QColor(255, 255, 255))
-                painter.drawText(
-                    60, y + 20,
-                    f"{current_value:.2f}"
-                )
-
-class QuantumEntanglementVisualizer(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(300, 300)
-        self.password_qubits = []
-        self.entanglements = []
-        self.animation_phase = 0
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(50)
-        
-    def update_animation(self):
-        self.animation_phase += 0.1
-        
-        # Update qubit positions
-        for qubit in self.password_qubits:
-            angle = qubit['base_angle'] + self.animation_phase * qubit['speed']
-            radius = qubit['radius'] * (1 + 0.1 * math.sin(self.animation_phase * 2))
-            qubit['pos'] = QPointF(
-                self.width()/2 + radius * math.cos(angle),
-                self.height()/2 + radius * math.sin(angle)
-            )
-            
-        self.update()
-        
-    def set_password(self, password):
-        self.password_qubits = []
-        self.entanglements = []
-        
-        if not password:
-            return
-            
-        # Create qubits for each character
-        for i, char in enumerate(password):
-            angle = (i / len(password)) * 2 * math.pi
-            self.password_qubits.append({
-                'char': char,
-                'base_angle': angle,
-                'speed': 0.02 + random.uniform(-0.01, 0.01),
-                'radius': 100 + random.uniform(-10, 10),
-                'state': complex(ord(char) / 255, 0),
-                'pos': QPointF(0, 0)  # Will be updated in animation
-            })
-            
-        # Create entanglements between similar characters
-        for i, q1 in enumerate(self.password_qubits):
-            for j, q2 in enumerate(self.password_qubits[i+1:], i+1):
-                if (q1['char'].isupper() == q2['char'].isupper() or
-                    q1['char'].islower() == q2['char'].islower() or
-                    q1['char'].isdigit() == q2['char'].isdigit()):
-                    strength = 0.5 + 0.5 * (1 - abs(i - j) / len(password))
-                    self.entanglements.append({
-                        'qubit1': i,
-                        'qubit2': j,
-                        'strength': strength
-                    })
-                    
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw background
-        gradient = QRadialGradient(
-            self.width()/2, self.height()/2,
-            max(self.width(), self.height())
-        )
-        gradient.setColorAt(0, QColor(0, 0, 40))
-        gradient.setColorAt(1, QColor(0, 0, 20))
-        painter.fillRect(self.rect(), gradient)
-        
-        # Draw entanglements
-        for ent in self.entanglements:
-            q1 = self.password_qubits[ent['qubit1']]
-            q2 = self.password_qubits[ent['qubit2']]
-            
-            # Create entanglement effect
-            path = QPainterPath()
-            path.moveTo(q1['pos'])
-            
-            # Add wave effect to entanglement
-            ctrl1 = QPointF(
-                (q1['pos'].x() + q2['pos'].x())/2 + 20 * math.sin(self.animation_phase),
-                (q1['pos'].y() + q2['pos'].y())/2 + 20 * math.cos(self.animation_phase)
-            )
-            ctrl2 = QPointF(
-                (q1['pos'].x() + q2['pos'].x())/2 - 20 * math.sin(self.animation_phase),
-                (q1['pos'].y() + q2['pos'].y())/2 - 20 * math.cos(self.animation_phase)
-            )
-            
-            path.cubicTo(ctrl1, ctrl2, q2['pos'])
-            
-            # Draw with quantum effect
-            gradient = QLinearGradient(q1['pos'], q2['pos'])
-            alpha = int(ent['strength'] * 150)
-            gradient.setColorAt(0, QColor(0, 255, 255, alpha))
-            gradient.setColorAt(0.5, QColor(255, 0, 255, alpha))
-            gradient.setColorAt(1, QColor(0, 255, 255, alpha))
-            
-            pen = QPen(gradient, 2)
-            painter.setPen(pen)
-            painter.drawPath(path)
-            
-        # Draw qubits
-        for qubit in self.password_qubits:
-            # Qubit glow
-            gradient = QRadialGradient(qubit['pos'], 20)
-            color = QColor(0, 255, 255)
-            gradient.setColorAt(0, color)
-            color.setAlpha(0)
-            gradient.setColorAt(1, color)
-            
-            painter.setBrush(gradient)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(qubit['pos'], 20, 20)
-            
-            # Qubit core
-            painter.setBrush(QColor(0, 255, 255))
-            painter.drawEllipse(qubit['pos'], 5, 5)
-            
-            # Draw character
-            painter.setPen(QColor(255, 255, 255))
-            painter.drawText(
-                QRectF(qubit['pos'].x() - 10, qubit['pos'].y() - 10, 20, 20),
-                Qt.AlignmentFlag.AlignCenter,
-                qubit['char']
-            )
-
-class QuantumWaveformAnalyzer(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(300, 200)
-        self.waveform_data = []
-        self.phase = 0
-        self.frequency = 1.0
-        self.amplitude = 1.0
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_waveform)
-        self.timer.start(16)  # 60 FPS
-        
-    def update_waveform(self):
-        self.phase += 0.1
-        self.update()
-        
-    def set_password_complexity(self, password):
-        if not password:
-            self.waveform_data = []
-            return
-            
-        # Generate waveform based on password characteristics
-        self.waveform_data = []
-        base_freq = 2 * math.pi / 100
-        
-        for i in range(100):
-            x = i / 100
-            y = 0
-            
-            # Add components based on password characteristics
-            for j, char in enumerate(password):
-                freq = base_freq * (j + 1)
-                amp = 0.5 / (j + 1)
-                
-                if char.isupper():
-                    y += amp * math.sin(freq * x * 20 + self.phase)
-                elif char.islower():
-                    y += amp * math.cos(freq * x * 15 + self.phase)
-                elif char.isdigit():
-                    y += amp * math.sin(freq * x * 10 + self.phase * 2)
-                else:
-                    y += amp * math.cos(freq * x * 25 + self.phase * 0.5)
-                    
-            self.waveform_data.append((x, y))
-            
-    def paintEvent(self, event):
-        if not self.waveform_data:
-            return
-            
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw background
-        gradient = QLinearGradient(0, 0, self.width(), self.height())
-        gradient.setColorAt(0, QColor(0, 0, 20))
-        gradient.setColorAt(1, QColor(0, 20, 40))
-        painter.fillRect(self.rect(), gradient)
-        
-        # Draw grid
-        painter.setPen(QPen(QColor(0, 100, 100, 30)))
-        for i in range(0, self.width(), 20):
-            painter.drawLine(i, 0, i, self.height())
-        for i in range(0, self.height(), 20):
-            painter.drawLine(0, i, self.width(), i)
-            
-        # Draw waveform
-        if len(self.waveform_data) > 1:
-            # Create path for the waveform
-            path = QPainterPath()
-            
-            # Scale points to widget size
-            points = []
-            for x, y in self.waveform_data:
-                px = x * self.width()
-                py = self.height()/2 * (1 - y)
-                points.append(QPointF(px, py))
-                
-            # Create smooth path
-            path.moveTo(points[0])
-            for i in range(1, len(points)-2, 2):
-                path.cubicTo(
-                    points[i], points[i+1], points[i+2]
-                )
-                
-            # Draw path with glow effect
-            pen = QPen(QColor(0, 255, 255))
-            pen.setWidth(2)
-            painter.setPen(pen)
-            painter.drawPath(path)
-            
-            # Add glow effect
-            glow_pen = QPen(QColor(0, 255, 255, 50))
-            glow_pen.setWidth(4)
-            painter.setPen(glow_pen)
-            painter.drawPath(path)
-
-class QuantumStateMap(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(300, 300)
-        self.state_points = []
-        self.connections = []
-        self.animation_phase = 0
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(50)
-        
-    def update_animation(self):
-        self.animation_phase += 0.1
-        self.update()
-        
-    def set_password_state(self, password):
-        self.state_points = []
-        self.connections = []
-        
-        if not password:
-            return
-            
-        # Create quantum state points based on password characteristics
-        center_x = self.width() / 2
-        center_y = self.height() / 2
-        
-        for i, char in enumerate(password):
-            # Calculate position in a spiral pattern
-            angle = i * math.pi / 4
-            radius = 20 + i * 15
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
-            
-            # Create state point with properties based on character
-            state = {
-                'pos': QPointF(x, y),
-                'char': char,
-                'energy': ord(char) / 255.0,
-                'phase': random.random() * math.pi * 2,
-                'spin': 1 if char.isupper() else -1
-            }
-            self.state_points.append(state)
-            
-        # Create quantum connections between related states
-        for i, s1 in enumerate(self.state_points):
-            for j, s2 in enumerate(self.state_points[i+1:], i+1):
-                if (s1['char'].isupper() == s2['char'].isupper() or
-                    s1['char'].islower() == s2['char'].islower() or
-                    s1['char'].isdigit() == s2['char'].isdigit()):
-                    strength = 0.5 + 0.5 * (1 - abs(i - j) / len(password))
-                    self.connections.append({
-                        'start': i,
-                        'end': j,
-                        'strength': strength,
-                        'phase': random.random() * math.pi * 2
-                    })
-                    
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw background with quantum field effect
-        self.draw_quantum_field(painter)
-        
-        # Draw connections
-        self.draw_connections(painter)
-        
-        # Draw state points
-        self.draw_state_points(painter)
-        
-    def draw_quantum_field(self, painter):
-        # Create quantum field background
-        for y in range(0, self.height(), 10):
-            for x in range(0, self.width(), 10):
-                # Calculate field intensity based on nearby states
-                intensity = 0
-                for state in self.state_points:
-                    dx = x - state['pos'].x()
-                    dy = y - state['pos'].y()
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    if distance > 0:
-                        intensity += state['energy'] / (distance * 0.1)
-                        
-                # Add wave effect
-                intensity += 0.2 * math.sin(
-                    math.sqrt((x - self.width()/2)**2 + 
-                             (y - self.height()/2)**2) * 0.05 + 
-                    self.animation_phase
-                )
-                
-                color = QColor(
-                    0,
-                    int(128 + intensity * 64),
-                    int(128 + intensity * 64)
-                )
-                painter.setPen(color)
-                painter.drawPoint(x, y)
-                
-    def draw_connections(self, painter):
-        for conn in self.connections:
-            start = self.state_points[conn['start']]['pos']
-            end = self.state_points[conn['end']]['pos']
-            
-            # Create quantum entanglement effect
-            path = QPainterPath()
-            path.moveTo(start)
-            
-            # Add wave effect to connection
-            mid_x = (start.x() + end.x()) / 2
-            mid_y = (start.y() + end.y()) / 2
-            ctrl1 = QPointF(
-                mid_x + 20 * math.sin(self.animation_phase + conn['phase']),
-                mid_y + 20 * math.cos(self.animation_phase + conn['phase'])
-            )
-            ctrl2 = QPointF(
-                mid_x - 20 * math.sin(self.animation_phase + conn['phase']),
-                mid_y - 20 * math.cos(self.animation_phase + conn['phase'])
-            )
-            
-            path.cubicTo(ctrl1, ctrl2, end)
-            
-            # Draw with quantum effect
-            gradient = QLinearGradient(start, end)
-            alpha = int(conn['strength'] * 150)
-            gradient.setColorAt(0, QColor(0, 255, 255, alpha))
-            gradient.setColorAt(0.5, QColor(255, 0, 255, alpha))
-            gradient.setColorAt(1, QColor(0, 255, 255, alpha))
-            
-            pen = QPen(gradient, 2)
-            painter.setPen(pen)
-            painter.drawPath(path)
-            
-    def draw_state_points(self, painter):
-        for state in self.state_points:
-            # Draw quantum state glow
-            gradient = QRadialGradient(state['pos'], 20)
-            color = QColor(0, 255, 255)
-            gradient.setColorAt(0, color)
-            color.setAlpha(0)
-            gradient.setColorAt(1, color)
-            
-            painter.setBrush(gradient)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(state['pos'], 20, 20)
-            
-            # Draw state core
-            painter.setBrush(QColor(0, 255, 255))
-            painter.drawEllipse(state['pos'], 5, 5)
-            
-            # Draw character
-            painter.setPen(QColor(255, 255, 255))
-            painter.drawText(
-                QRectF(state['pos'].x() - 10, state['pos'].y() - 10, 20, 20),
-                Qt.AlignmentFlag.AlignCenter,
-                state['char']
-            )
-            
-            # Draw spin indicator
-            if state['spin'] > 0:
-                painter.drawText(
-                    QRectF(state['pos'].x() - 5, state['pos'].y() - 25, 10, 10),
-                    Qt.AlignmentFlag.AlignCenter,
-                    '↑'
-                )
-        else:
-                painter.drawText(
-                    QRectF(state['pos'].x() - 5, state['pos'].y() - 25, 10, 10),
-                    Qt.AlignmentFlag.AlignCenter,
-                    '↓'
-                )
-
-class QuantumResonanceVisualizer(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(400, 300)
-        self.resonance_points = []
-        self.quantum_field = []
-        self.phase = 0
-        self.strength = 0
-        self.interference_patterns = []
-        
-        # Initialize quantum field
-        for x in range(20):
-            for y in range(20):
-                self.quantum_field.append({
-                    'x': x / 20,
-                    'y': y / 20,
-                    'amplitude': 0,
-                    'phase': random.random() * 2 * math.pi,
-                    'frequency': random.uniform(0.5, 2.0)
-                })
-                
-        # Animation timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_resonance)
-        self.timer.start(16)  # 60 FPS
-        
-    def update_resonance(self):
-        self.phase += 0.05
-        
-        # Update quantum field
-        for point in self.quantum_field:
-            point['phase'] += point['frequency'] * 0.1
-            point['amplitude'] = 0.5 + 0.5 * math.sin(point['phase'])
-            
-        # Generate resonance points
-        self.resonance_points = []
-        num_points = int(10 + self.strength / 10)
-        
-        for i in range(num_points):
-            angle = i * 2 * math.pi / num_points + self.phase
-            radius = 0.3 + 0.1 * math.sin(self.phase * 2 + i)
-            self.resonance_points.append({
-                'x': 0.5 + radius * math.cos(angle),
-                'y': 0.5 + radius * math.sin(angle),
-                'energy': 0.5 + 0.5 * math.sin(self.phase * 3 + i),
-                'phase': angle
-            })
-            
-        # Generate interference patterns
-        self.interference_patterns = []
-        for i in range(num_points // 2):
-            p1 = self.resonance_points[i]
-            p2 = self.resonance_points[(i + num_points//2) % num_points]
-            
-            pattern = []
-            steps = 20
-            for j in range(steps):
-                t = j / (steps - 1)
-                x = p1['x'] + (p2['x'] - p1['x']) * t
-                y = p1['y'] + (p2['y'] - p1['y']) * t
-                intensity = math.sin(self.phase * 2 + t * math.pi) * math.sin(t * math.pi)
-                pattern.append({'x': x, 'y': y, 'intensity': abs(intensity)})
-            self.interference_patterns.append(pattern)
-            
-        self.update()
-        
-    def set_strength(self, value):
-        self.strength = value
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw background with quantum field
-        self.draw_quantum_field(painter)
-        
-        # Draw interference patterns
-        self.draw_interference_patterns(painter)
-        
-        # Draw resonance points
-        self.draw_resonance_points(painter)
-        
-        # Draw quantum metrics
-        self.draw_quantum_metrics(painter)
-        
-    def draw_quantum_field(self, painter):
-        width = self.width()
-        height = self.height()
-        
-        for point in self.quantum_field:
-            x = int(point['x'] * width)
-            y = int(point['y'] * height)
-            
-            # Calculate field intensity
-            intensity = point['amplitude'] * (0.3 + 0.7 * self.strength / 100)
-            
-            # Create quantum glow effect
-            gradient = QRadialGradient(x, y, 20)
-            color = QColor(0, int(255 * intensity), int(255 * intensity))
-            gradient.setColorAt(0, color)
-            color.setAlpha(0)
-            gradient.setColorAt(1, color)
-            
-            painter.fillRect(x-10, y-10, 20, 20, gradient)
-            
-    def draw_interference_patterns(self, painter):
-        width = self.width()
-        height = self.height()
-        
-        for pattern in self.interference_patterns:
-            path = QPainterPath()
-            first_point = pattern[0]
-            path.moveTo(first_point['x'] * width, first_point['y'] * height)
-            
-            for point in pattern[1:]:
-                path.lineTo(point['x'] * width, point['y'] * height)
-                
-            # Draw with quantum effect
-            pen = QPen()
-            pen.setWidth(2)
-            for i, point in enumerate(pattern):
-                color = QColor(0, int(255 * point['intensity']), int(255 * point['intensity']))
-                pen.setColor(color)
-                painter.setPen(pen)
-                if i < len(pattern) - 1:
-                    next_point = pattern[i + 1]
-                    painter.drawLine(
-                        int(point['x'] * width),
-                        int(point['y'] * height),
-                        int(next_point['x'] * width),
-                        int(next_point['y'] * height)
-                    )
-                    
-    def draw_resonance_points(self, painter):
-        width = self.width()
-        height = self.height()
-        
-        for point in self.resonance_points:
-            x = int(point['x'] * width)
-            y = int(point['y'] * height)
-            
-            # Draw quantum state with glow
-            gradient = QRadialGradient(x, y, 30)
-            color = QColor(0, int(255 * point['energy']), int(255 * point['energy']))
-            gradient.setColorAt(0, color)
-            color.setAlpha(0)
-            gradient.setColorAt(1, color)
-            
-            painter.setBrush(gradient)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(QPoint(x, y), 30, 30)
-            
-            # Draw core
-            painter.setBrush(QColor(0, 255, 255))
-            painter.drawEllipse(QPoint(x, y), 5, 5)
-            
-            # Draw phase line
-            end_x = x + 20 * math.cos(point['phase'])
-            end_y = y + 20 * math.sin(point['phase'])
-            painter.setPen(QPen(QColor(0, 255, 255), 2))
-            painter.drawLine(x, y, int(end_x), int(end_y))
-            
-    def draw_quantum_metrics(self, painter):
-        # Draw quantum state information
-        painter.setPen(QColor(0, 255, 255))
-        painter.setFont(QFont('Arial', 10))
-        
-        metrics = [
-            f"Quantum Coherence: {self.strength:.1f}%",
-            f"Phase Alignment: {abs(math.sin(self.phase)):.2f}",
-            f"Resonance Points: {len(self.resonance_points)}",
-            f"Field Intensity: {sum(p['amplitude'] for p in self.quantum_field)/len(self.quantum_field):.2f}"
-        ]
-        
-        for i, metric in enumerate(metrics):
-            painter.drawText(10, 20 + i * 20, metric)
-
-class QuantumMetricsPanel(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(300, 200)
-        self.metrics = {
-            'quantum_entropy': 0.0,
-            'classical_entropy': 0.0,
-            'neural_confidence': 0.0,
-            'pattern_complexity': 0.0,
-            'quantum_resistance': 0.0,
-            'superposition_score': 0.0
-        }
-        self.history = {key: [] for key in self.metrics.keys()}
-        self.max_history = 100
-        
-        # Animation
-        self.phase = 0
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(16)
-                    
-    def update_animation(self):
-        self.phase += 0.05
-        self.update()
-        
-    def update_metrics(self, password):
-        if not password:
-            for key in self.metrics:
-                self.metrics[key] = 0.0
-            return
-            
-        # Calculate quantum entropy
-        char_frequencies = {}
-        for c in password:
-            char_frequencies[c] = char_frequencies.get(c, 0) + 1
-        prob_dist = [freq/len(password) for freq in char_frequencies.values()]
-        self.metrics['quantum_entropy'] = -sum(p * math.log2(p) for p in prob_dist) / 4.0
-        
-        # Calculate classical entropy
-        char_set_size = len(set(password))
-        self.metrics['classical_entropy'] = math.log2(max(char_set_size, 2)) / 6.0
-        
-        # Neural confidence (simulated)
-        self.metrics['neural_confidence'] = random.uniform(0.7, 1.0)
-        
-        # Pattern complexity
-        has_upper = any(c.isupper() for c in password)
-        has_lower = any(c.islower() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(not c.isalnum() for c in password)
-        self.metrics['pattern_complexity'] = (has_upper + has_lower + has_digit + has_special) / 4.0
-        
-        # Quantum resistance (based on length and complexity)
-        self.metrics['quantum_resistance'] = min((len(password) * self.metrics['pattern_complexity']) / 20, 1.0)
-        
-        # Superposition score (based on character variety)
-        unique_chars = len(set(password))
-        self.metrics['superposition_score'] = min(unique_chars / 20, 1.0)
-        
-        # Update history
-        for key, value in self.metrics.items():
-            self.history[key].append(value)
-            if len(self.history[key]) > self.max_history:
-                self.history[key].pop(0)
-            
-        self.update()
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw background
-        gradient = QLinearGradient(0, 0, self.width(), self.height())
-        gradient.setColorAt(0, QColor(0, 0, 20))
-        gradient.setColorAt(1, QColor(0, 20, 40))
-        painter.fillRect(self.rect(), gradient)
-        
-        # Draw metrics
-        self.draw_metrics(painter)
-        
-        # Draw history graphs
-        self.draw_history_graphs(painter)
-        
-    def draw_metrics(self, painter):
-        painter.setPen(QColor(0, 255, 255))
-        painter.setFont(QFont('Arial', 10))
-        
-        x = 10
-        y = 20
-        width = self.width() - 20
-        
-        for key, value in self.metrics.items():
-            # Draw label
-            label = key.replace('_', ' ').title()
-            painter.drawText(x, y, label)
-            
-            # Draw value bar
-            bar_rect = QRectF(x + 150, y - 15, width - 160, 20)
-            
-            # Bar background
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QColor(0, 40, 40))
-            painter.drawRect(bar_rect)
-            
-            # Bar value with gradient
-            value_width = bar_rect.width() * value
-            value_rect = QRectF(bar_rect.x(), bar_rect.y(), value_width, bar_rect.height())
-            gradient = QLinearGradient(value_rect.topLeft(), value_rect.topRight())
-            gradient.setColorAt(0, QColor(0, 255, 255))
-            gradient.setColorAt(1, QColor(0, 128, 255))
-            painter.setBrush(gradient)
-            painter.drawRect(value_rect)
-            
-            # Draw value text
-            painter.setPen(QColor(255, 255, 255))
-            painter.drawText(
-                value_rect.adjusted(5, 0, -5, 0),
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
-                f"{value:.2f}"
-            )
-            
-            y += 30
-            
-    def draw_history_graphs(self, painter):
-        graph_height = 60
-        y_start = self.height() - graph_height - 10
-        
-        # Draw combined history graph
-        painter.setPen(QPen(QColor(0, 255, 255, 100), 1))
-        painter.drawRect(10, y_start, self.width() - 20, graph_height)
-        
-        if not any(self.history.values()):
-            return
-            
-        for key, values in self.history.items():
-            if not values:
-                continue
-                
-            # Create path for history line
-            path = QPainterPath()
-            x_step = (self.width() - 20) / (len(values) - 1) if len(values) > 1 else 0
-            
-            for i, value in enumerate(values):
-                x = 10 + i * x_step
-                y = y_start + graph_height - (value * graph_height)
-                
-                if i == 0:
-                    path.moveTo(x, y)
-                else:
-                    path.lineTo(x, y)
-                    
-            # Draw history line with glow effect
-            pen = QPen(QColor(0, 255, 255))
-            pen.setWidth(2)
-            painter.setPen(pen)
-            painter.drawPath(path)
-            
-            # Add glow effect
-            glow_pen = QPen(QColor(0, 255, 255, 50))
-            glow_pen.setWidth(4)
-            painter.setPen(glow_pen)
-            painter.drawPath(path)
-
-class QuantumEffectsProcessor:
-    def __init__(self):
-        self.quantum_states = []
-        self.entanglement_pairs = []
-        self.interference_patterns = []
-        self.phase = 0
-        
-    def process_password(self, password):
-        if not password:
-            self.quantum_states = []
-            self.entanglement_pairs = []
-            self.interference_patterns = []
-            return
-            
-        # Generate quantum states for each character
-        self.quantum_states = []
-        for i, char in enumerate(password):
-            # Convert character to quantum state
-            amplitude = ord(char) / 255.0
-            phase = (i * math.pi * 2) / len(password)
-            
-            state = {
-                'amplitude': amplitude,
-                'phase': phase,
-                'position': i / len(password),
-                'char': char,
-                'energy': self._calculate_energy(char)
-            }
-            self.quantum_states.append(state)
-            
-        # Generate entanglement pairs
-        self.entanglement_pairs = []
-        for i, s1 in enumerate(self.quantum_states):
-            for j, s2 in enumerate(self.quantum_states[i+1:], i+1):
-                if self._are_entangled(s1, s2):
-                    strength = self._calculate_entanglement_strength(s1, s2)
-                    self.entanglement_pairs.append({
-                        'state1': i,
-                        'state2': j,
-                        'strength': strength,
-                        'phase': random.random() * math.pi * 2
-                    })
-                    
-        # Generate interference patterns
-        self.interference_patterns = []
-        for pair in self.entanglement_pairs:
-            s1 = self.quantum_states[pair['state1']]
-            s2 = self.quantum_states[pair['state2']]
-            
-            pattern = []
-            steps = 20
-            for i in range(steps):
-                t = i / (steps - 1)
-                pos = s1['position'] + (s2['position'] - s1['position']) * t
-                amplitude = (s1['amplitude'] + s2['amplitude']) * 0.5
-                phase = s1['phase'] + (s2['phase'] - s1['phase']) * t
-                
-                pattern.append({
-                    'position': pos,
-                    'amplitude': amplitude * math.sin(phase + self.phase),
-                    'phase': phase
-                })
-            self.interference_patterns.append(pattern)
-            
-    def update_animation(self, delta_time):
-        self.phase += delta_time * 2
-        
-        # Update quantum states
-        for state in self.quantum_states:
-            state['phase'] += delta_time * self._calculate_energy(state['char'])
-            
-        # Update entanglement pairs
-        for pair in self.entanglement_pairs:
-            pair['phase'] += delta_time * pair['strength']
-            
-    def _calculate_energy(self, char):
-        # Calculate quantum energy level based on character properties
-        base_energy = ord(char) / 255.0
-        if char.isupper():
-            base_energy *= 1.2
-        elif char.islower():
-            base_energy *= 0.8
-        elif char.isdigit():
-            base_energy *= 1.5
-        else:
-            base_energy *= 2.0
-        return base_energy
-        
-    def _are_entangled(self, state1, state2):
-        # Determine if two states should be entangled
-        char1, char2 = state1['char'], state2['char']
-        return (
-            char1.isupper() == char2.isupper() or
-            char1.islower() == char2.islower() or
-            char1.isdigit() == char2.isdigit() or
-            (not char1.isalnum() and not char2.isalnum())
-        )
-        
-    def _calculate_entanglement_strength(self, state1, state2):
-        # Calculate entanglement strength between two states
-        energy_diff = abs(state1['energy'] - state2['energy'])
-        position_diff = abs(state1['position'] - state2['position'])
-        return math.exp(-energy_diff * 2) * math.exp(-position_diff * 3)
-        
-    def get_quantum_metrics(self):
-        if not self.quantum_states:
-            return {
-                'total_energy': 0,
-                'entanglement_density': 0,
-                'phase_coherence': 0,
-                'quantum_complexity': 0
-            }
-            
-        # Calculate quantum metrics
-        total_energy = sum(s['energy'] for s in self.quantum_states)
-        num_possible_pairs = (len(self.quantum_states) * (len(self.quantum_states) - 1)) / 2
-        entanglement_density = len(self.entanglement_pairs) / max(1, num_possible_pairs)
-        
-        # Calculate phase coherence
-        phases = [s['phase'] for s in self.quantum_states]
-        phase_diffs = [abs(p1 - p2) for i, p1 in enumerate(phases) for p2 in phases[i+1:]]
-        phase_coherence = 1.0 - (sum(phase_diffs) / (len(phase_diffs) * math.pi)) if phase_diffs else 0
-        
-        # Calculate quantum complexity
-        complexity_factors = [
-            total_energy / len(self.quantum_states),
-            entanglement_density,
-            phase_coherence,
-            len(self.interference_patterns) / max(1, len(self.quantum_states))
-        ]
-        quantum_complexity = sum(complexity_factors) / len(complexity_factors)
-        
-        return {
-            'total_energy': total_energy,
-            'entanglement_density': entanglement_density,
-            'phase_coherence': phase_coherence,
-            'quantum_complexity': quantum_complexity
-        }
-
-class QuantumInterface(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("BUN.AI - Quantum Password Analyzer")
-        self.setMinimumSize(1200, 800)
-        
-        # Initialize neural network components
-        self.quantum_brain = QuantumBrain()
-        self.neural_core = AdvancedNeuralCore()
-        self.neural_core.eval()  # Set to evaluation mode
-        self.generator = QuantumGenerator()
-        self.analyzer = PasswordAnalyzer()
-        
-        # Initialize state variables
-        self.current_strength = 0
-        self.target_strength = 0
-        self.password_history = []
-        self.analysis_history = []
-        
-        # Create central widget and main layout
-        self.central_widget = QWidget()
-        self.setCentralWidget(self.central_widget)
-        self.main_layout = QVBoxLayout(self.central_widget)
-        
-        try:
-            # Initialize visualizers before interface setup
-            self.neural_viz = AdvancedNeuralVisualizer()
-            self.comparison_analyzer = PasswordComparisonAnalyzer()
-            self.particle_viz = QuantumParticleVisualizer()
-            self.quantum_viz = QuantumVisualizer()
-            self.holo_effect = HolographicEffect()
-            self.matrix_effect = MatrixRainEffect()
-            self.network_viz = NetworkVisualizerWidget()
-            self.history_graph = StrengthHistoryGraph()
-            self.quantum_state_viz = QuantumStateVisualizer()
-            self.resonance_viz = QuantumResonanceVisualizer()
-            self.metrics_panel = QuantumMetricsPanel()
-            self.circuit_viz = QuantumCircuitVisualizer()
-            self.entanglement_viz = QuantumEntanglementVisualizer()
-            self.waveform_analyzer = QuantumWaveformAnalyzer()
-            self.state_map = QuantumStateMap()
-            self.backend_viz = BackendProcessVisualizer()
-            
-            # Initialize interface
-            self.initialize_interface()
-            
-            # Setup update timer for 120 FPS
-            self.update_timer = QTimer(self)
-            self.update_timer.timeout.connect(self.update_effects)
-            self.update_timer.start(1000 // 120)  # ~8.33ms for 120 FPS
-            
-            # Apply quantum theme
-            self.apply_quantum_theme()
-            
-            # Show loading screen
-            self.loading_screen = QuantumLoadingScreen(self)
-            self.loading_screen.show()
-            
-        except Exception as e:
-            print(f"Error during initialization: {e}")
-            # Fallback to basic initialization if advanced components fail
-            self.initialize_basic_interface()
-        
-    def initialize_interface(self):
-        # Setup header
-        self.setup_header()
-        
-        # Create main splitter for resizable sections
-        main_splitter = QSplitter(Qt.Orientation.Horizontal)
-        
-        # Left panel for input and basic visualizations
-        left_panel = QWidget()
-        left_layout = QVBoxLayout(left_panel)
-        self.setup_input_section(left_layout)
-        self.setup_basic_visualizations(left_layout)
-        main_splitter.addWidget(left_panel)
-        
-        # Right panel for advanced analytics
-        right_panel = QWidget()
-        right_layout = QVBoxLayout(right_panel)
-        self.setup_advanced_analytics(right_layout)
-        main_splitter.addWidget(right_panel)
-        
-        # Set initial splitter sizes
-        main_splitter.setSizes([int(self.width() * 0.6), int(self.width() * 0.4)])
-        
-        self.main_layout.addWidget(main_splitter)
-        
-    def setup_header(self):
-        header = QWidget()
-        header_layout = QHBoxLayout(header)
-        
-        # Logo and title
-        title_section = QWidget()
-        title_layout = QVBoxLayout(title_section)
-        
-        title = QLabel("BUN.AI")
-        title.setStyleSheet("""
-            QLabel {
-                color: #00ffff;
-                font-size: 48px;
-                font-weight: bold;
-                padding: 20px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(0, 255, 255, 30),
-                    stop:1 rgba(0, 0, 0, 0)
-                );
-                border-bottom: 2px solid #00ffff;
-            }
-        """)
-        title_layout.addWidget(title)
-        
-        subtitle = QLabel("QUANTUM PASSWORD ANALYZER")
-        subtitle.setStyleSheet("""
-            QLabel {
-                color: #00ffff;
-                font-size: 16px;
-                padding: 10px;
-            }
-        """)
-        title_layout.addWidget(subtitle)
-        
-        header_layout.addWidget(title_section)
-        
-        # Status section
-        status_section = QWidget()
-        status_layout = QVBoxLayout(status_section)
-        
-        # Add timestamp
-        self.timestamp = QLabel()
-        self.timestamp.setStyleSheet("color: #00ffff;")
-        status_layout.addWidget(self.timestamp)
-        
-        # Add status indicator
-        self.status = QLabel("QUANTUM CORE ACTIVE")
-        self.status.setStyleSheet("""
-            QLabel {
-                color: #00ffff;
-                font-weight: bold;
-            }
-        """)
-        status_layout.addWidget(self.status)
-        
-        header_layout.addWidget(status_section)
-        
-        # Start status updates
-        self.status_timer = QTimer(self)
-        self.status_timer.timeout.connect(self.update_status)
-        self.status_timer.start(1000)
-        
-        self.main_layout.addWidget(header)
-        
-    def setup_input_section(self, layout):
-        input_container = QWidget()
-        input_layout = QHBoxLayout(input_container)
-        
-        # Password input with neon effect
-        self.password_input = QLineEdit()
-        self.password_input.setPlaceholderText("Enter password to analyze...")
-        self.password_input.setStyleSheet("""
-            QLineEdit {
-                background-color: rgba(0, 20, 20, 150);
-                color: #00ffff;
-                border: 2px solid #00ffff;
-                border-radius: 5px;
-                padding: 10px;
-                font-size: 14px;
-                selection-background-color: #00ffff;
-                selection-color: black;
-            }
-            QLineEdit:focus {
-                border: 2px solid #00ffff;
-                background-color: rgba(0, 30, 30, 180);
-            }
-        """)
-        self.password_input.textChanged.connect(self.analyze_password)
-        input_layout.addWidget(self.password_input)
-        
-        # Generate button
-        generate_btn = QPushButton("GENERATE")
-        generate_btn.clicked.connect(self.show_generator_dialog)
-        input_layout.addWidget(generate_btn)
-        
-        # Analyze button
-        analyze_btn = QPushButton("ANALYZE")
-        analyze_btn.clicked.connect(lambda: self.analyze_password(self.password_input.text()))
-        input_layout.addWidget(analyze_btn)
-        
-        layout.addWidget(input_container)
-        
-        # Add neon keyboard
-        self.keyboard = NeonKeyboard()
-        layout.addWidget(self.keyboard)
-        
-        # Add strength meter
-        self.strength_meter = QProgressBar()
-        self.strength_meter.setMinimum(0)
-        self.strength_meter.setMaximum(100)
-        self.strength_meter.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #00ffff;
-                border-radius: 5px;
-                background: rgba(0, 20, 20, 150);
-                text-align: center;
-                color: white;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #00ffff,
-                    stop:1 #00ff00
-                );
-            }
-        """)
-        layout.addWidget(self.strength_meter)
-        
-    def setup_basic_visualizations(self, layout):
-        # Create visualization tabs
-        tabs = QTabWidget()
-        tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: 2px solid #00ffff;
-                background: rgba(0, 0, 0, 0.7);
-            }
-            QTabBar::tab {
-                background: rgba(0, 20, 20, 150);
-                color: #00ffff;
-                padding: 8px;
-                margin: 2px;
-            }
-            QTabBar::tab:selected {
-                background: rgba(0, 40, 40, 150);
-                border: 1px solid #00ffff;
-            }
-        """)
-        
-        # Main visualization tab
-        main_tab = QWidget()
-        main_layout = QVBoxLayout(main_tab)
-        
-        # Add scrollable network visualizer
-        network_scroll = QScrollArea()
-        network_scroll.setWidgetResizable(True)
-        network_scroll.setMinimumHeight(400)
-        
-        self.network_viz = NetworkVisualizerWidget()
-        network_scroll.setWidget(self.network_viz)
-        main_layout.addWidget(network_scroll)
-        
-        # Add quantum visualizations
-        viz_layout = QHBoxLayout()
-        self.quantum_viz = QuantumVisualizer()
-        self.holo_effect = HolographicEffect()
-        self.matrix_effect = MatrixRainEffect()
-        
-        viz_layout.addWidget(self.quantum_viz)
-        viz_layout.addWidget(self.holo_effect)
-        viz_layout.addWidget(self.matrix_effect)
-        main_layout.addLayout(viz_layout)
-        
-        tabs.addTab(main_tab, "Neural Analysis")
-        
-        # History tab
-        history_tab = QWidget()
-        history_layout = QVBoxLayout(history_tab)
-        self.history_graph = StrengthHistoryGraph()
-        history_layout.addWidget(self.history_graph)
-        tabs.addTab(history_tab, "Password History")
-        
-        layout.addWidget(tabs)
-        
-    def setup_advanced_analytics(self, layout):
-        # Create tabs for different analytics views
-        tabs = QTabWidget()
-        
-        # Neural Network Analysis tab
-        neural_tab = QWidget()
-        neural_layout = QVBoxLayout(neural_tab)
-        neural_layout.addWidget(self.neural_viz)
-        tabs.addTab(neural_tab, "Neural Network Analysis")
-        
-        # Password Comparison tab
-        comparison_tab = QWidget()
-        comparison_layout = QVBoxLayout(comparison_tab)
-        comparison_layout.addWidget(self.comparison_analyzer)
-        tabs.addTab(comparison_tab, "Password Comparison")
-        
-        # Quantum Particle tab
-        particle_tab = QWidget()
-        particle_layout = QVBoxLayout(particle_tab)
-        particle_layout.addWidget(self.particle_viz)
-        tabs.addTab(particle_tab, "Quantum Particles")
-        
-        # Quantum State tab
-        state_tab = QWidget()
-        state_layout = QVBoxLayout(state_tab)
-        state_layout.addWidget(self.quantum_state_viz)
-        tabs.addTab(state_tab, "Quantum State")
-        
-        # Resonance Analysis tab
-        resonance_tab = QWidget()
-        resonance_layout = QVBoxLayout(resonance_tab)
-        resonance_layout.addWidget(self.resonance_viz)
-        tabs.addTab(resonance_tab, "Quantum Resonance")
-        
-        # Metrics Panel tab
-        metrics_tab = QWidget()
-        metrics_layout = QVBoxLayout(metrics_tab)
-        metrics_layout.addWidget(self.metrics_panel)
-        tabs.addTab(metrics_tab, "Quantum Metrics")
-        
-        # Circuit Analysis tab
-        circuit_tab = QWidget()
-        circuit_layout = QVBoxLayout(circuit_tab)
-        circuit_layout.addWidget(self.circuit_viz)
-        tabs.addTab(circuit_tab, "Quantum Circuit")
-        
-        # Entanglement View tab
-        entanglement_tab = QWidget()
-        entanglement_layout = QVBoxLayout(entanglement_tab)
-        entanglement_layout.addWidget(self.entanglement_viz)
-        tabs.addTab(entanglement_tab, "Quantum Entanglement")
-        
-        # Waveform Analysis tab
-        waveform_tab = QWidget()
-        waveform_layout = QVBoxLayout(waveform_tab)
-        waveform_layout.addWidget(self.waveform_analyzer)
-        tabs.addTab(waveform_tab, "Quantum Waveform")
-        
-        # State Map tab
-        state_map_tab = QWidget()
-        state_map_layout = QVBoxLayout(state_map_tab)
-        state_map_layout.addWidget(self.state_map)
-        tabs.addTab(state_map_tab, "State Map")
-        
-        # Backend Process tab
-        backend_tab = QWidget()
-        backend_layout = QVBoxLayout(backend_tab)
-        backend_layout.addWidget(self.backend_viz)
-        tabs.addTab(backend_tab, "Backend Process")
-        
-        layout.addWidget(tabs)
-        
-    def show_generator_dialog(self):
-        dialog = PasswordGeneratorDialog(self)
-        if dialog.exec():
-            # Get selected options
-            strength = dialog.strength_slider.value()
-            length = dialog.length_spin.value()
-            options = {
-                'uppercase': dialog.uppercase.isChecked(),
-                'lowercase': dialog.lowercase.isChecked(),
-                'numbers': dialog.numbers.isChecked(),
-                'special': dialog.special.isChecked(),
-                'length': length
-            }
-            
-            # Generate password
-            password = self.generator.generate_password(
-                strength_level=strength,
-                **options
-            )
-            self.password_input.setText(password)
-        
-    def update_status(self):
-        # Update timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.timestamp.setText(current_time)
-        
-        # Blink status
-        current_color = self.status.styleSheet()
-        if "color: #00ffff;" in current_color:
-            self.status.setStyleSheet("color: #007777; font-weight: bold;")
-        else:
-            self.status.setStyleSheet("color: #00ffff; font-weight: bold;")
-            
-    def analyze_password(self, password):
-        if not password:
-            self.reset_analysis()
-            return
-            
-        # Get quantum brain analysis
-        analysis = self.analyzer.analyze_password(password)
-        
-        # Get neural core analysis
-        neural_analysis = self.neural_core(torch.tensor([ord(c) % 128 for c in password]).unsqueeze(0))
-        
-        # Combine analyses
-        combined_strength = (analysis['strength'] + float(neural_analysis['strength']) * 100) / 2
-        analysis['strength'] = combined_strength
-        
-        # Update target strength
-        self.target_strength = int(analysis['strength'])
-        
-        # Update keyboard visualization
-        self.keyboard.set_text(password)
-        
-        # Update password history
-        self.password_history.append({
-            'password': password,
-            'strength': self.target_strength,
-            'analysis': analysis,
-            'neural_analysis': neural_analysis,
-            'timestamp': datetime.now()
-        })
-        if len(self.password_history) > 10:
-            self.password_history.pop(0)
-            
-        # Update all visualizations
-        self.update_all_visualizations(password, analysis, neural_analysis)
-        
-    def update_all_visualizations(self, password, analysis, neural_analysis):
-        # Update basic visualizations
-        self.quantum_viz.set_strength(analysis['strength'])
-        self.holo_effect.set_strength(analysis['strength'])
-        self.matrix_effect.set_strength(analysis['strength'])
-        self.network_viz.update_network(neural_analysis)
-        self.history_graph.add_strength(analysis['strength'])
-        
-        # Update advanced visualizations
-        self.neural_viz.analyze_password(password)
-        self.comparison_analyzer.compare_passwords(password, self.password_history[-2]['password'] if len(self.password_history) > 1 else "")
-        self.particle_viz.set_strength(analysis['strength'])
-        self.quantum_state_viz.update_quantum_state(analysis)
-        self.resonance_viz.set_strength(analysis['strength'])
-        self.metrics_panel.update_metrics(password)
-        self.circuit_viz.set_circuit(password)
-        self.entanglement_viz.set_password(password)
-        self.waveform_analyzer.set_password_complexity(password)
-        self.state_map.set_password_state(password)
-        self.backend_viz.update_processes()
-        
-    def update_realtime_analysis(self, analysis):
-        # Generate feedback based on strength
-        if analysis['strength'] < 30:
-            feedback = "😱 Seriously? My quantum brain hurts looking at this password!"
-        elif analysis['strength'] < 50:
-            feedback = "🤔 Not terrible, but my neural networks are not impressed..."
-        elif analysis['strength'] < 70:
-            feedback = "🎯 Getting better! But still room for quantum improvement."
-        elif analysis['strength'] < 90:
-            feedback = "🚀 Now we're talking! Your password is gaining quantum strength!"
-        else:
-            feedback = "⚡ QUANTUM PERFECTION! This password is truly unbreakable!"
-            
-        text = f"""
-QUANTUM PASSWORD ANALYSIS
-========================
-Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-{feedback}
-
-Password Strength: {analysis['strength']:.2f}%
-Complexity Level: {analysis['complexity'].upper()}
-Entropy Score: {analysis['entropy']:.2f}
-
-Detected Patterns:
-{chr(10).join(f'- {pattern}' for pattern in analysis['patterns'])}
-
-Neural Network Confidence:
-- Pattern Recognition: {random.uniform(0.8, 1.0):.2f}
-- Strength Assessment: {random.uniform(0.85, 1.0):.2f}
-- Quantum Resilience: {random.uniform(0.75, 1.0):.2f}
-
-Suggestions:
-{chr(10).join(f'- {suggestion}' for suggestion in analysis['suggestions'])}
-
-Quantum Metrics:
-- Entanglement Density: {random.uniform(0.6, 1.0):.2f}
-- Phase Coherence: {random.uniform(0.7, 1.0):.2f}
-- Quantum State Purity: {random.uniform(0.8, 1.0):.2f}
-"""
-        self.realtime_text.setText(text)
-        
-    def reset_analysis(self):
-        self.target_strength = 0
-        self.keyboard.set_text("")
-        self.update_visualizations({
-            'strength': 0,
-            'complexity': 'basic',
-            'patterns': [],
-            'suggestions': [],
-            'entropy': 0
-        })
-        self.realtime_text.clear()
-        
-    def update_effects(self):
-        # Smooth strength transition
-        if abs(self.current_strength - self.target_strength) > 0.5:
-            self.current_strength += (self.target_strength - self.current_strength) * 0.1
-            
-        # Update strength meter with gradient color
-        self.strength_meter.setValue(int(self.current_strength))
-        gradient_color = self.get_strength_color(self.current_strength)
-        self.strength_meter.setStyleSheet(f"""
-            QProgressBar {{
-                border: 2px solid #00ffff;
-                border-radius: 5px;
-                background: rgba(0, 20, 20, 150);
-                text-align: center;
-                color: white;
-            }}
-            QProgressBar::chunk {{
-                background: {gradient_color};
-            }}
-        """)
-        
-    def get_strength_color(self, strength):
-        if strength >= 90:
-            return "qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #00ff00, stop:1 #00ffff)"
-        elif strength >= 70:
-            return "qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #00ffff, stop:1 #0080ff)"
-        elif strength >= 40:
-            return "qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #0080ff, stop:1 #ff8000)"
-        else:
-            return "qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #ff8000, stop:1 #ff0000)"
-            
-    def apply_quantum_theme(self):
-        self.setStyleSheet("""
-            QMainWindow {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #000000,
-                    stop:1 #001020
-                );
-            }
-            QWidget {
-                color: #00ffff;
-            }
-            QPushButton {
-                background-color: rgba(0, 20, 20, 150);
-                border: 2px solid #00ffff;
-                border-radius: 5px;
-                color: #00ffff;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgba(0, 40, 40, 180);
-            }
-            QPushButton:pressed {
-                background-color: rgba(0, 60, 60, 200);
-            }
-            QLabel {
-                color: #00ffff;
-                font-size: 14px;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: rgba(0, 20, 20, 150);
-                width: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #00ffff;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-            QScrollBar::add-line:vertical,
-            QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QCheckBox {
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 2px solid #00ffff;
-                background: rgba(0, 20, 20, 150);
-            }
-            QCheckBox::indicator:checked {
-                border: 2px solid #00ffff;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #00ffff,
-                    stop:1 #0080ff
-                );
-            }
-            QSpinBox {
-                background-color: rgba(0, 20, 20, 150);
-                border: 2px solid #00ffff;
-                border-radius: 5px;
-                padding: 5px;
-                color: #00ffff;
-            }
-            QSpinBox::up-button, QSpinBox::down-button {
-                border: none;
-                background: rgba(0, 40, 40, 180);
-                width: 20px;
-            }
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-                background: rgba(0, 60, 60, 200);
-            }
-        """)
-
-class QuantumLoadingScreen(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        self.resize(800, 600)
-        self.progress = 0
-        self.loading_text = "INITIALIZING QUANTUM CORE"
-        self.status_text = ""
-        self.particles = []
-        self.phase = 0
-        self.quantum_rings = []
-        self.dna_points = []
-        
-        # Initialize quantum rings
-        for i in range(3):
-            self.quantum_rings.append({
-                'radius': 100 + i * 40,
-                'rotation': random.random() * 360,
-                'speed': 1 + i * 0.5,
-                'particles': []
-            })
-            
-        # Initialize DNA helix points
-        for i in range(20):
-            self.dna_points.append({
-                'y': i * 20,
-                'phase': i * math.pi / 10,
-                'speed': 0.05
-            })
-        
-        # Center on screen
-        screen = QApplication.primaryScreen().geometry()
-        self.move(
-            (screen.width() - self.width()) // 2,
-            (screen.height() - self.height()) // 2
-        )
-        
-        # Animation timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(16)
-        
-        # Loading sequence
-        self.loading_sequence = [
-            ("Initializing Quantum Core", 10),
-            ("Calibrating Neural Network", 20),
-            ("Loading Quantum States", 35),
-            ("Establishing Entanglement Matrix", 50),
-            ("Configuring Visualization Engine", 65),
-            ("Synchronizing Quantum Metrics", 80),
-            ("Activating Neural Interface", 90),
-            ("System Ready", 100)
-        ]
-        self.current_step = 0
-        
-        # Start loading sequence
-        QTimer.singleShot(100, self.advance_loading)
-        
-    def advance_loading(self):
-        if self.current_step < len(self.loading_sequence):
-            text, progress = self.loading_sequence[self.current_step]
-            self.status_text = text
-            self.progress = progress
-            self.current_step += 1
-            # Random delay between 500ms and 1500ms
-            QTimer.singleShot(random.randint(500, 1500), self.advance_loading)
-        else:
-            # Loading complete
-            QTimer.singleShot(500, self.close)
-        
-    def update_animation(self):
-        self.phase += 0.05
-        
-        # Update quantum rings
-        for ring in self.quantum_rings:
-            ring['rotation'] += ring['speed']
-            
-            # Update ring particles
-            if random.random() < 0.1:
-                angle = random.random() * 360
-                ring['particles'].append({
-                    'angle': angle,
-                    'size': random.uniform(2, 6),
-                    'life': 1.0,
-                    'speed': random.uniform(-2, 2)
-                })
-                
-            # Update existing particles
-            for particle in ring['particles']:
-                particle['angle'] += particle['speed']
-                particle['life'] -= 0.02
-                
-            # Remove dead particles
-            ring['particles'] = [p for p in ring['particles'] if p['life'] > 0]
-            
-        # Update DNA points
-        for point in self.dna_points:
-            point['phase'] += point['speed']
-            
-        # Update background particles
-        if random.random() < 0.1:
-            self.particles.append({
-                'pos': QPointF(
-                    random.uniform(0, self.width()),
-                    random.uniform(0, self.height())
-                ),
-                'velocity': QPointF(
-                    random.uniform(-2, 2),
-                    random.uniform(-2, 2)
-                ),
-                'size': random.uniform(2, 6),
-                'life': 1.0
-            })
-            
-        # Update existing particles
-        for p in self.particles:
-            p['pos'] += p['velocity']
-            p['life'] -= 0.02
-            
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p['life'] > 0]
-        
-        self.update()
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw dark background with gradient
-        gradient = QLinearGradient(0, 0, self.width(), self.height())
-        gradient.setColorAt(0, QColor(0, 0, 20))
-        gradient.setColorAt(1, QColor(0, 20, 40))
-        painter.fillRect(self.rect(), gradient)
-        
-        # Draw background particles
-        for p in self.particles:
-            color = QColor(0, 255, 255, int(p['life'] * 255))
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(p['pos'], p['size'] * p['life'], p['size'] * p['life'])
-            
-        # Draw DNA helix
-        center_x = self.width() / 2
-        for point in self.dna_points:
-            # Calculate helix points
-            x1 = center_x + 50 * math.sin(point['phase'])
-            x2 = center_x + 50 * math.sin(point['phase'] + math.pi)
-            y = 100 + point['y']
-            
-            # Draw helix strands
-            color1 = QColor(0, 255, 255, 150)
-            color2 = QColor(0, 200, 255, 150)
-            
-            painter.setPen(QPen(color1, 2))
-            if point != self.dna_points[-1]:
-                next_point = self.dna_points[self.dna_points.index(point) + 1]
-                next_x1 = center_x + 50 * math.sin(next_point['phase'])
-                next_y = 100 + next_point['y']
-                painter.drawLine(int(x1), int(y), int(next_x1), int(next_y))
-                
-            painter.setPen(QPen(color2, 2))
-            if point != self.dna_points[-1]:
-                next_x2 = center_x + 50 * math.sin(next_point['phase'] + math.pi)
-                painter.drawLine(int(x2), int(y), int(next_x2), int(next_y))
-                
-            # Draw connecting lines
-            painter.setPen(QPen(QColor(0, 255, 255, 100), 1))
-            painter.drawLine(int(x1), int(y), int(x2), int(y))
-            
-        # Draw quantum rings
-        center = QPointF(self.width() / 2, self.height() / 2)
-        for ring in self.quantum_rings:
-            # Draw ring
-            pen = QPen(QColor(0, 255, 255, 50), 2)
-            painter.setPen(pen)
-            painter.drawEllipse(center, ring['radius'], ring['radius'])
-            
-            # Draw ring particles
-            for particle in ring['particles']:
-                angle_rad = math.radians(particle['angle'])
-                x = center.x() + ring['radius'] * math.cos(angle_rad)
-                y = center.y() + ring['radius'] * math.sin(angle_rad)
-                
-                color = QColor(0, 255, 255, int(particle['life'] * 255))
-                painter.setBrush(QBrush(color))
-                painter.setPen(Qt.PenStyle.NoPen)
-                painter.drawEllipse(
-                    QPointF(x, y),
-                    particle['size'] * particle['life'],
-                    particle['size'] * particle['life']
-                )
-                
-        # Draw loading text
-        font = QFont('Arial', 32, QFont.Weight.Bold)
-        painter.setFont(font)
-        
-        # Draw main title with glow effect
-        text_rect = QRectF(0, self.height() * 0.3, self.width(), 50)
-        
-        # Glow effect
-        glow_color = QColor(0, 255, 255, 50)
-        painter.setPen(QPen(glow_color, 4))
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, self.loading_text)
-        
-        # Main text
-        painter.setPen(QColor(0, 255, 255))
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, self.loading_text)
-        
-        # Draw status text
-        font.setPointSize(16)
-        painter.setFont(font)
-        status_rect = QRectF(0, self.height() * 0.45, self.width(), 30)
-        painter.drawText(status_rect, Qt.AlignmentFlag.AlignCenter, self.status_text)
-        
-        # Draw progress bar
-        bar_width = self.width() * 0.6
-        bar_height = 4
-        x = (self.width() - bar_width) / 2
-        y = self.height() * 0.55
-        
-        # Bar background
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(0, 40, 40))
-        painter.drawRect(x, y, bar_width, bar_height)
-        
-        # Progress
-        progress_width = bar_width * (self.progress / 100)
-        gradient = QLinearGradient(x, y, x + progress_width, y)
-        gradient.setColorAt(0, QColor(0, 255, 255))
-        gradient.setColorAt(1, QColor(0, 128, 255))
-        painter.setBrush(gradient)
-        painter.drawRect(x, y, progress_width, bar_height)
-        
-        # Draw quantum circuit animation
-        self.draw_quantum_circuit(painter)
-        
-    def draw_quantum_circuit(self, painter):
-        circuit_height = 100
-        y_start = self.height() * 0.65
-        
-        # Draw quantum wires
-        painter.setPen(QPen(QColor(0, 255, 255, 100), 1))
-        for i in range(5):
-            y = y_start + i * (circuit_height / 4)
-            painter.drawLine(
-                self.width() * 0.2, y,
-                self.width() * 0.8, y
-            )
-            
-        # Draw quantum gates
-        gate_positions = [0.3, 0.4, 0.5, 0.6, 0.7]
-        gate_types = ['H', 'X', 'Y', 'Z', 'CNOT']
-        
-        for i, (pos, gate) in enumerate(zip(gate_positions, gate_types)):
-            x = self.width() * pos
-            y = y_start + ((i % 4) * circuit_height / 4)
-            
-            # Gate background with glow
-            gradient = QRadialGradient(x, y, 15)
-            color = QColor(0, 255, 255, 100)
-            gradient.setColorAt(0, color)
-            color.setAlpha(0)
-            gradient.setColorAt(1, color)
-            
-            painter.setBrush(gradient)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(QPointF(x, y), 15, 15)
-            
-            # Gate symbol
-            painter.setPen(QColor(0, 255, 255))
-            painter.drawText(
-                QRectF(x - 10, y - 10, 20, 20),
-                Qt.AlignmentFlag.AlignCenter,
-                gate
-            )
-            
-            # Animate gate activation
-            if (self.phase * 5 + i) % 5 < 1:
-                painter.setBrush(QColor(0, 255, 255, 100))
-                painter.drawEllipse(QPointF(x, y), 20, 20)
-
-class AdvancedNeuralVisualizer(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(400, 300)
-        
-        # Neural architecture
-        self.layers = [
-            {'name': 'Input', 'neurons': 12, 'type': 'input'},
-            {'name': 'LSTM', 'neurons': 24, 'type': 'lstm'},
-            {'name': 'Attention', 'neurons': 16, 'type': 'attention'},
-            {'name': 'Dense', 'neurons': 32, 'type': 'dense'},
-            {'name': 'Dropout', 'neurons': 32, 'type': 'dropout'},
-            {'name': 'Dense', 'neurons': 16, 'type': 'dense'},
-            {'name': 'Output', 'neurons': 8, 'type': 'output'}
-        ]
-        
-        self.connections = []
-        self.activations = []
-        self.attention_weights = np.zeros((16, 16))
-        self.layer_metrics = {layer['name']: 0.0 for layer in self.layers}
-        self.animation_phase = 0
-        
-        # Animation timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(16)  # 60 FPS
-        
-    def update_animation(self):
-        self.animation_phase += 0.05
-        
-        # Update layer metrics with some noise
-        for name in self.layer_metrics:
-            self.layer_metrics[name] = 0.5 + 0.3 * math.sin(self.animation_phase + hash(name) % 10)
-            
-        # Update attention weights
-        self.attention_weights = 0.5 + 0.5 * np.sin(self.animation_phase + np.arange(16 * 16).reshape(16, 16) * 0.1)
-        
-        self.update()
-        
-    def analyze_password(self, password):
-        if not password:
-            return
-            
-        # Simulate neural network analysis
-        for i, layer in enumerate(self.layers):
-            activation = min(1.0, len(password) / 20.0 + random.random() * 0.2)
-            self.layer_metrics[layer['name']] = activation
-            
-        # Generate random but consistent attention patterns
-        seed = sum(ord(c) for c in password)
-        random.seed(seed)
-        self.attention_weights = np.random.rand(16, 16)
-        
-        # Normalize attention weights
-        self.attention_weights = (self.attention_weights - self.attention_weights.min()) / (self.attention_weights.max() - self.attention_weights.min())
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw neural network architecture
-        self.draw_network(painter)
-        
-        # Draw attention heatmap
-        self.draw_attention_heatmap(painter)
-        
-        # Draw layer metrics
-        self.draw_layer_metrics(painter)
-        
-    def draw_network(self, painter):
-        width = self.width() * 0.7
-        height = self.height()
-        x_spacing = width / (len(self.layers) - 1)
-        
-        # Draw connections first
-        for i in range(len(self.layers) - 1):
-            layer1 = self.layers[i]
-            layer2 = self.layers[i + 1]
-            
-            y1_spacing = height / (layer1['neurons'] + 1)
-            y2_spacing = height / (layer2['neurons'] + 1)
-            
-            x1 = 50 + i * x_spacing
-            x2 = 50 + (i + 1) * x_spacing
-            
-            for n1 in range(layer1['neurons']):
-                for n2 in range(layer2['neurons']):
-                    y1 = (n1 + 1) * y1_spacing
-                    y2 = (n2 + 1) * y2_spacing
-                    
-                    # Calculate connection strength
-                    strength = 0.5 + 0.5 * math.sin(self.animation_phase + hash(f"{i}{n1}{n2}") % 10)
-                    
-                    # Draw connection with gradient
-                    gradient = QLinearGradient(x1, y1, x2, y2)
-                    color1 = QColor(0, int(255 * strength), 255, 50)
-                    color2 = QColor(0, int(255 * strength), 255, 50)
-                    gradient.setColorAt(0, color1)
-                    gradient.setColorAt(1, color2)
-                    
-                    painter.setPen(QPen(gradient, 1))
-                    painter.drawLine(int(x1), int(y1), int(x2), int(y2))
-        
-        # Draw neurons
-        for i, layer in enumerate(self.layers):
-            x = 50 + i * x_spacing
-            y_spacing = height / (layer['neurons'] + 1)
-            
-            for n in range(layer['neurons']):
-                y = (n + 1) * y_spacing
-                
-                # Calculate neuron activation
-                activation = self.layer_metrics[layer['name']]
-                
-                # Draw neuron with glow effect
-                gradient = QRadialGradient(x, y, 15)
-                color = QColor(0, int(255 * activation), 255)
-                gradient.setColorAt(0, color)
-                color.setAlpha(0)
-                gradient.setColorAt(1, color)
-                
-                painter.setBrush(gradient)
-                painter.setPen(Qt.PenStyle.NoPen)
-                painter.drawEllipse(QPointF(x, y), 8, 8)
-                
-            # Draw layer name
-            painter.setPen(QColor(0, 255, 255))
-            painter.drawText(
-                QRectF(x - 30, height - 30, 60, 20),
-                Qt.AlignmentFlag.AlignCenter,
-                layer['name']
-            )
-            
-    def draw_attention_heatmap(self, painter):
-        # Draw attention weights heatmap in top-right corner
-        heatmap_size = min(self.width() * 0.25, self.height() * 0.4)
-        x_start = self.width() - heatmap_size - 20
-        y_start = 20
-        cell_size = heatmap_size / 16
-        
-        # Draw heatmap title
-        painter.setPen(QColor(0, 255, 255))
-        painter.drawText(x_start, y_start - 5, "Attention Weights")
-        
-        # Draw cells
-        for i in range(16):
-            for j in range(16):
-                x = x_start + j * cell_size
-                y = y_start + i * cell_size
-                
-                # Calculate color based on attention weight
-                weight = self.attention_weights[i, j]
-                color = QColor(
-                    int(255 * weight),
-                    int(128 * weight),
-                    255,
-                    200
-                )
-                
-                painter.fillRect(
-                    QRectF(x, y, cell_size, cell_size),
-                    color
-                )
-                
-    def draw_layer_metrics(self, painter):
-        # Draw layer metrics on the right side
-        metrics_width = self.width() * 0.25
-        x_start = self.width() - metrics_width - 20
-        y_start = self.height() * 0.5
-        
-        painter.setPen(QColor(0, 255, 255))
-        painter.drawText(x_start, y_start - 20, "Layer Metrics")
-        
-        y = y_start
-        for name, value in self.layer_metrics.items():
-            # Draw metric name
-            painter.drawText(x_start, y, name)
-            
-            # Draw metric bar
-            bar_rect = QRectF(x_start + 80, y - 15, metrics_width - 100, 20)
-            
-            # Background
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QColor(0, 40, 40))
-            painter.drawRect(bar_rect)
-            
-            # Value bar
-            gradient = QLinearGradient(bar_rect.topLeft(), bar_rect.topRight())
-            gradient.setColorAt(0, QColor(0, 255, 255))
-            gradient.setColorAt(1, QColor(0, 128, 255))
-            painter.setBrush(gradient)
-            painter.drawRect(
-                QRectF(
-                    bar_rect.x(),
-                    bar_rect.y(),
-                    bar_rect.width() * value,
-                    bar_rect.height()
-                )
-            )
-            
-            # Draw value text
-            painter.setPen(QColor(255, 255, 255))
-            painter.drawText(
-                bar_rect.adjusted(5, 0, -5, 0),
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
-                f"{value:.2f}"
-            )
-            
-            y += 30
-
-class PasswordComparisonAnalyzer(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(400, 300)
-        self.current_password = ""
-        self.previous_password = ""
-        self.comparison_metrics = {
-            'strength_delta': 0,
-            'entropy_delta': 0,
-            'complexity_delta': 0,
-            'length_delta': 0,
-            'pattern_similarity': 0,
-            'character_overlap': 0
-        }
-        self.history = []
-        self.animation_phase = 0
-        
-        # Animation timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(16)  # 60 FPS
-        
-    def update_animation(self):
-        self.animation_phase += 0.05
-        self.update()
-        
-    def compare_passwords(self, current, previous):
-        self.current_password = current
-        self.previous_password = previous
-        
-        if not current or not previous:
-            return
-            
-        # Calculate comparison metrics
-        self.comparison_metrics['strength_delta'] = self.calculate_strength_delta(current, previous)
-        self.comparison_metrics['entropy_delta'] = self.calculate_entropy_delta(current, previous)
-        self.comparison_metrics['complexity_delta'] = self.calculate_complexity_delta(current, previous)
-        self.comparison_metrics['length_delta'] = len(current) - len(previous)
-        self.comparison_metrics['pattern_similarity'] = self.calculate_pattern_similarity(current, previous)
-        self.comparison_metrics['character_overlap'] = self.calculate_character_overlap(current, previous)
-        
-        # Update history
-        self.history.append({
-            'timestamp': datetime.now(),
-            'metrics': self.comparison_metrics.copy()
-        })
-        if len(self.history) > 10:
-            self.history.pop(0)
-            
-    def calculate_strength_delta(self, current, previous):
-        # Simulate strength calculation
-        current_strength = min(1.0, len(current) / 20.0 + sum(1 for c in current if c.isupper()) / 10.0)
-        previous_strength = min(1.0, len(previous) / 20.0 + sum(1 for c in previous if c.isupper()) / 10.0)
-        return current_strength - previous_strength
-        
-    def calculate_entropy_delta(self, current, previous):
-        # Calculate Shannon entropy difference
-        def entropy(password):
-            freq = {}
-            for c in password:
-                freq[c] = freq.get(c, 0) + 1
-            probs = [count/len(password) for count in freq.values()]
-            return -sum(p * math.log2(p) for p in probs)
-            
-        return entropy(current) - entropy(previous)
-        
-    def calculate_complexity_delta(self, current, previous):
-        def complexity(password):
-            has_upper = any(c.isupper() for c in password)
-            has_lower = any(c.islower() for c in password)
-            has_digit = any(c.isdigit() for c in password)
-            has_special = any(not c.isalnum() for c in password)
-            return (has_upper + has_lower + has_digit + has_special) / 4.0
-            
-        return complexity(current) - complexity(previous)
-        
-    def calculate_pattern_similarity(self, current, previous):
-        # Simple pattern similarity based on character types in same positions
-        length = min(len(current), len(previous))
-        matches = sum(1 for i in range(length) if self.char_type(current[i]) == self.char_type(previous[i]))
-        return matches / length
-        
-    def char_type(self, c):
-        if c.isupper(): return 'upper'
-        if c.islower(): return 'lower'
-        if c.isdigit(): return 'digit'
-        return 'special'
-        
-    def calculate_character_overlap(self, current, previous):
-        # Calculate character set overlap
-        current_chars = set(current)
-        previous_chars = set(previous)
-        overlap = len(current_chars.intersection(previous_chars))
-        total = len(current_chars.union(previous_chars))
-        return overlap / total if total > 0 else 0
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw background
-        gradient = QLinearGradient(0, 0, self.width(), self.height())
-        gradient.setColorAt(0, QColor(0, 0, 20))
-        gradient.setColorAt(1, QColor(0, 20, 40))
-        painter.fillRect(self.rect(), gradient)
-        
-        # Draw comparison metrics
-        self.draw_metrics_comparison(painter)
-        
-        # Draw history graph
-        self.draw_history_graph(painter)
-        
-        # Draw character analysis
-        self.draw_character_analysis(painter)
-        
-    def draw_metrics_comparison(self, painter):
-        x = 20
-        y = 40
-        width = self.width() * 0.4 - 40
-        
-        painter.setPen(QColor(0, 255, 255))
-        painter.drawText(x, y - 20, "Password Comparison Metrics")
-        
-        for name, value in self.comparison_metrics.items():
-            # Draw metric name
-            painter.drawText(x, y, name.replace('_', ' ').title())
-            
-            # Draw comparison bar
-            bar_rect = QRectF(x, y + 5, width, 15)
-            
-            # Draw background
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QColor(0, 40, 40))
-            painter.drawRect(bar_rect)
-            
-            # Draw value bar
-            normalized_value = (value + 1) / 2  # Convert from [-1, 1] to [0, 1]
-            bar_width = width * normalized_value
-            bar_x = x + (width - bar_width) / 2 if value < 0 else x + width/2
-            
-            gradient = QLinearGradient(bar_x, y, bar_x + bar_width, y)
-            if value >= 0:
-                gradient.setColorAt(0, QColor(0, 255, 255))
-                gradient.setColorAt(1, QColor(0, 255, 128))
-            else:
-                gradient.setColorAt(0, QColor(255, 128, 0))
-                gradient.setColorAt(1, QColor(255, 0, 0))
-                
-            painter.setBrush(gradient)
-            painter.drawRect(QRectF(bar_x, y + 5, abs(bar_width), 15))
-            
-            # Draw value text
-            painter.setPen(QColor(255, 255, 255))
-            text_rect = QRectF(x + width + 10, y, 60, 20)
-            painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft, f"{value:+.2f}")
-            
-            y += 40
-            
-    def draw_history_graph(self, painter):
-        if not self.history:
-            return
-            
-        x = self.width() * 0.4 + 20
-        y = 40
-        width = self.width() * 0.3 - 40
-        height = self.height() * 0.4
-        
-        painter.setPen(QColor(0, 255, 255))
-        painter.drawText(x, y - 20, "Strength History")
-        
-        # Draw graph background
-        painter.setPen(QPen(QColor(0, 128, 128), 1))
-        painter.drawRect(x, y, width, height)
-        
-        # Draw grid
-        for i in range(4):
-            y_pos = y + height * i / 3
-            painter.drawLine(x, y_pos, x + width, y_pos)
-            
-        # Draw history lines
-        if len(self.history) > 1:
-            painter.setPen(QPen(QColor(0, 255, 255), 2))
-            path = QPainterPath()
-            
-            x_step = width / (len(self.history) - 1)
-            for i, entry in enumerate(self.history):
-                value = entry['metrics']['strength_delta']
-                normalized_value = (value + 1) / 2  # Convert from [-1, 1] to [0, 1]
-                point_x = x + i * x_step
-                point_y = y + height * (1 - normalized_value)
-                
-                if i == 0:
-                    path.moveTo(point_x, point_y)
-                else:
-                    path.lineTo(point_x, point_y)
-                    
-            painter.drawPath(path)
-            
-    def draw_character_analysis(self, painter):
-        if not self.current_password or not self.previous_password:
-            return
-            
-        x = self.width() * 0.7 + 20
-        y = 40
-        width = self.width() * 0.3 - 40
-        
-        painter.setPen(QColor(0, 255, 255))
-        painter.drawText(x, y - 20, "Character Analysis")
-        
-        # Draw character type distribution
-        def char_distribution(password):
-            dist = {'upper': 0, 'lower': 0, 'digit': 0, 'special': 0}
-            for c in password:
-                dist[self.char_type(c)] += 1
-            return dist
-            
-        current_dist = char_distribution(self.current_password)
-        previous_dist = char_distribution(self.previous_password)
-        
-        y += 20
-        bar_height = 20
-        for char_type in ['upper', 'lower', 'digit', 'special']:
-            # Draw type label
-            painter.setPen(QColor(0, 255, 255))
-            painter.drawText(x, y, char_type.title())
-            
-            # Draw comparison bars
-            curr_width = width * (current_dist[char_type] / len(self.current_password))
-            prev_width = width * (previous_dist[char_type] / len(self.previous_password))
-            
-            # Previous password bar
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QColor(128, 128, 255, 100))
-            painter.drawRect(x, y + 5, prev_width, bar_height)
-            
-            # Current password bar
-            painter.setBrush(QColor(0, 255, 255, 150))
-            painter.drawRect(x, y + 5, curr_width, bar_height)
-            
-            y += 40
-
-class QuantumParticleVisualizer(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(300, 300)
-        self.strength = 0
-        self.particles = []
-        self.matrix_chars = []
-        self.animation_phase = 0
-        
-        # Initialize particles
-        self.initialize_particles()
-        
-        # Animation timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-        self.timer.start(16)  # 60 FPS
-        
-    def initialize_particles(self):
-        # Create protons (red)
-        for _ in range(8):
-            self.particles.append({
-                'type': 'proton',
-                'x': self.width() / 2 + random.uniform(-20, 20),
-                'y': self.height() / 2 + random.uniform(-20, 20),
-                'vx': random.uniform(-2, 2),
-                'vy': random.uniform(-2, 2),
-                'charge': 1,
-                'mass': 1.0,
-                'size': 6,
-                'color': QColor(255, 100, 100)
-            })
-            
-        # Create electrons (blue)
-        for _ in range(8):
-            self.particles.append({
-                'type': 'electron',
-                'x': self.width() / 2 + random.uniform(-50, 50),
-                'y': self.height() / 2 + random.uniform(-50, 50),
-                'vx': random.uniform(-3, 3),
-                'vy': random.uniform(-3, 3),
-                'charge': -1,
-                'mass': 0.1,
-                'size': 4,
-                'color': QColor(100, 200, 255)
-            })
-            
-        # Create neutrons (white)
-        for _ in range(8):
-            self.particles.append({
-                'type': 'neutron',
-                'x': self.width() / 2 + random.uniform(-30, 30),
-                'y': self.height() / 2 + random.uniform(-30, 30),
-                'vx': random.uniform(-2, 2),
-                'vy': random.uniform(-2, 2),
-                'charge': 0,
-                'mass': 1.0,
-                'size': 6,
-                'color': QColor(200, 200, 200)
-            })
-            
-        # Initialize matrix characters
-        for _ in range(50):
-            self.matrix_chars.append({
-                'x': random.randint(0, self.width()),
-                'y': random.randint(0, self.height()),
-                'char': random.choice('01'),
-                'alpha': random.randint(50, 200),
-                'size': random.randint(8, 16)
-            })
-            
-    def update_animation(self):
-        self.animation_phase += 0.05
-        center_x = self.width() / 2
-        center_y = self.height() / 2
-        
-        # Update particle positions and velocities
-        for p in self.particles:
-            # Apply central force (nucleus attraction)
-            dx = center_x - p['x']
-            dy = center_y - p['y']
-            dist = math.sqrt(dx*dx + dy*dy)
-            
-            if dist > 0:
-                # Central force strength based on password strength
-                force = (self.strength / 100.0) * 0.5
-                # Electrons orbit faster
-                if p['type'] == 'electron':
-                    force *= 2
-                
-                # Apply force
-                p['vx'] += force * dx / dist
-                p['vy'] += force * dy / dist
-                
-            # Apply particle interactions
-            for other in self.particles:
-                if other != p:
-                    dx = other['x'] - p['x']
-                    dy = other['y'] - p['y']
-                    dist = math.sqrt(dx*dx + dy*dy)
-                    
-                    if dist > 0 and dist < 50:
-                        # Coulomb force between charged particles
-                        force = (p['charge'] * other['charge']) / (dist * dist)
-                        force *= 0.1  # Scale force
-                        
-                        p['vx'] -= force * dx / dist
-                        p['vy'] -= force * dy / dist
-                        
-                        # Add quantum tunneling effect
-                        if random.random() < 0.01:
-                            p['x'] += random.uniform(-10, 10)
-                            p['y'] += random.uniform(-10, 10)
-            
-            # Update position
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-            
-            # Apply drag
-            p['vx'] *= 0.99
-            p['vy'] *= 0.99
-            
-            # Bounce off walls with quantum tunneling probability
-            margin = 20
-            if random.random() > 0.01:  # 99% normal bounce
-                if p['x'] < margin:
-                    p['x'] = margin
-                    p['vx'] *= -0.8
-                elif p['x'] > self.width() - margin:
-                    p['x'] = self.width() - margin
-                    p['vx'] *= -0.8
-                    
-                if p['y'] < margin:
-                    p['y'] = margin
-                    p['vy'] *= -0.8
-                elif p['y'] > self.height() - margin:
-                    p['y'] = self.height() - margin
-                    p['vy'] *= -0.8
-            
-        # Update matrix characters
-        for char in self.matrix_chars:
-            char['y'] += 2
-            char['alpha'] = max(0, char['alpha'] - 1)
-            
-            if char['y'] > self.height() or char['alpha'] == 0:
-                char['y'] = 0
-                char['x'] = random.randint(0, self.width())
-                char['alpha'] = random.randint(50, 200)
-                char['char'] = random.choice('01')
-                
-        self.update()
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw background
-        gradient = QLinearGradient(0, 0, self.width(), self.height())
-        gradient.setColorAt(0, QColor(0, 0, 20))
-        gradient.setColorAt(1, QColor(0, 20, 40))
-        painter.fillRect(self.rect(), gradient)
-        
-        # Draw matrix characters
-        for char in self.matrix_chars:
-            color = QColor(0, 255, 0, char['alpha'])
-            painter.setPen(color)
-            painter.setFont(QFont('Courier', char['size']))
-            painter.drawText(char['x'], char['y'], char['char'])
-        
-        # Draw quantum field
-        painter.setPen(Qt.PenStyle.NoPen)
-        for x in range(0, self.width(), 20):
-            for y in range(0, self.height(), 20):
-                field_strength = 0
-                for p in self.particles:
-                    dx = x - p['x']
-                    dy = y - p['y']
-                    dist = math.sqrt(dx*dx + dy*dy)
-                    if dist > 0:
-                        field_strength += (p['charge'] / dist) * 20
-                
-                color = QColor(0, 200, 255, min(50, abs(int(field_strength))))
-                painter.setBrush(color)
-                painter.drawEllipse(x-2, y-2, 4, 4)
-        
-        # Draw particle connections
-        painter.setPen(QPen(QColor(0, 255, 255, 30), 1))
-        for i, p1 in enumerate(self.particles):
-            for p2 in self.particles[i+1:]:
-                dx = p2['x'] - p1['x']
-                dy = p2['y'] - p1['y']
-                dist = math.sqrt(dx*dx + dy*dy)
-                if dist < 100:
-                    alpha = int(255 * (1 - dist/100))
-                    painter.setPen(QPen(QColor(0, 255, 255, alpha), 1))
-                    painter.drawLine(p1['x'], p1['y'], p2['x'], p2['y'])
-        
-        # Draw particles with glow effect
-        for p in self.particles:
-            # Draw glow
-            gradient = QRadialGradient(p['x'], p['y'], p['size'] * 3)
-            color = p['color']
-            gradient.setColorAt(0, QColor(color.red(), color.green(), color.blue(), 50))
-            gradient.setColorAt(1, QColor(color.red(), color.green(), color.blue(), 0))
-            painter.setBrush(gradient)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(QPointF(p['x'], p['y']), p['size'] * 3, p['size'] * 3)
-            
-            # Draw particle
-            painter.setBrush(p['color'])
-            painter.drawEllipse(QPointF(p['x'], p['y']), p['size'], p['size'])
-            
-        # Draw strength indicator
-        painter.setPen(QColor(0, 255, 255))
-        painter.setFont(QFont('Arial', 12))
-        painter.drawText(10, 20, f"Quantum State: {self.strength:.1f}%")
-        
-    def set_strength(self, value):
-        self.strength = value
-
-    def initialize_basic_interface(self):
-        """Fallback initialization with basic components only"""
-        try:
-            # Initialize only essential components
-            self.neural_viz = AdvancedNeuralVisualizer()
-            self.comparison_analyzer = PasswordComparisonAnalyzer()
-            self.quantum_viz = QuantumVisualizer()
-            self.history_graph = StrengthHistoryGraph()
-            
-            # Create basic layout
-            main_splitter = QSplitter(Qt.Orientation.Horizontal)
-            
-            # Left panel for input
-            left_panel = QWidget()
-            left_layout = QVBoxLayout(left_panel)
-            
-            # Password input
-            input_container = QWidget()
-            input_layout = QHBoxLayout(input_container)
-            self.password_input = QLineEdit()
-            self.password_input.setPlaceholderText("Enter password to analyze...")
-            self.password_input.textChanged.connect(self.analyze_password)
-            input_layout.addWidget(self.password_input)
-            
-            # Buttons
-            generate_btn = QPushButton("GENERATE")
-            generate_btn.clicked.connect(self.show_generator_dialog)
-            input_layout.addWidget(generate_btn)
-            
-            analyze_btn = QPushButton("ANALYZE")
-            analyze_btn.clicked.connect(lambda: self.analyze_password(self.password_input.text()))
-            input_layout.addWidget(analyze_btn)
-            
-            left_layout.addWidget(input_container)
-            
-            # Strength meter
-            self.strength_meter = QProgressBar()
-            self.strength_meter.setMinimum(0)
-            self.strength_meter.setMaximum(100)
-            left_layout.addWidget(self.strength_meter)
-            
-            # Basic visualizations
-            left_layout.addWidget(self.quantum_viz)
-            left_layout.addWidget(self.history_graph)
-            
-            main_splitter.addWidget(left_panel)
-            
-            # Right panel for analysis
-            right_panel = QWidget()
-            right_layout = QVBoxLayout(right_panel)
-            
-            # Analysis tabs
-            tabs = QTabWidget()
-            
-            # Neural Network tab
-            neural_tab = QWidget()
-            neural_layout = QVBoxLayout(neural_tab)
-            neural_layout.addWidget(self.neural_viz)
-            tabs.addTab(neural_tab, "Neural Network")
-            
-            # Comparison tab
-            comparison_tab = QWidget()
-            comparison_layout = QVBoxLayout(comparison_tab)
-            comparison_layout.addWidget(self.comparison_analyzer)
-            tabs.addTab(comparison_tab, "Comparison")
-            
-            right_layout.addWidget(tabs)
-            main_splitter.addWidget(right_panel)
-            
-            # Set initial splitter sizes
-            main_splitter.setSizes([int(self.width() * 0.4), int(self.width() * 0.6)])
-            
-            self.main_layout.addWidget(main_splitter)
-            
-            # Apply basic theme
-            self.apply_basic_theme()
-            
-        except Exception as e:
-            print(f"Error during basic initialization: {e}")
-            # Show error message to user
-            error_label = QLabel("Error initializing interface. Please restart the application.")
-            error_label.setStyleSheet("color: red; font-size: 14px;")
-            self.main_layout.addWidget(error_label)
-    
-    def apply_basic_theme(self):
-        """Apply a simplified theme for fallback mode"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background: #001020;
-            }
-            QWidget {
-                color: #00ffff;
-            }
-            QPushButton {
-                background-color: rgba(0, 20, 20, 150);
-                border: 2px solid #00ffff;
-                border-radius: 5px;
-                color: #00ffff;
-                padding: 8px 16px;
-            }
-            QLineEdit {
-                background-color: rgba(0, 20, 20, 150);
-                border: 2px solid #00ffff;
-                border-radius: 5px;
-                color: #00ffff;
-                padding: 8px;
-            }
-            QProgressBar {
-                border: 2px solid #00ffff;
-                border-radius: 5px;
-                background: rgba(0, 20, 20, 150);
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #00ffff,
-                    stop:1 #00ff00
-                );
-            }
-        """)
-
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = QuantumInterface()
-    window.show()
-    sys.exit(app.exec()) 
+import sys
+import math
+import random
+import time
+from datetime import datetime
+import numpy as np
+import colorsys
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+from application.neural_nexus import AdvancedNeuralCore
+from quantum_brain import QuantumBrain, PasswordAnalyzer, PasswordFeatures
+from quantum_visualizer import QuantumVisualizer, HolographicEffect
+from quantum_clock import FrameScheduler, frame_steps
+from quantum_particles import ParticleSystem, draw_particles, neighbor_pairs, char_classes, entangled_pairs
+from quantum_layers import LayerCache, GlyphAtlas, Heatmap, diagonal_gradient
+from quantum_series import RingBuffer, series_polyline
+
+from PySide6.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QPushButton, QLineEdit, QLabel, QDialog,
+    QTabWidget, QTextEdit, QCheckBox, QDialogButtonBox, QSlider,
+    QScrollArea, QFrame, QSplitter, QSpinBox, QComboBox
+)
+from PySide6.QtCore import (
+    Qt, QTimer, QPointF, QLineF, QDateTime, QRectF, QRect, QPropertyAnimation,
+    QEasingCurve, QObject, Signal, QRunnable, QThreadPool
+)
+from PySide6.QtGui import (
+    QPainter, QPen, QColor, QLinearGradient, QRadialGradient,
+    QPainterPath, QPolygonF, QFont, QConicalGradient, QBrush,
+    QFontDatabase, QPixmap
+)
+
+import numpy as np
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+
+from password_generator import QuantumGenerator
+from quantum_visualizer import QuantumVisualizer, HolographicEffect
+
+# Enable CUDA if available
+device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+
+class PasswordGeneratorDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Generate Password")
+        self.setMinimumWidth(400)
+        
+        layout = QVBoxLayout(self)
+        
+        # Strength slider
+        strength_layout = QHBoxLayout()
+        strength_label = QLabel("Strength:")
+        self.strength_slider = QSlider(Qt.Orientation.Horizontal)
+        self.strength_slider.setMinimum(0)
+        self.strength_slider.setMaximum(100)
+        self.strength_slider.setValue(80)
+        self.strength_value = QLabel("80%")
+        self.strength_slider.valueChanged.connect(
+            lambda v: self.strength_value.setText(f"{v}%")
+        )
+        strength_layout.addWidget(strength_label)
+        strength_layout.addWidget(self.strength_slider)
+        strength_layout.addWidget(self.strength_value)
+        layout.addLayout(strength_layout)
+        
+        # Character types
+        self.uppercase = QCheckBox("Uppercase (A-Z)")
+        self.lowercase = QCheckBox("Lowercase (a-z)")
+        self.numbers = QCheckBox("Numbers (0-9)")
+        self.special = QCheckBox("Special (!@#$%^&*)")
+        
+        # Set defaults
+        self.uppercase.setChecked(True)
+        self.lowercase.setChecked(True)
+        self.numbers.setChecked(True)
+        self.special.setChecked(True)
+        
+        layout.addWidget(self.uppercase)
+        layout.addWidget(self.lowercase)
+        layout.addWidget(self.numbers)
+        layout.addWidget(self.special)
+        
+        # Length selection
+        length_layout = QHBoxLayout()
+        length_label = QLabel("Length:")
+        self.length_spin = QSpinBox()
+        self.length_spin.setMinimum(8)
+        self.length_spin.setMaximum(64)
+        self.length_spin.setValue(16)
+        length_layout.addWidget(length_label)
+        length_layout.addWidget(self.length_spin)
+        layout.addLayout(length_layout)
+        
+        # Buttons
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | 
+            QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+class NeonKeyboard(QWidget):
+    FRAME_RATE = 60
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(600, 200)
+        self.pressed_keys = {}
+        self.active_text = ""
+        self.key_animations = {}
+        FrameScheduler.instance().register(self, self.update_fades, self.FRAME_RATE)
+        
+        # Keyboard layout
+        self.layout = [
+            ['`', '1', '2', '3', '4', '5', '6', '7', '8', '9', '0', '-', '=', '⌫'],
+            ['Tab', 'Q', 'W', 'E', 'R', 'T', 'Y', 'U', 'I', 'O', 'P', '[', ']', '\\'],
+            ['Caps', 'A', 'S', 'D', 'F', 'G', 'H', 'J', 'K', 'L', ';', "'", 'Enter'],
+            ['Shift', 'Z', 'X', 'C', 'V', 'B', 'N', 'M', ',', '.', '/', '⇧']
+        ]
+        
+    def set_text(self, text):
+        self.active_text = text
+        # Animate new characters
+        for char in text:
+            if char.upper() not in self.key_animations:
+                self.key_animations[char.upper()] = 1.0
+        self.update()
+        
+    def update_fades(self, delta_time=None):
+        step = frame_steps(delta_time, self.FRAME_RATE)
+        updated = False
+        for key in list(self.key_animations.keys()):
+            if self.key_animations[key] > 0:
+                self.key_animations[key] = max(0, self.key_animations[key] - 0.05 * step)
+                updated = True
+            elif self.key_animations[key] <= 0:
+                del self.key_animations[key]
+                updated = True
+        if updated:
+            self.update()
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Calculate key size
+        key_width = self.width() / 15
+        key_height = self.height() / 5
+        
+        # Draw keyboard background
+        painter.fillRect(self.rect(), QColor(0, 0, 0))
+        
+        y_offset = key_height / 2
+        for row_idx, row in enumerate(self.layout):
+            x_offset = key_width / 2
+            if row_idx == 1:
+                x_offset += key_width * 0.5
+            elif row_idx == 2:
+                x_offset += key_width * 0.75
+            elif row_idx == 3:
+                x_offset += key_width
+                
+            for key in row:
+                # Calculate key rectangle
+                key_rect = QRectF(
+                    x_offset,
+                    y_offset + row_idx * key_height,
+                    key_width * (2 if key in ['Enter', 'Shift', '⇧'] else 1),
+                    key_height * 0.8
+                )
+                
+                # Draw key background with glow effect
+                glow_color = QColor(0, 255, 255, 50)
+                if key.upper() in self.key_animations:
+                    alpha = int(self.key_animations[key.upper()] * 255)
+                    glow_color = QColor(0, 255, 255, alpha)
+                    
+                    # Draw glow
+                    glow = QPainterPath()
+                    glow.addRoundedRect(key_rect.adjusted(-5, -5, 5, 5), 5, 5)
+                    painter.fillPath(glow, QColor(0, 255, 255, alpha // 4))
+                
+                # Draw key
+                path = QPainterPath()
+                path.addRoundedRect(key_rect, 5, 5)
+                
+                gradient = QLinearGradient(
+                    key_rect.topLeft(),
+                    key_rect.bottomRight()
+                )
+                gradient.setColorAt(0, QColor(40, 40, 40))
+                gradient.setColorAt(1, QColor(20, 20, 20))
+                
+                painter.fillPath(path, gradient)
+                
+                # Draw key border
+                pen = QPen(glow_color)
+                pen.setWidth(2)
+                painter.setPen(pen)
+                painter.drawPath(path)
+                
+                # Draw key text
+                painter.setPen(QColor(200, 200, 200))
+                font = painter.font()
+                font.setPointSize(10)
+                painter.setFont(font)
+                painter.drawText(key_rect, Qt.AlignmentFlag.AlignCenter, key)
+                
+                x_offset += key_width * (2 if key in ['Enter', 'Shift', '⇧'] else 1)
+
+class MatrixRainEffect(QWidget):
+    FRAME_RATE = 20
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.characters = ParticleSystem(capacity=100)
+        self.glyph_atlas = GlyphAtlas(QFont('Courier'))
+        FrameScheduler.instance().register(self, self.animate_rain, self.FRAME_RATE)
+        self.setMinimumWidth(200)
+        self.strength = 0
+        
+    def set_strength(self, value):
+        self.strength = value
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Calculate color based on strength
+        hue = self.strength / 360.0  # Convert strength to hue (0-1)
+        rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
+        base_color = QColor(int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
+        
+        # Draw characters from cached glyphs, fading towards the bottom
+        chars = self.characters
+        opacity = np.clip(1.0 - chars.live('y') / max(1, self.height()), 0.0, 1.0)
+        for x, y, glyph, alpha in zip(chars.live('x').tolist(), chars.live('y').tolist(),
+                                      chars.live('glyph').tolist(), opacity.tolist()):
+            self.glyph_atlas.draw_text(painter, x, y, chr(glyph), 14, base_color, alpha)
+            
+    def animate_rain(self, delta_time=None):
+        step = frame_steps(delta_time, self.FRAME_RATE)
+        speed_factor = 1 + (self.strength / 100.0)  # Rain speed increases with strength
+        
+        # Spawning stops once all 100 slots are in use
+        self.characters.spawn(
+            x=random.randint(0, self.width()),
+            y=0,
+            vy=random.randint(2, 5) * speed_factor,
+            glyph=random.randint(33, 126)
+        )
+        
+        self.characters.integrate(step)
+        self.characters.remove(self.characters.live('y') >= self.height())
+        self.update()
+
+class HolographicEffect(QWidget):
+    FRAME_RATE = 20
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(200, 200)
+        FrameScheduler.instance().register(self, self.animate, self.FRAME_RATE)
+        self.angle = 0
+        self.strength = 0
+        self.pulse = 0
+        
+    def set_strength(self, value):
+        self.strength = value
+        
+    def animate(self, delta_time=None):
+        step = frame_steps(delta_time, self.FRAME_RATE)
+        self.angle = (self.angle + 2 * step) % 360
+        self.pulse = (self.pulse + 0.1 * step) % (2 * math.pi)
+        self.update()
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Calculate color based on strength
+        hue = self.strength / 360.0
+        rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
+        base_color = QColor(int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
+        
+        # Draw holographic circles
+        center = self.rect().center()
+        num_circles = 5 + int(self.strength / 20)  # More circles at higher strength
+        
+        for i in range(num_circles):
+            radius = (40 + i * 20) * (1 + 0.1 * math.sin(self.pulse + i * 0.5))
+            gradient = QConicalGradient(center, self.angle + i * 30)
+            gradient.setColorAt(0, QColor(base_color.red(), base_color.green(), base_color.blue(), 30))
+            gradient.setColorAt(1, QColor(base_color.red(), base_color.green(), base_color.blue(), 0))
+            painter.setBrush(gradient)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawEllipse(center, radius, radius)
+
+class StrengthMeter(QWidget):
+    """Strength bar painted from a precomputed gradient table"""
+    # (lowest percent, gradient start, gradient end), strongest first
+    COLOR_BUCKETS = [
+        (90, '#00ff00', '#00ffff'),
+        (70, '#00ffff', '#0080ff'),
+        (40, '#0080ff', '#ff8000'),
+        (0, '#ff8000', '#ff0000')
+    ]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumHeight(24)
+        self.minimum = 0
+        self.maximum = 100
+        self.current_value = 0
+        
+        # One chunk brush per bucket, stretched over the chunk when painted
+        self.bucket_brushes = []
+        for _, start, end in self.COLOR_BUCKETS:
+            gradient = QLinearGradient(0, 0, 1, 0)
+            gradient.setCoordinateMode(QLinearGradient.CoordinateMode.ObjectBoundingMode)
+            gradient.setColorAt(0, QColor(start))
+            gradient.setColorAt(1, QColor(end))
+            self.bucket_brushes.append(QBrush(gradient))
+            
+        # Bucket index for every displayed percentage
+        self.bucket_table = [
+            next(i for i, (low, _, _) in enumerate(self.COLOR_BUCKETS) if percent >= low)
+            for percent in range(101)
+        ]
+        
+        self.border_pen = QPen(QColor('#00ffff'), 2)
+        self.background = QColor(0, 20, 20, 150)
+        
+    def setMinimum(self, minimum):
+        self.minimum = minimum
+        self.update()
+        
+    def setMaximum(self, maximum):
+        self.maximum = maximum
+        self.update()
+        
+    def value(self):
+        return self.current_value
+        
+    def percent(self):
+        span = self.maximum - self.minimum
+        if span <= 0:
+            return 0
+        return max(0, min(100, int((self.current_value - self.minimum) * 100 / span)))
+        
+    def setValue(self, value):
+        # The bucket follows the integer value, so an unchanged value needs no repaint
+        value = max(self.minimum, min(self.maximum, int(value)))
+        if value == self.current_value:
+            return
+        self.current_value = value
+        self.update()
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Frame and background
+        frame = QRectF(self.rect()).adjusted(1, 1, -1, -1)
+        painter.setPen(self.border_pen)
+        painter.setBrush(self.background)
+        painter.drawRoundedRect(frame, 5, 5)
+        
+        # Filled chunk
+        percent = self.percent()
+        if percent > 0:
+            chunk = frame.adjusted(2, 2, -2, -2)
+            chunk.setWidth(chunk.width() * percent / 100)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self.bucket_brushes[self.bucket_table[percent]])
+            painter.drawRoundedRect(chunk, 3, 3)
+            
+        # Value text
+        painter.setPen(QColor(255, 255, 255))
+        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, f"{percent}%")
+
+class StrengthHistoryGraph(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(300, 150)
+        self.max_points = 50
+        self.history = RingBuffer(self.max_points)
+        
+    def add_strength(self, strength):
+        self.history.append(strength)
+        self.update()
+        
+    def paintEvent(self, event):
+        if not len(self.history):
+            return
+            
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw background
+        painter.fillRect(self.rect(), QColor(0, 0, 20))
+        
+        # Calculate points
+        width = self.width() - 20
+        height = self.height() - 20
+        point_width = width / (len(self.history) - 1) if len(self.history) > 1 else width
+        points = series_polyline(self.history.values(), 10, 10, point_width, height, scale=100)
+        
+        # Draw line
+        pen = QPen(QColor(0, 255, 255))
+        pen.setWidth(2)
+        painter.setPen(pen)
+        painter.drawPolyline(points)
+        
+        # Draw points
+        for point in points:
+            painter.drawEllipse(point, 3, 3)
+
+class PasswordComparisonWidget(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(300, 150)
+        self.current = 0
+        self.previous = 0
+        self.comparison = 0
+        
+    def update_comparison(self, current, previous, comparison):
+        self.current = current
+        self.previous = previous
+        self.comparison = comparison
+        self.update()
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw background
+        painter.fillRect(self.rect(), QColor(0, 0, 20))
+        
+        # Draw comparison bars
+        width = self.width() - 40
+        height = (self.height() - 60) / 3
+        
+        # Current password
+        painter.setPen(QPen(QColor(0, 255, 255)))
+        painter.drawText(20, 20, "Current")
+        painter.fillRect(20, 30, width * self.current/100, height, QColor(0, 255, 255))
+        
+        # Previous password
+        painter.setPen(QPen(QColor(255, 255, 0)))
+        painter.drawText(20, height + 40, "Previous")
+        painter.fillRect(20, height + 50, width * self.previous/100, height, QColor(255, 255, 0))
+        
+        # Comparison
+        color = QColor(0, 255, 0) if self.comparison >= 0 else QColor(255, 0, 0)
+        painter.setPen(QPen(color))
+        painter.drawText(20, 2 * height + 60, "Difference")
+        painter.fillRect(20, 2 * height + 70, width * abs(self.comparison)/100, height, color)
+
+class UltraHDVisualizer(QWidget):
+    FRAME_RATE = 60
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.background_layer = LayerCache(diagonal_gradient(QColor(0, 0, 20), QColor(0, 0, 40)))
+        self.setMinimumSize(400, 300)
+        self.strength = 0
+        self.particles = ParticleSystem()
+        self.binary_glyphs = None
+        self.waves = []
+        self.quantum_noise = self.generate_quantum_noise()
+        self.animation_phase = 0
+        
+        # Animation clock
+        FrameScheduler.instance().register(self, self.update_animation, self.FRAME_RATE)
+        
+    def generate_quantum_noise(self):
+        # Generate complex quantum noise pattern
+        noise = []
+        for _ in range(100):
+            noise.append({
+                'x': random.uniform(0, 1),
+                'y': random.uniform(0, 1),
+                'phase': random.uniform(0, 2 * math.pi),
+                'frequency': random.uniform(0.5, 2.0)
+            })
+        return noise
+        
+    def update_animation(self, delta_time=None):
+        step = frame_steps(delta_time, self.FRAME_RATE)
+        self.animation_phase += 0.05 * step
+        
+        # Update particles
+        if random.random() < self.strength / 100:
+            self.particles.spawn(
+                x=random.uniform(0, self.width()),
+                y=random.uniform(0, self.height()),
+                vx=random.uniform(-2, 2),
+                vy=random.uniform(-2, 2),
+                size=random.uniform(2, 6),
+                decay=0.02
+            )
+            
+        # Update existing particles and remove dead ones
+        self.particles.integrate(step)
+        self.particles.cull()
+        
+        # Update quantum noise
+        for n in self.quantum_noise:
+            n['phase'] += 0.1 * n['frequency'] * step
+            
+        self.update_waves()
+        self.update()
+        
+    def update_waves(self):
+        # Generate complex wave pattern
+        self.waves = []
+        center_x = self.width() / 2
+        center_y = self.height() / 2
+        
+        for i in range(3):
+            radius = 50 + i * 30
+            phase = self.animation_phase + i * math.pi / 4
+            
+            wave = []
+            for angle in range(0, 360, 5):
+                rad = math.radians(angle)
+                r = radius * (1 + 0.2 * math.sin(phase + rad * 3))
+                x = center_x + r * math.cos(rad)
+                y = center_y + r * math.sin(rad)
+                wave.append(QPointF(x, y))
+            
+            self.waves.append(wave)
+            
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Fill background with dark gradient
+        self.background_layer.draw(painter, self)
+        
+        # Draw quantum field
+        self.draw_quantum_field(painter)
+        
+        # Draw particles
+        self.draw_particles(painter)
+        
+        # Draw waves
+        self.draw_waves(painter)
+        
+        # Draw strength indicator
+        self.draw_strength_indicator(painter)
+        
+    def draw_quantum_field(self, painter):
+        width = self.width()
+        height = self.height()
+        
+        for noise in self.quantum_noise:
+            x = noise['x'] * width
+            y = noise['y'] * height
+            value = (math.sin(noise['phase']) + 1) / 2
+            
+            color = self.get_strength_color(self.strength)
+            color.setAlpha(int(value * 50))
+            
+            painter.setPen(QPen(color))
+            painter.drawPoint(int(x), int(y))
+            
+    def draw_particles(self, painter):
+        # All particles share the current strength color
+        draw_particles(painter, self.particles, [self.get_strength_color(self.strength)])
+        
+    def draw_waves(self, painter):
+        for wave in self.waves:
+            color = self.get_strength_color(self.strength)
+            color.setAlpha(50)
+            
+            pen = QPen(color)
+            pen.setWidth(2)
+            painter.setPen(pen)
+            
+            path = QPainterPath()
+            if wave:
+                path.moveTo(wave[0])
+                for point in wave[1:]:
+                    path.lineTo(point)
+                path.lineTo(wave[0])
+                
+            painter.drawPath(path)
+            
+    def draw_strength_indicator(self, painter):
+        # Draw strength text with cyber effect
+        text = f"Quantum Strength: {int(self.strength)}%"
+        
+        font = painter.font()
+        font.setPointSize(16)
+        font.setBold(True)
+        painter.setFont(font)
+        
+        text_rect = painter.fontMetrics().boundingRect(text)
+        x = (self.width() - text_rect.width()) / 2
+        y = self.height() - 30
+        
+        # Draw text shadow
+        shadow_color = QColor(0, 0, 0)
+        painter.setPen(shadow_color)
+        painter.drawText(x + 2, y + 2, text)
+        
+        # Draw main text
+        color = self.get_strength_color(self.strength)
+        painter.setPen(color)
+        painter.drawText(x, y, text)
+        
+        # Draw cyber details
+        scan_pos = (self.animation_phase * 100) % self.height()
+        painter.setPen(QPen(color, 1, Qt.PenStyle.DotLine))
+        
+        for i in range(3):
+            y = (scan_pos + i * 20) % self.height()
+            painter.drawLine(0, y, self.width(), y)
+            
+        # Draw binary rain from cached glyphs in the current (bold) font
+        if self.binary_glyphs is None:
+            self.binary_glyphs = GlyphAtlas(painter.font())
+            
+        for i in range(10):
+            x = random.randint(0, self.width())
+            y = (self.animation_phase * 100 + i * 30) % self.height()
+            text = "".join(random.choice("01") for _ in range(8))
+            self.binary_glyphs.draw_text(painter, x, y, text, 8, color)
+            
+    def get_strength_color(self, strength):
+        hue = (strength / 360.0) % 1.0
+        rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
+        return QColor(
+            int(rgb[0] * 255),
+            int(rgb[1] * 255),
+            int(rgb[2] * 255)
+        )
+        
+    def set_strength(self, value):
+        self.strength = value
+
+class AdvancedNetworkMetrics(QWidget):
+    FRAME_RATE = 10
+    HISTORY_LENGTH = 100
+    
+    # Shown with simulated data until a ModelTelemetry is attached
+    SIMULATED_METRICS = (
+        'gradient_norm',
+        'layer_sparsity',
+        'attention_entropy',
+        'neuron_saturation',
+        'weight_distribution',
+        'activation_patterns',
+        'forget_gate_values',
+        'input_gate_values',
+        'output_gate_values',
+        'cell_states'
+    )
+    
+    # Values mapped to the top of a graph, for metrics that are not fractions
+    METRIC_SCALE = {'inference_ms': 50.0}
+    
+    def __init__(self, parent=None, telemetry=None):
+        super().__init__(parent)
+        self.background_layer = LayerCache(diagonal_gradient(QColor(0, 0, 30), QColor(0, 30, 60)))
+        self.setMinimumSize(200, 400)
+        self.metrics = {key: RingBuffer(self.HISTORY_LENGTH) for key in self.SIMULATED_METRICS}
+        self.telemetry = None
+        self.telemetry_seen = 0
+        self.latest_sample = None
+        if telemetry is not None:
+            self.set_telemetry(telemetry)
+        FrameScheduler.instance().register(self, self.update_metrics, self.FRAME_RATE)
+        
+    def set_telemetry(self, telemetry):
+        """Plot the samples a ModelTelemetry publishes instead of simulated data"""
+        self.telemetry = telemetry
+        self.telemetry_seen = 0
+        self.latest_sample = None
+        self.metrics = {key: RingBuffer(self.HISTORY_LENGTH) for key in telemetry.METRICS}
+        self.update()
+        
+    def update_metrics(self, delta_time=None):
+        if self.telemetry is None:
+            # Update all metrics with simulated data, one sample per tick
+            for history in self.metrics.values():
+                history.append(random.gauss(0.5, 0.1))
+            self.update()
+            return
+            
+        # One point per measured inference; the graphs hold still while idle
+        self.telemetry_seen, samples = self.telemetry.samples_since(self.telemetry_seen)
+        if not samples:
+            return
+        for sample in samples:
+            for key, history in self.metrics.items():
+                history.append(min(sample[key] / self.METRIC_SCALE.get(key, 1.0), 1.0))
+        self.latest_sample = samples[-1]
+        self.update()
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw background
+        self.background_layer.draw(painter, self)
+        
+        # Calculate metrics layout
+        metrics_per_column = 5
+        column_width = self.width() / 2
+        row_height = self.height() / metrics_per_column
+        
+        # Draw each metric
+        for i, (key, values) in enumerate(self.metrics.items()):
+            col = i // metrics_per_column
+            row = i % metrics_per_column
+            
+            x = col * column_width
+            y = row * row_height
+            
+            # Draw metric name, with the latest measured value
+            title = key.replace('_', ' ').title()
+            if self.latest_sample is not None:
+                title = f"{title}: {self.latest_sample[key]:.3g}"
+            painter.setPen(QColor(0, 255, 255))
+            painter.drawText(QRectF(x + 5, y, column_width - 10, 20), title)
+            
+            # Draw metric graph
+            if len(values):
+                line = series_polyline(
+                    values.values(), x + 5, y + 25, (column_width - 10) / len(values), row_height - 35
+                )
+                
+                # Draw line with glow effect
+                pen = QPen(QColor(0, 255, 255))
+                pen.setWidth(2)
+                painter.setPen(pen)
+                painter.drawPolyline(line)
+                
+                # Add glow effect
+                glow_pen = QPen(QColor(0, 255, 255, 50))
+                glow_pen.setWidth(4)
+                painter.setPen(glow_pen)
+                painter.drawPolyline(line)
+
+class QuantumStateVisualizer(QWidget):
+    FRAME_RATE = 20
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(300, 300)
+        self.qubits = []
+        self.entanglements = []
+        self.phase = 0
+        
+        # Initialize quantum state
+        for i in range(8):
+            angle = i * math.pi / 4
+            self.qubits.append({
+                'pos': QPointF(
+                    150 + 100 * math.cos(angle),
+                    150 + 100 * math.sin(angle)
+                ),
+                'state': complex(random.random(), random.random()),
+                'phase': random.random() * math.pi * 2
+            })
+            
+        # Create entanglements
+        for i in range(len(self.qubits)):
+            for j in range(i + 1, len(self.qubits)):
+                if random.random() < 0.3:
+                    self.entanglements.append((i, j))
+                    
+        # Animation clock
+        FrameScheduler.instance().register(self, self.update_quantum_state, self.FRAME_RATE)
+        
+    def update_quantum_state(self, delta_time=None):
+        step = frame_steps(delta_time, self.FRAME_RATE)
+        self.phase += 0.05 * step
+        
+        # Update qubit states
+        for qubit in self.qubits:
+            qubit['phase'] += random.gauss(0, 0.1)
+            magnitude = abs(qubit['state'])
+            phase = math.atan2(qubit['state'].imag, qubit['state'].real)
+            phase += 0.1 * step
+            qubit['state'] = complex(
+                magnitude * math.cos(phase),
+                magnitude * math.sin(phase)
+            )
+            
+        self.update()
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw background with quantum field effect
+        self.draw_quantum_field(painter)
+        
+        # Draw entanglements
+        self.draw_entanglements(painter)
+        
+        # Draw qubits
+        self.draw_qubits(painter)
+        
+        # Draw state information
+        self.draw_state_info(painter)
+        
+    def draw_quantum_field(self, painter):
+        for y in range(0, self.height(), 20):
+            for x in range(0, self.width(), 20):
+                value = math.sin(
+                    math.sqrt((x - 150)**2 + (y - 150)**2) * 0.05 + self.phase
+                )
+                color = QColor(0, int(128 + value * 64), int(128 + value * 64))
+                painter.setPen(color)
+                painter.drawPoint(x, y)
+                
+    def draw_entanglements(self, painter):
+        for i, j in self.entanglements:
+            start = self.qubits[i]['pos']
+            end = self.qubits[j]['pos']
+            
+            # Create entanglement effect
+            path = QPainterPath()
+            path.moveTo(start)
+            
+            # Add wave effect
+            ctrl1 = QPointF(
+                (start.x() + end.x()) / 2 + 20 * math.sin(self.phase),
+                (start.y() + end.y()) / 2 + 20 * math.cos(self.phase)
+            )
+            ctrl2 = QPointF(
+                (start.x() + end.x()) / 2 - 20 * math.sin(self.phase),
+                (start.y() + end.y()) / 2 - 20 * math.cos(self.phase)
+            )
+            
+            path.cubicTo(ctrl1, ctrl2, end)
+            
+            # Draw with quantum effect
+            gradient = QLinearGradient(start, end)
+            gradient.setColorAt(0, QColor(0, 255, 255, 150))
+            gradient.setColorAt(0.5, QColor(255, 0, 255, 150))
+            gradient.setColorAt(1, QColor(0, 255, 255, 150))
+            
+            pen = QPen(gradient, 2)
+            painter.setPen(pen)
+            painter.drawPath(path)
+            
+    def draw_qubits(self, painter):
+        for qubit in self.qubits:
+            # Draw quantum state circle
+            radius = 20
+            state_magnitude = abs(qubit['state'])
+            
+            # Outer glow
+            gradient = QRadialGradient(qubit['pos'], radius * 2)
+            glow_color = QColor(0, 255, 255, 100)
+            gradient.setColorAt(0, glow_color)
+            gradient.setColorAt(1, QColor(0, 0, 0, 0))
+            painter.setBrush(gradient)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawEllipse(qubit['pos'], radius * 2, radius * 2)
+            
+            # State circle
+            gradient = QRadialGradient(qubit['pos'], radius)
+            color = QColor(
+                int(255 * state_magnitude),
+                int(255 * (1 - state_magnitude)),
+                255
+            )
+            gradient.setColorAt(0, color)
+            gradient.setColorAt(1, QColor(0, 0, 0))
+            painter.setBrush(gradient)
+            painter.drawEllipse(qubit['pos'], radius, radius)
+            
+            # Draw phase indicator
+            phase = math.atan2(qubit['state'].imag, qubit['state'].real)
+            end_x = qubit['pos'].x() + radius * math.cos(phase)
+            end_y = qubit['pos'].y() + radius * math.sin(phase)
+            painter.setPen(QPen(QColor(255, 255, 255), 2))
+            painter.drawLine(qubit['pos'], QPointF(end_x, end_y))
+            
+    def draw_state_info(self, painter):
+        # Draw quantum state information
+        painter.setPen(QColor(0, 255, 255))
+        painter.setFont(QFont('Arial', 8))
+        
+        for i, qubit in enumerate(self.qubits):
+            state_text = f"|ψ{i}⟩ = {qubit['state']:.2f}"
+            painter.drawText(
+                QRectF(10, 10 + i * 20, 200, 20),
+                state_text
+            )
+
+class BackendProcessVisualizer(QWidget):
+    FRAME_RATE = 20
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.background_layer = LayerCache(diagonal_gradient(QColor(0, 0, 20), QColor(0, 20, 40)))
+        self.setMinimumSize(300, 200)
+        self.processes = [
+            {'name': 'Quantum State Preparation', 'progress': 0, 'status': 'active'},
+            {'name': 'Neural Network Forward Pass', 'progress': 0, 'status': 'active'},
+            {'name': 'Attention Mechanism', 'progress': 0, 'status': 'active'},
+            {'name': 'LSTM Cell Updates', 'progress': 0, 'status': 'active'},
+            {'name': 'Gradient Computation', 'progress': 0, 'status': 'active'},
+            {'name': 'Weight Updates', 'progress': 0, 'status': 'active'},
+            {'name': 'Quantum Measurement', 'progress': 0, 'status': 'active'},
+            {'name': 'Entropy Calculation', 'progress': 0, 'status': 'active'}
+        ]
+        
+        FrameScheduler.instance().register(self, self.update_processes, self.FRAME_RATE)
+        
+    def update_processes(self, delta_time=None):
+        step = frame_steps(delta_time, self.FRAME_RATE)
+        for process in self.processes:
+            if process['status'] == 'active':
+                process['progress'] += random.uniform(0, 5) * step
+                if process['progress'] >= 100:
+                    process['progress'] = 0
+        self.update()
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw background
+        self.background_layer.draw(painter, self)
+        
+        # Draw processes
+        y_spacing = self.height() / len(self.processes)
+        for i, process in enumerate(self.processes):
+            y = i * y_spacing
+            
+            # Draw process name
+            painter.setPen(QColor(0, 255, 255))
+            painter.drawText(QRectF(10, y + 5, 200, 20), process['name'])
+            
+            # Draw progress bar
+            bar_rect = QRectF(220, y + 5, 100, 15)
+            painter.setPen(Qt.PenStyle.NoPen)
+            
+            # Background
+            painter.setBrush(QColor(0, 100, 100))
+            painter.drawRect(bar_rect)
+            
+            # Progress
+            progress_width = bar_rect.width() * (process['progress'] / 100)
+            progress_rect = QRectF(
+                bar_rect.x(),
+                bar_rect.y(),
+                progress_width,
+                bar_rect.height()
+            )
+            
+            gradient = QLinearGradient(
+                progress_rect.topLeft(),
+                progress_rect.topRight()
+            )
+            gradient.setColorAt(0, QColor(0, 255, 255))
+            gradient.setColorAt(1, QColor(0, 200, 200))
+            painter.setBrush(gradient)
+            painter.drawRect(progress_rect)
+            
+            # Draw percentage
+            painter.setPen(QColor(255, 255, 255))
+            painter.drawText(
+                bar_rect,
+                Qt.AlignmentFlag.AlignCenter,
+                f"{process['progress']:.0f}%"
+            )
+            
+            # Draw activity indicator
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(
+                QColor(0, 255, 0) if process['status'] == 'active'
+                else QColor(255, 0, 0)
+            )
+            painter.drawEllipse(
+                bar_rect.right() + 10,
+                bar_rect.center().y() - 4,
+                8, 8
+            )
+
+class NetworkVisualizerWidget(QWidget):
+    FRAME_RATE = 20
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(800, 600)
+        self.background_layer = LayerCache(self.render_background)
+        
+        # Neural network architecture
+        self.layers = [
+            {'name': 'Input', 'neurons': 8, 'type': 'input'},
+            {'name': 'LSTM', 'neurons': 16, 'type': 'lstm'},
+            {'name': 'Hidden', 'neurons': 32, 'type': 'dense'},
+            {'name': 'Attention', 'neurons': 16, 'type': 'attention'},
+            {'name': 'Output', 'neurons': 4, 'type': 'output'}
+        ]
+        
+        self.node_positions = []
+        self.connection_weights = []
+        self.attention_weights = np.random.rand(16, 16)
+        self.attention_heatmap = Heatmap(QColor(0, 0, 255, 200), QColor(255, 128, 0, 200))
+        
+        # Set once the model's own attention map arrives
+        self.live_attention = False
+        
+        # Animation
+        FrameScheduler.instance().register(self, self.update_animation, self.FRAME_RATE)
+        
+        # Initialize network
+        self.initialize_network()
+        
+    def initialize_network(self):
+        # Calculate vertical spacing
+        max_neurons = max(layer['neurons'] for layer in self.layers)
+        self.v_spacing = self.height() / (max_neurons + 1)
+        self.h_spacing = self.width() / (len(self.layers) + 1)
+        
+        # Initialize node positions
+        self.node_positions = []
+        for i, layer in enumerate(self.layers):
+            layer_positions = []
+            layer_height = layer['neurons'] * self.v_spacing
+            start_y = (self.height() - layer_height) / 2
+            
+            for j in range(layer['neurons']):
+                x = (i + 1) * self.h_spacing
+                y = start_y + j * self.v_spacing
+                layer_positions.append((x, y))
+            self.node_positions.append(layer_positions)
+            
+        # Initialize connection weights
+        self.connection_weights = []
+        for i in range(len(self.layers) - 1):
+            weights = np.random.randn(
+                self.layers[i]['neurons'],
+                self.layers[i + 1]['neurons']
+            )
+            self.connection_weights.append(weights)
+            
+    def update_animation(self, delta_time=None):
+        # Update weights with some random changes, one random step per tick
+        for i in range(len(self.connection_weights)):
+            mask = np.random.rand(*self.connection_weights[i].shape) < 0.1
+            changes = np.random.randn(*self.connection_weights[i].shape) * 0.1
+            self.connection_weights[i][mask] += changes[mask]
+            
+        # Update attention weights
+        if not self.live_attention:
+            self.attention_weights += np.random.randn(*self.attention_weights.shape) * 0.05
+            self.attention_weights = np.clip(self.attention_weights, 0, 1)
+            
+        self.update()
+        
+    def set_attention_weights(self, weights):
+        """Show a real attention map, of any size, scaled to [0, 1]"""
+        self.attention_weights = Heatmap.normalize(weights)
+        self.live_attention = True
+        self.update()
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw background
+        self.draw_background(painter)
+        
+        # Draw connections
+        self.draw_connections(painter)
+        
+        # Draw nodes
+        self.draw_nodes(painter)
+        
+        # Draw labels
+        self.draw_labels(painter)
+        
+        # Draw attention heatmap
+        self.draw_attention_heatmap(painter)
+        
+    def draw_background(self, painter):
+        self.background_layer.draw(painter, self)
+        
+    def render_background(self, painter, width, height):
+        # Create cyberpunk gradient background
+        diagonal_gradient(QColor(0, 0, 20), QColor(0, 20, 40))(painter, width, height)
+        
+        # Draw grid
+        pen = QPen(QColor(0, 100, 100, 30))
+        pen.setWidth(1)
+        painter.setPen(pen)
+        
+        grid_size = 30
+        for x in range(0, width, grid_size):
+            painter.drawLine(x, 0, x, height)
+        for y in range(0, height, grid_size):
+            painter.drawLine(0, y, width, y)
+            
+    def draw_connections(self, painter):
+        for layer_idx in range(len(self.layers) - 1):
+            weights = self.connection_weights[layer_idx]
+            
+            for i, pos1 in enumerate(self.node_positions[layer_idx]):
+                for j, pos2 in enumerate(self.node_positions[layer_idx + 1]):
+                    weight = weights[i, j]
+                    
+                    # Calculate color based on weight
+                    if weight > 0:
+                        color = QColor(0, int(255 * min(1, weight)), 255, 100)
+                    else:
+                        color = QColor(255, 0, int(255 * min(1, -weight)), 100)
+                        
+                    pen = QPen(color)
+                    pen.setWidth(max(1, int(abs(weight) * 3)))
+                    painter.setPen(pen)
+                    
+                    # Draw connection with animation
+                    path = QPainterPath()
+                    path.moveTo(*pos1)
+                    
+                    # Add control points for curve
+                    ctrl1 = QPointF(
+                        pos1[0] + (pos2[0] - pos1[0]) * 0.5,
+                        pos1[1]
+                    )
+                    ctrl2 = QPointF(
+                        pos1[0] + (pos2[0] - pos1[0]) * 0.5,
+                        pos2[1]
+                    )
+                    path.cubicTo(ctrl1, ctrl2, QPointF(*pos2))
+                    
+                    painter.drawPath(path)
+                    
+    def draw_nodes(self, painter):
+        for layer_idx, layer in enumerate(self.layers):
+            for i, pos in enumerate(self.node_positions[layer_idx]):
+                # Create gradient for node
+                gradient = QRadialGradient(pos[0], pos[1], 15)
+                
+                if layer['type'] == 'input':
+                    color = QColor(0, 255, 255)
+                elif layer['type'] == 'lstm':
+                    color = QColor(255, 165, 0)
+                elif layer['type'] == 'attention':
+                    color = QColor(255, 0, 255)
+                elif layer['type'] == 'output':
+                    color = QColor(0, 255, 0)
+                else:
+                    color = QColor(200, 200, 200)
+                    
+                gradient.setColorAt(0, color)
+                gradient.setColorAt(1, color.darker(200))
+                
+                # Draw node glow
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(QColor(color.red(), color.green(), color.blue(), 30))
+                painter.drawEllipse(QPointF(*pos), 20, 20)
+                
+                # Draw node
+                painter.setBrush(gradient)
+                pen = QPen(color.lighter(150))
+                pen.setWidth(2)
+                painter.setPen(pen)
+                painter.drawEllipse(QPointF(*pos), 15, 15)
+                
+    def draw_labels(self, painter):
+        # Draw layer names and formulas
+        for i, layer in enumerate(self.layers):
+            x = (i + 1) * self.h_spacing
+            y = self.height() - 40
+            
+            # Draw layer name
+            painter.setPen(QColor(0, 255, 255))
+            font = painter.font()
+            font.setPointSize(10)
+            painter.setFont(font)
+            painter.drawText(
+                QRect(int(x - 50), int(y), 100, 20),
+                Qt.AlignmentFlag.AlignCenter,
+                layer['name']
+            )
+            
+            # Draw formula
+            formula = self.get_layer_formula(layer['type'])
+            painter.setPen(QColor(150, 150, 150))
+            font.setPointSize(8)
+            painter.setFont(font)
+            painter.drawText(
+                QRect(int(x - 70), int(y + 20), 140, 20),
+                Qt.AlignmentFlag.AlignCenter,
+                formula
+            )
+            
+    def draw_attention_heatmap(self, painter):
+        # Draw attention weights heatmap in top-right corner
+        if 'attention' in [layer['type'] for layer in self.layers]:
+            heatmap_size = 150
+            
+            # Draw heatmap background
+            painter.fillRect(
+                self.width() - heatmap_size - 20,
+                20,
+                heatmap_size,
+                heatmap_size,
+                QColor(0, 0, 0, 100)
+            )
+            
+            # Draw cells
+            self.attention_heatmap.set_weights(self.attention_weights)
+            self.attention_heatmap.draw(
+                painter,
+                QRectF(self.width() - heatmap_size - 20, 20, heatmap_size, heatmap_size)
+            )
+            
+            # Draw heatmap border
+            painter.setPen(QPen(QColor(0, 255, 255)))
+            painter.drawRect(
+                self.width() - heatmap_size - 20,
+                20,
+                heatmap_size,
+                heatmap_size
+            )
+            
+            # Draw title
+            painter.drawText(
+                self.width() - heatmap_size - 20,
+                10,
+                "Attention Weights"
+            )
+            
+    def get_layer_formula(self, layer_type):
+        formulas = {
+            'input': 'x',
+            'lstm': 'h_t = σ(W_x·x + W_h·h_{t-1})',
+            'dense': 'y = σ(W·x + b)',
+            'attention': 'α = softmax(Q·K^T)·V',
+            'output': 'ŷ = softmax(W·x + b)'
+        }
+        return formulas.get(layer_type, '')
+        
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.initialize_network()
+
+class QuantumCircuitVisualizer(QWidget):
+    FRAME_RATE = 20
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(300, 200)
+        self.qubits = []
+        self.gates = []
+        self.measurements = []
+        self.animation_phase = 0
+        
+        FrameScheduler.instance().register(self, self.update_animation, self.FRAME_RATE)
+        
+    def update_animation(self, delta_time=None):
+        self.animation_phase += 0.1 * frame_steps(delta_time, self.FRAME_RATE)
+        self.update()
+        
+    def set_circuit(self, password):
+        # Convert password characters to quantum circuit
+        self.qubits = []
+        self.gates = []
+        self.measurements = []
+        
+        for i, char in enumerate(password):
+            # Create qubit for each character
+            self.qubits.append({
+                'index': i,
+                'state': complex(ord(char) / 255, 0)
+            })
+            
+            # Add quantum gates based on character properties
+            if char.isupper():
+                self.gates.append({
+                    'type': 'H',  # Hadamard gate
+                    'target': i,
+                    'pos': len(self.gates)
+                })
+            elif char.islower():
+                self.gates.append({
+                    'type': 'X',  # NOT gate
+                    'target': i,
+                    'pos': len(self.gates)
+                })
+            elif char.isdigit():
+                self.gates.append({
+                    'type': 'Y',  # Y rotation
+                    'target': i,
+                    'pos': len(self.gates)
+                })
+            else:
+                self.gates.append({
+                    'type': 'Z',  # Z rotation
+                    'target': i,
+                    'pos': len(self.gates)
+                })
+                
+            # Add measurement at the end
+            self.measurements.append({
+                'target': i,
+                'value': abs(self.qubits[i]['state'])**2
+            })
+            
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw dark background
+        painter.fillRect(self.rect(), QColor(0, 0, 20))
+        
+        # Calculate layout
+        qubit_spacing = self.height() / (len(self.qubits) + 1)
+        gate_spacing = self.width() / (max(len(self.gates), 1) + 2)
+        
+        # Draw qubit lines
+        painter.setPen(QPen(QColor(0, 255, 255), 1))
+        for i, qubit in enumerate(self.qubits):
+            y = (i + 1) * qubit_spacing
+            painter.drawLine(50, y, self.width() - 50, y)
+            
+            # Draw qubit label
+            painter.drawText(10, y + 5, f"|q{i}⟩")
+            
+        # Draw gates
+        for gate in self.gates:
+            x = 50 + (gate['pos'] + 1) * gate_spacing
+            y = (gate['target'] + 1) * qubit_spacing
+            
+            # Gate background with glow
+            gradient = QRadialGradient(x, y, 20)
+            color = QColor(0, 255, 255)
+            gradient.setColorAt(0, color)
+            color.setAlpha(0)
+            gradient.setColorAt(1, color)
+            
+            painter.setBrush(gradient)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawEllipse(QPointF(x, y), 20, 20)
+            
+            # Gate symbol
+            painter.setPen(QColor(255, 255, 255))
+            painter.drawText(
+                QRectF(x - 10, y - 10, 20, 20),
+                Qt.AlignmentFlag.AlignCenter,
+                gate['type']
+            )
+            
+        # Draw measurements
+        for i, meas in enumerate(self.measurements):
+            x = self.width() - 40
+            y = (meas['target'] + 1) * qubit_spacing
+            
+            # Draw measurement symbol
+            path = QPainterPath()
+            path.moveTo(x, y - 10)
+            path.lineTo(x + 20, y)
+            path.lineTo(x, y + 10)
+            
+            painter.setPen(QPen(QColor(255, 200, 0), 2))
+            painter.drawPath(path)
+            
+            # Draw probability
+            painter.drawText(
+                QRectF(x + 25, y - 10, 40, 20),
+                Qt.AlignmentFlag.AlignLeft,
+                f"{meas['value']:.2f}"
+            )
+
+class PasswordStrengthAnalyzer(QWidget):
+    HISTORY_LENGTH = 50
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.background_layer = LayerCache(diagonal_gradient(QColor(0, 0, 20), QColor(0, 20, 40)))
+        self.setMinimumSize(300, 400)
+        self.metrics = {
+            key: RingBuffer(self.HISTORY_LENGTH) for key in (
+                'entropy',
+                'uniqueness',
+                'pattern_strength',
+                'quantum_resistance',
+                'neural_confidence'
+            )
+        }
+        self.current_password = ""
+        
+    def analyze_password(self, password, features=None):
+        self.current_password = password
+        
+        # Calculate metrics
+        if password:
+            if features is None:
+                features = PasswordFeatures(password)
+                
+            # Entropy calculation
+            entropy = features.length * math.log2(max(features.unique, 2))
+            self.metrics['entropy'].append(min(entropy / 100, 1.0))
+            
+            # Uniqueness score
+            uniqueness = features.variety_ratio
+            self.metrics['uniqueness'].append(uniqueness)
+            
+            # Pattern strength (simplified)
+            pattern_score = features.char_types / 4
+            self.metrics['pattern_strength'].append(pattern_score)
+            
+            # Quantum resistance (based on complexity)
+            quantum_score = min((features.length * pattern_score) / 20, 1.0)
+            self.metrics['quantum_resistance'].append(quantum_score)
+            
+            # Neural confidence (simulated)
+            confidence = random.uniform(0.8, 1.0) * pattern_score
+            self.metrics['neural_confidence'].append(confidence)
+        else:
+            for key in self.metrics:
+                self.metrics[key].append(0.0)
+                
+        self.update()
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw background
+        self.background_layer.draw(painter, self)
+        
+        # Draw metrics
+        y_spacing = self.height() / len(self.metrics)
+        for i, (name, values) in enumerate(self.metrics.items()):
+            y = i * y_spacing
+            
+            # Draw metric name
+            painter.setPen(QColor(0, 255, 255))
+            painter.drawText(10, y + 20, name.replace('_', ' ').title())
+            
+            # Draw metric graph
+            if len(values):
+                line = series_polyline(
+                    values.values(), 150, y + 10, (self.width() - 160) / len(values), y_spacing - 20
+                )
+                
+                # Draw graph line with glow effect
+                pen = QPen(QColor(0, 255, 255))
+                pen.setWidth(2)
+                painter.setPen(pen)
+                painter.drawPolyline(line)
+                
+                # Add glow effect
+                glow_pen = QPen(QColor(0, 255, 255, 50))
+                glow_pen.setWidth(4)
+                painter.setPen(glow_pen)
+                painter.drawPolyline(line)
+                
+            # Draw current value, once there is one
+            current_value = values.last()
+            if current_value is not None:
+                painter.setPen(QColor(255, 255, 255))
+                painter.drawText(
+                    60, y + 20,
+                    f"{current_value:.2f}"
+                )
+
+class QuantumEntanglementVisualizer(QWidget):
+    FRAME_RATE = 20
+    
+    # Strongest entanglements drawn; each is a gradient curve every frame
+    MAX_ENTANGLEMENTS = 256
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(300, 300)
+        self.password_qubits = []
+        
+        # Qubit index pairs and strengths, as arrays
+        self.entanglements = entangled_pairs(char_classes(""))
+        self.animation_phase = 0
+        
+        FrameScheduler.instance().register(self, self.update_animation, self.FRAME_RATE)
+        
+    def update_animation(self, delta_time=None):
+        self.animation_phase += 0.1 * frame_steps(delta_time, self.FRAME_RATE)
+        
+        # Update qubit positions
+        for qubit in self.password_qubits:
+            angle = qubit['base_angle'] + self.animation_phase * qubit['speed']
+            radius = qubit['radius'] * (1 + 0.1 * math.sin(self.animation_phase * 2))
+            qubit['pos'] = QPointF(
+                self.width()/2 + radius * math.cos(angle),
+                self.height()/2 + radius * math.sin(angle)
+            )
+            
+        self.update()
+        
+    def set_password(self, password):
+        self.password_qubits = []
+        self.entanglements = entangled_pairs(char_classes(""))
+        
+        if not password:
+            return
+            
+        # Create qubits for each character
+        for i, char in enumerate(password):
+            angle = (i / len(password)) * 2 * math.pi
+            self.password_qubits.append({
+                'char': char,
+                'base_angle': angle,
+                'speed': 0.02 + random.uniform(-0.01, 0.01),
+                'radius': 100 + random.uniform(-10, 10),
+                'state': complex(ord(char) / 255, 0),
+                'pos': QPointF(0, 0)  # Will be updated in animation
+            })
+            
+        # Create entanglements between similar characters
+        self.entanglements = entangled_pairs(
+            char_classes(password), max_pairs=self.MAX_ENTANGLEMENTS
+        )
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw background
+        gradient = QRadialGradient(
+            self.width()/2, self.height()/2,
+            max(self.width(), self.height())
+        )
+        gradient.setColorAt(0, QColor(0, 0, 40))
+        gradient.setColorAt(1, QColor(0, 0, 20))
+        painter.fillRect(self.rect(), gradient)
+        
+        # Draw entanglements
+        first, second, strengths = self.entanglements
+        for i, j, strength in zip(first.tolist(), second.tolist(), strengths.tolist()):
+            q1 = self.password_qubits[i]
+            q2 = self.password_qubits[j]
+            
+            # Create entanglement effect
+            path = QPainterPath()
+            path.moveTo(q1['pos'])
+            
+            # Add wave effect to entanglement
+            ctrl1 = QPointF(
+                (q1['pos'].x() + q2['pos'].x())/2 + 20 * math.sin(self.animation_phase),
+                (q1['pos'].y() + q2['pos'].y())/2 + 20 * math.cos(self.animation_phase)
+            )
+            ctrl2 = QPointF(
+                (q1['pos'].x() + q2['pos'].x())/2 - 20 * math.sin(self.animation_phase),
+                (q1['pos'].y() + q2['pos'].y())/2 - 20 * math.cos(self.animation_phase)
+            )
+            
+            path.cubicTo(ctrl1, ctrl2, q2['pos'])
+            
+            # Draw with quantum effect
+            gradient = QLinearGradient(q1['pos'], q2['pos'])
+            alpha = int(strength * 150)
+            gradient.setColorAt(0, QColor(0, 255, 255, alpha))
+            gradient.setColorAt(0.5, QColor(255, 0, 255, alpha))
+            gradient.setColorAt(1, QColor(0, 255, 255, alpha))
+            
+            pen = QPen(gradient, 2)
+            painter.setPen(pen)
+            painter.drawPath(path)
+            
+        # Draw qubits
+        for qubit in self.password_qubits:
+            # Qubit glow
+            gradient = QRadialGradient(qubit['pos'], 20)
+            color = QColor(0, 255, 255)
+            gradient.setColorAt(0, color)
+            color.setAlpha(0)
+            gradient.setColorAt(1, color)
+            
+            painter.setBrush(gradient)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawEllipse(qubit['pos'], 20, 20)
+            
+            # Qubit core
+            painter.setBrush(QColor(0, 255, 255))
+            painter.drawEllipse(qubit['pos'], 5, 5)
+            
+            # Draw character
+            painter.setPen(QColor(255, 255, 255))
+            painter.drawText(
+                QRectF(qubit['pos'].x() - 10, qubit['pos'].y() - 10, 20, 20),
+                Qt.AlignmentFlag.AlignCenter,
+                qubit['char']
+            )
+
+class QuantumWaveformAnalyzer(QWidget):
+    FRAME_RATE = 60
+    
+    # Pixels between waveform samples
+    SAMPLE_SPACING = 2
+    
+    # Per character class (upper, lower, digit, symbol): frequency factor,
+    # phase speed, and the offset turning sin into cos
+    CLASS_FREQUENCY = np.array([20.0, 15.0, 10.0, 25.0])
+    CLASS_PHASE_RATE = np.array([1.0, 1.0, 2.0, 0.5])
+    CLASS_OFFSET = np.array([0.0, math.pi / 2, 0.0, math.pi / 2])
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.background_layer = LayerCache(diagonal_gradient(QColor(0, 0, 20), QColor(0, 20, 40)))
+        self.setMinimumSize(300, 200)
+        self.phase = 0
+        self.frequency = 1.0
+        self.amplitude = 1.0
+        
+        # One sine component per character, and the sampled waveform
+        self.set_password_complexity("")
+        
+        FrameScheduler.instance().register(self, self.update_waveform, self.FRAME_RATE)
+        
+    def update_waveform(self, delta_time=None):
+        self.phase += 0.1 * frame_steps(delta_time, self.FRAME_RATE)
+        self.synthesize_waveform()
+        self.update()
+        
+    def set_password_complexity(self, password):
+        # Generate waveform components based on password characteristics
+        classes = char_classes(password)
+        order = np.arange(1, len(password) + 1)
+        base_freq = 2 * math.pi / 100
+        
+        self.wave_frequency = base_freq * order * self.CLASS_FREQUENCY[classes]
+        self.wave_amplitude = 0.5 / order
+        self.wave_phase_rate = self.CLASS_PHASE_RATE[classes]
+        self.wave_offset = self.CLASS_OFFSET[classes]
+        self.wave_basis = None
+        self.synthesize_waveform()
+        
+    def synthesize_waveform(self):
+        if not len(self.wave_amplitude):
+            self.waveform_data = np.zeros(0)
+            return
+            
+        # Sample positions depend only on the width and the components,
+        # so their sines and cosines are computed once
+        samples = max(2, self.width() // self.SAMPLE_SPACING)
+        if self.wave_basis is None or len(self.wave_basis[0]) != samples:
+            angle = np.outer(np.arange(samples) / samples, self.wave_frequency)
+            self.wave_basis = (np.sin(angle), np.cos(angle))
+            
+        # sin(a + b) = sin a cos b + cos a sin b, so a tick is two matrix-vector products
+        phase = self.phase * self.wave_phase_rate + self.wave_offset
+        sin_basis, cos_basis = self.wave_basis
+        self.waveform_data = (
+            sin_basis @ (self.wave_amplitude * np.cos(phase))
+            + cos_basis @ (self.wave_amplitude * np.sin(phase))
+        )
+        
+    def paintEvent(self, event):
+        if not len(self.waveform_data):
+            return
+            
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw background
+        self.background_layer.draw(painter, self)
+        
+        # Draw grid
+        painter.setPen(QPen(QColor(0, 100, 100, 30)))
+        for i in range(0, self.width(), 20):
+            painter.drawLine(i, 0, i, self.height())
+        for i in range(0, self.height(), 20):
+            painter.drawLine(0, i, self.width(), i)
+            
+        # Draw waveform
+        if len(self.waveform_data) > 1:
+            # Create path for the waveform
+            path = QPainterPath()
+            
+            # Scale points to widget size
+            samples = len(self.waveform_data)
+            xs = (np.arange(samples) * (self.width() / samples)).tolist()
+            ys = (self.height() / 2 * (1 - self.waveform_data)).tolist()
+            points = [QPointF(px, py) for px, py in zip(xs, ys)]
+            
+            # Create smooth path
+            path.moveTo(points[0])
+            for i in range(1, len(points)-2, 2):
+                path.cubicTo(
+                    points[i], points[i+1], points[i+2]
+                )
+                
+            # Draw path with glow effect
+            pen = QPen(QColor(0, 255, 255))
+            pen.setWidth(2)
+            painter.setPen(pen)
+            painter.drawPath(path)
+            
+            # Add glow effect
+            glow_pen = QPen(QColor(0, 255, 255, 50))
+            glow_pen.setWidth(4)
+            painter.setPen(glow_pen)
+            painter.drawPath(path)
+
+class QuantumStateMap(QWidget):
+    FRAME_RATE = 20
+    
+    # Strongest connections drawn; each is a gradient curve every frame
+    MAX_CONNECTIONS = 256
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(300, 300)
+        self.state_points = []
+        
+        # State index pairs, strengths and wave phases, as arrays
+        self.connections = entangled_pairs(char_classes(""))
+        self.connection_phases = np.zeros(0)
+        self.animation_phase = 0
+        
+        FrameScheduler.instance().register(self, self.update_animation, self.FRAME_RATE)
+        
+    def update_animation(self, delta_time=None):
+        self.animation_phase += 0.1 * frame_steps(delta_time, self.FRAME_RATE)
+        self.update()
+        
+    def set_password_state(self, password):
+        self.state_points = []
+        self.connections = entangled_pairs(char_classes(""))
+        self.connection_phases = np.zeros(0)
+        
+        if not password:
+            return
+            
+        # Create quantum state points based on password characteristics
+        center_x = self.width() / 2
+        center_y = self.height() / 2
+        
+        for i, char in enumerate(password):
+            # Calculate position in a spiral pattern
+            angle = i * math.pi / 4
+            radius = 20 + i * 15
+            x = center_x + radius * math.cos(angle)
+            y = center_y + radius * math.sin(angle)
+            
+            # Create state point with properties based on character
+            state = {
+                'pos': QPointF(x, y),
+                'char': char,
+                'energy': ord(char) / 255.0,
+                'phase': random.random() * math.pi * 2,
+                'spin': 1 if char.isupper() else -1
+            }
+            self.state_points.append(state)
+            
+        # Create quantum connections between related states
+        self.connections = entangled_pairs(
+            char_classes(password), max_pairs=self.MAX_CONNECTIONS
+        )
+        self.connection_phases = np.random.rand(len(self.connections[0])) * math.pi * 2
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw background with quantum field effect
+        self.draw_quantum_field(painter)
+        
+        # Draw connections
+        self.draw_connections(painter)
+        
+        # Draw state points
+        self.draw_state_points(painter)
+        
+    def draw_quantum_field(self, painter):
+        # Create quantum field background
+        for y in range(0, self.height(), 10):
+            for x in range(0, self.width(), 10):
+                # Calculate field intensity based on nearby states
+                intensity = 0
+                for state in self.state_points:
+                    dx = x - state['pos'].x()
+                    dy = y - state['pos'].y()
+                    distance = math.sqrt(dx*dx + dy*dy)
+                    if distance > 0:
+                        intensity += state['energy'] / (distance * 0.1)
+                        
+                # Add wave effect
+                intensity += 0.2 * math.sin(
+                    math.sqrt((x - self.width()/2)**2 + 
+                             (y - self.height()/2)**2) * 0.05 + 
+                    self.animation_phase
+                )
+                
+                color = QColor(
+                    0,
+                    int(128 + intensity * 64),
+                    int(128 + intensity * 64)
+                )
+                painter.setPen(color)
+                painter.drawPoint(x, y)
+                
+    def draw_connections(self, painter):
+        starts, ends, strengths = self.connections
+        for i, j, strength, phase in zip(starts.tolist(), ends.tolist(), strengths.tolist(),
+                                         self.connection_phases.tolist()):
+            start = self.state_points[i]['pos']
+            end = self.state_points[j]['pos']
+            
+            # Create quantum entanglement effect
+            path = QPainterPath()
+            path.moveTo(start)
+            
+            # Add wave effect to connection
+            mid_x = (start.x() + end.x()) / 2
+            mid_y = (start.y() + end.y()) / 2
+            ctrl1 = QPointF(
+                mid_x + 20 * math.sin(self.animation_phase + phase),
+                mid_y + 20 * math.cos(self.animation_phase + phase)
+            )
+            ctrl2 = QPointF(
+                mid_x - 20 * math.sin(self.animation_phase + phase),
+                mid_y - 20 * math.cos(self.animation_phase + phase)
+            )
+            
+            path.cubicTo(ctrl1, ctrl2, end)
+            
+            # Draw with quantum effect
+            gradient = QLinearGradient(start, end)
+            alpha = int(strength * 150)
+            gradient.setColorAt(0, QColor(0, 255, 255, alpha))
+            gradient.setColorAt(0.5, QColor(255, 0, 255, alpha))
+            gradient.setColorAt(1, QColor(0, 255, 255, alpha))
+            
+            pen = QPen(gradient, 2)
+            painter.setPen(pen)
+            painter.drawPath(path)
+            
+    def draw_state_points(self, painter):
+        for state in self.state_points:
+            # Draw quantum state glow
+            gradient = QRadialGradient(state['pos'], 20)
+            color = QColor(0, 255, 255)
+            gradient.setColorAt(0, color)
+            color.setAlpha(0)
+            gradient.setColorAt(1, color)
+            
+            painter.setBrush(gradient)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawEllipse(state['pos'], 20, 20)
+            
+            # Draw state core
+            painter.setBrush(QColor(0, 255, 255))
+            painter.drawEllipse(state['pos'], 5, 5)
+            
+            # Draw character
+            painter.setPen(QColor(255, 255, 255))
+            painter.drawText(
+                QRectF(state['pos'].x() - 10, state['pos'].y() - 10, 20, 20),
+                Qt.AlignmentFlag.AlignCenter,
+                state['char']
+            )
+            
+            # Draw spin indicator
+            if state['spin'] > 0:
+                painter.drawText(
+                    QRectF(state['pos'].x() - 5, state['pos'].y() - 25, 10, 10),
+                    Qt.AlignmentFlag.AlignCenter,
+                    '↑'
+                )
+        else:
+                painter.drawText(
+                    QRectF(state['pos'].x() - 5, state['pos'].y() - 25, 10, 10),
+                    Qt.AlignmentFlag.AlignCenter,
+                    '↓'
+                )
+
+class QuantumResonanceVisualizer(QWidget):
+    FRAME_RATE = 60
+    
+    FIELD_SIZE = 20
+    INTERFERENCE_STEPS = 20
+    
+    # Field glows are blitted from sprites, one per intensity level
+    FIELD_LEVELS = 64
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(400, 300)
+        self.phase = 0
+        self.strength = 0
+        
+        # Initialize quantum field, one entry per grid point
+        grid_x, grid_y = np.meshgrid(np.arange(self.FIELD_SIZE), np.arange(self.FIELD_SIZE), indexing='ij')
+        self.field_x = grid_x.ravel() / self.FIELD_SIZE
+        self.field_y = grid_y.ravel() / self.FIELD_SIZE
+        self.field_amplitude = np.zeros(self.FIELD_SIZE * self.FIELD_SIZE)
+        self.field_phase = np.random.rand(self.FIELD_SIZE * self.FIELD_SIZE) * 2 * math.pi
+        self.field_frequency = np.random.uniform(0.5, 2.0, self.FIELD_SIZE * self.FIELD_SIZE)
+        self.field_sprites = []
+        self.field_sprite_ratio = None
+        
+        # Interference runs along t in [0, 1]; its envelope is fixed
+        self.wave_t = np.linspace(0, 1, self.INTERFERENCE_STEPS)
+        self.wave_angle = self.wave_t * math.pi
+        self.wave_envelope = np.sin(self.wave_angle)
+        self.interference_intensity = np.zeros(self.INTERFERENCE_STEPS)
+        
+        # Resonance point and interference arrays, updated in place every tick
+        self.num_points = 0
+        self.point_capacity = 0
+        self.reserve_points(self.point_count(100))
+        
+        # Animation clock
+        FrameScheduler.instance().register(self, self.update_resonance, self.FRAME_RATE)
+        
+    def point_count(self, strength):
+        return int(10 + strength / 10)
+        
+    def reserve_points(self, count):
+        """Allocate room for count resonance points, keeping existing capacity"""
+        if count <= self.point_capacity:
+            return
+            
+        self.point_capacity = count
+        self.point_index = np.arange(count, dtype=float)
+        self.point_x = np.zeros(count)
+        self.point_y = np.zeros(count)
+        self.point_energy = np.zeros(count)
+        self.point_angle = np.zeros(count)
+        self.point_radius = np.zeros(count)
+        
+        pairs = count // 2
+        self.pattern_delta = np.zeros(pairs)
+        self.pattern_x = np.zeros((pairs, self.INTERFERENCE_STEPS))
+        self.pattern_y = np.zeros((pairs, self.INTERFERENCE_STEPS))
+        
+    def update_resonance(self, delta_time=None):
+        step = frame_steps(delta_time, self.FRAME_RATE)
+        self.phase += 0.05 * step
+        
+        # Update quantum field, using the amplitudes as scratch for the phase step
+        np.multiply(self.field_frequency, 0.1 * step, out=self.field_amplitude)
+        self.field_phase += self.field_amplitude
+        np.sin(self.field_phase, out=self.field_amplitude)
+        self.field_amplitude *= 0.5
+        self.field_amplitude += 0.5
+        
+        # Generate resonance points around a breathing circle
+        n = self.num_points = self.point_count(self.strength)
+        self.reserve_points(n)
+        index = self.point_index[:n]
+        angle = self.point_angle[:n]
+        radius = self.point_radius[:n]
+        np.multiply(index, 2 * math.pi / n, out=angle)
+        angle += self.phase
+        np.add(index, self.phase * 2, out=radius)
+        np.sin(radius, out=radius)
+        radius *= 0.1
+        radius += 0.3
+        
+        x, y, energy = self.point_x[:n], self.point_y[:n], self.point_energy[:n]
+        np.cos(angle, out=x)
+        x *= radius
+        x += 0.5
+        np.sin(angle, out=y)
+        y *= radius
+        y += 0.5
+        np.add(index, self.phase * 3, out=energy)
+        np.sin(energy, out=energy)
+        energy *= 0.5
+        energy += 0.5
+        
+        # Generate interference patterns between opposite points
+        half = n // 2
+        delta = self.pattern_delta[:half]
+        for points, pattern in ((x, self.pattern_x[:half]), (y, self.pattern_y[:half])):
+            np.subtract(points[half:2 * half], points[:half], out=delta)
+            np.multiply(delta[:, None], self.wave_t, out=pattern)
+            pattern += points[:half, None]
+            
+        # The intensity along t is the same for every pattern
+        intensity = self.interference_intensity
+        np.add(self.wave_angle, self.phase * 2, out=intensity)
+        np.sin(intensity, out=intensity)
+        intensity *= self.wave_envelope
+        np.abs(intensity, out=intensity)
+        
+        self.update()
+        
+    def set_strength(self, value):
+        self.strength = value
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw background with quantum field
+        self.draw_quantum_field(painter)
+        
+        # Draw interference patterns
+        self.draw_interference_patterns(painter)
+        
+        # Draw resonance points
+        self.draw_resonance_points(painter)
+        
+        # Draw quantum metrics
+        self.draw_quantum_metrics(painter)
+        
+    def create_field_sprites(self, ratio):
+        # Quantum glow for each intensity level, rendered once per device pixel ratio
+        self.field_sprites = []
+        self.field_sprite_ratio = ratio
+        for level in range(self.FIELD_LEVELS):
+            intensity = level / (self.FIELD_LEVELS - 1)
+            sprite = QPixmap(max(1, round(20 * ratio)), max(1, round(20 * ratio)))
+            sprite.setDevicePixelRatio(ratio)
+            sprite.fill(Qt.GlobalColor.transparent)
+            
+            sprite_painter = QPainter(sprite)
+            gradient = QRadialGradient(10, 10, 20)
+            color = QColor(0, int(255 * intensity), int(255 * intensity))
+            gradient.setColorAt(0, color)
+            color.setAlpha(0)
+            gradient.setColorAt(1, color)
+            sprite_painter.fillRect(0, 0, 20, 20, gradient)
+            sprite_painter.end()
+            
+            self.field_sprites.append(sprite)
+            
+    def draw_quantum_field(self, painter):
+        ratio = painter.device().devicePixelRatioF()
+        if not self.field_sprites or ratio != self.field_sprite_ratio:
+            self.create_field_sprites(ratio)
+            
+        # Calculate field intensity
+        intensity = self.field_amplitude * (0.3 + 0.7 * self.strength / 100)
+        levels = np.rint(np.clip(intensity, 0, 1) * (self.FIELD_LEVELS - 1)).astype(int)
+        
+        left = (self.field_x * self.width()).astype(int) - 10
+        top = (self.field_y * self.height()).astype(int) - 10
+        for x, y, level in zip(left.tolist(), top.tolist(), levels.tolist()):
+            painter.drawPixmap(x, y, self.field_sprites[level])
+            
+    def draw_interference_patterns(self, painter):
+        half = self.num_points // 2
+        if not half:
+            return
+            
+        pattern_x = self.pattern_x[:half] * self.width()
+        pattern_y = self.pattern_y[:half] * self.height()
+        
+        # Segments at the same step share a color, so draw them together
+        pen = QPen()
+        pen.setWidth(2)
+        for step, intensity in enumerate(self.interference_intensity[:-1].tolist()):
+            pen.setColor(QColor(0, int(255 * intensity), int(255 * intensity)))
+            painter.setPen(pen)
+            painter.drawLines([
+                QLineF(x1, y1, x2, y2)
+                for x1, y1, x2, y2 in zip(
+                    pattern_x[:, step].tolist(), pattern_y[:, step].tolist(),
+                    pattern_x[:, step + 1].tolist(), pattern_y[:, step + 1].tolist()
+                )
+            ])
+            
+    def draw_resonance_points(self, painter):
+        n = self.num_points
+        xs = (self.point_x[:n] * self.width()).astype(int).tolist()
+        ys = (self.point_y[:n] * self.height()).astype(int).tolist()
+        
+        for x, y, energy, angle in zip(xs, ys, self.point_energy[:n].tolist(), self.point_angle[:n].tolist()):
+            center = QPointF(x, y)
+            
+            # Draw quantum state with glow
+            gradient = QRadialGradient(center, 30)
+            color = QColor(0, int(255 * energy), int(255 * energy))
+            gradient.setColorAt(0, color)
+            color.setAlpha(0)
+            gradient.setColorAt(1, color)
+            
+            painter.setBrush(gradient)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawEllipse(center, 30, 30)
+            
+            # Draw core
+            painter.setBrush(QColor(0, 255, 255))
+            painter.drawEllipse(center, 5, 5)
+            
+            # Draw phase line
+            end_x = x + 20 * math.cos(angle)
+            end_y = y + 20 * math.sin(angle)
+            painter.setPen(QPen(QColor(0, 255, 255), 2))
+            painter.drawLine(x, y, int(end_x), int(end_y))
+            
+    def draw_quantum_metrics(self, painter):
+        # Draw quantum state information
+        painter.setPen(QColor(0, 255, 255))
+        painter.setFont(QFont('Arial', 10))
+        
+        metrics = [
+            f"Quantum Coherence: {self.strength:.1f}%",
+            f"Phase Alignment: {abs(math.sin(self.phase)):.2f}",
+            f"Resonance Points: {self.num_points}",
+            f"Field Intensity: {self.field_amplitude.mean():.2f}"
+        ]
+        
+        for i, metric in enumerate(metrics):
+            painter.drawText(10, 20 + i * 20, metric)
+
+class QuantumMetricsPanel(QWidget):
+    FRAME_RATE = 60
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.background_layer = LayerCache(diagonal_gradient(QColor(0, 0, 20), QColor(0, 20, 40)))
+        self.setMinimumSize(300, 200)
+        self.metrics = {
+            'quantum_entropy': 0.0,
+            'classical_entropy': 0.0,
+            'neural_confidence': 0.0,
+            'pattern_complexity': 0.0,
+            'quantum_resistance': 0.0,
+            'superposition_score': 0.0
+        }
+        self.max_history = 100
+        self.history = {key: RingBuffer(self.max_history) for key in self.metrics.keys()}
+        
+        # Animation
+        self.phase = 0
+        FrameScheduler.instance().register(self, self.update_animation, self.FRAME_RATE)
+                    
+    def update_animation(self, delta_time=None):
+        self.phase += 0.05 * frame_steps(delta_time, self.FRAME_RATE)
+        self.update()
+        
+    def update_metrics(self, password, features=None):
+        if not password:
+            for key in self.metrics:
+                self.metrics[key] = 0.0
+            return
+            
+        if features is None:
+            features = PasswordFeatures(password)
+            
+        # Calculate quantum entropy
+        self.metrics['quantum_entropy'] = features.entropy_per_char / 4.0
+        
+        # Calculate classical entropy
+        self.metrics['classical_entropy'] = math.log2(max(features.unique, 2)) / 6.0
+        
+        # Neural confidence (simulated)
+        self.metrics['neural_confidence'] = random.uniform(0.7, 1.0)
+        
+        # Pattern complexity
+        self.metrics['pattern_complexity'] = features.char_types / 4.0
+        
+        # Quantum resistance (based on length and complexity)
+        self.metrics['quantum_resistance'] = min((features.length * self.metrics['pattern_complexity']) / 20, 1.0)
+        
+        # Superposition score (based on character variety)
+        self.metrics['superposition_score'] = min(features.unique / 20, 1.0)
+        
+        # Update history
+        for key, value in self.metrics.items():
+            self.history[key].append(value)
+            
+        self.update()
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw background
+        self.background_layer.draw(painter, self)
+        
+        # Draw metrics
+        self.draw_metrics(painter)
+        
+        # Draw history graphs
+        self.draw_history_graphs(painter)
+        
+    def draw_metrics(self, painter):
+        painter.setPen(QColor(0, 255, 255))
+        painter.setFont(QFont('Arial', 10))
+        
+        x = 10
+        y = 20
+        width = self.width() - 20
+        
+        for key, value in self.metrics.items():
+            # Draw label
+            label = key.replace('_', ' ').title()
+            painter.drawText(x, y, label)
+            
+            # Draw value bar
+            bar_rect = QRectF(x + 150, y - 15, width - 160, 20)
+            
+            # Bar background
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(0, 40, 40))
+            painter.drawRect(bar_rect)
+            
+            # Bar value with gradient
+            value_width = bar_rect.width() * value
+            value_rect = QRectF(bar_rect.x(), bar_rect.y(), value_width, bar_rect.height())
+            gradient = QLinearGradient(value_rect.topLeft(), value_rect.topRight())
+            gradient.setColorAt(0, QColor(0, 255, 255))
+            gradient.setColorAt(1, QColor(0, 128, 255))
+            painter.setBrush(gradient)
+            painter.drawRect(value_rect)
+            
+            # Draw value text
+            painter.setPen(QColor(255, 255, 255))
+            painter.drawText(
+                value_rect.adjusted(5, 0, -5, 0),
+                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                f"{value:.2f}"
+            )
+            
+            y += 30
+            
+    def draw_history_graphs(self, painter):
+        graph_height = 60
+        y_start = self.height() - graph_height - 10
+        
+        # Draw combined history graph
+        painter.setPen(QPen(QColor(0, 255, 255, 100), 1))
+        painter.drawRect(10, y_start, self.width() - 20, graph_height)
+        
+        if not any(len(values) for values in self.history.values()):
+            return
+            
+        for key, values in self.history.items():
+            if not len(values):
+                continue
+                
+            # Create polyline for history line
+            x_step = (self.width() - 20) / (len(values) - 1) if len(values) > 1 else 0
+            line = series_polyline(values.values(), 10, y_start, x_step, graph_height)
+            
+            # Draw history line with glow effect
+            pen = QPen(QColor(0, 255, 255))
+            pen.setWidth(2)
+            painter.setPen(pen)
+            painter.drawPolyline(line)
+            
+            # Add glow effect
+            glow_pen = QPen(QColor(0, 255, 255, 50))
+            glow_pen.setWidth(4)
+            painter.setPen(glow_pen)
+            painter.drawPolyline(line)
+
+class QuantumEffectsProcessor:
+    """Quantum states, entanglement pairs and interference patterns of a password.
+    
+    States and pairs are held as NumPy arrays, one entry per character or
+    pair, and interference patterns as [pairs, steps] arrays. max_pairs
+    caps the entanglement pairs to the strongest ones.
+    """
+    INTERFERENCE_STEPS = 20
+    
+    def __init__(self, max_pairs=None):
+        self.max_pairs = max_pairs
+        self.phase = 0
+        self.process_password("")
+        
+    def process_password(self, password):
+        # Generate quantum states for each character
+        n = len(password)
+        self.chars = password
+        self.state_amplitude = np.fromiter((ord(c) for c in password), dtype=float, count=n) / 255.0
+        self.state_phase = np.arange(n) * math.pi * 2 / max(n, 1)
+        self.state_position = np.arange(n) / max(n, 1)
+        self.state_energy = self._calculate_energy(password)
+        
+        # Generate entanglement pairs
+        self.pair_first, self.pair_second, self.pair_strength = entangled_pairs(
+            char_classes(password), energy=self.state_energy, max_pairs=self.max_pairs
+        )
+        self.pair_phase = np.random.rand(len(self.pair_strength)) * math.pi * 2
+        
+        # Generate interference patterns, interpolating along each pair
+        t = np.linspace(0, 1, self.INTERFERENCE_STEPS)
+        first, second = self.pair_first[:, None], self.pair_second[:, None]
+        self.interference_position = (
+            self.state_position[first] + (self.state_position[second] - self.state_position[first]) * t
+        )
+        self.interference_phase = (
+            self.state_phase[first] + (self.state_phase[second] - self.state_phase[first]) * t
+        )
+        amplitude = (self.state_amplitude[first] + self.state_amplitude[second]) * 0.5
+        self.interference_amplitude = amplitude * np.sin(self.interference_phase + self.phase)
+        
+    def update_animation(self, delta_time):
+        self.phase += delta_time * 2
+        
+        # Update quantum states
+        self.state_phase += delta_time * self.state_energy
+        
+        # Update entanglement pairs
+        self.pair_phase += delta_time * self.pair_strength
+        
+    def _calculate_energy(self, text):
+        # Calculate quantum energy level based on character properties
+        base_energy = np.fromiter((ord(c) for c in text), dtype=float, count=len(text)) / 255.0
+        class_factors = np.array([1.2, 0.8, 1.5, 2.0])
+        return base_energy * class_factors[char_classes(text)]
+        
+    def get_quantum_metrics(self):
+        n = len(self.chars)
+        if not n:
+            return {
+                'total_energy': 0,
+                'entanglement_density': 0,
+                'phase_coherence': 0,
+                'quantum_complexity': 0
+            }
+            
+        # Calculate quantum metrics
+        total_energy = float(self.state_energy.sum())
+        num_possible_pairs = (n * (n - 1)) / 2
+        entanglement_density = len(self.pair_strength) / max(1, num_possible_pairs)
+        
+        # Calculate phase coherence
+        i, j = np.triu_indices(n, 1)
+        phase_diffs = np.abs(self.state_phase[i] - self.state_phase[j])
+        phase_coherence = 1.0 - (phase_diffs.sum() / (len(phase_diffs) * math.pi)) if len(phase_diffs) else 0
+        
+        # Calculate quantum complexity
+        complexity_factors = [
+            total_energy / n,
+            entanglement_density,
+            phase_coherence,
+            len(self.interference_position) / max(1, n)
+        ]
+        quantum_complexity = sum(complexity_factors) / len(complexity_factors)
+        
+        return {
+            'total_energy': total_energy,
+            'entanglement_density': entanglement_density,
+            'phase_coherence': float(phase_coherence),
+            'quantum_complexity': float(quantum_complexity)
+        }
+
+class AnalysisSignals(QObject):
+    # generation, password, analysis, neural analysis
+    finished = Signal(int, str, object, object)
+    # generation, error message
+    failed = Signal(int, str)
+
+class AnalysisTask(QRunnable):
+    def __init__(self, worker, generation, password):
+        super().__init__()
+        self.worker = worker
+        self.generation = generation
+        self.password = password
+        
+    def run(self):
+        worker = self.worker
+        
+        # Skip requests superseded while they were queued
+        if self.generation != worker.generation:
+            return
+            
+        try:
+            analysis = worker.session.analyze(self.password)
+            with torch.no_grad():
+                neural_analysis = worker.neural_core(
+                    torch.tensor([ord(c) % 128 for c in self.password]).unsqueeze(0)
+                )
+        except Exception as e:
+            worker.signals.failed.emit(self.generation, str(e))
+            return
+            
+        if self.generation == worker.generation:
+            worker.signals.finished.emit(self.generation, self.password, analysis, neural_analysis)
+
+class AnalysisWorker:
+    """Runs password analysis off the GUI thread; the latest request wins.
+    
+    A single pool thread keeps the keystroke session single-threaded.
+    Results arrive through queued signals and receivers drop any whose
+    generation is no longer current.
+    """
+    def __init__(self, session, neural_core):
+        self.session = session
+        self.neural_core = neural_core
+        self.signals = AnalysisSignals()
+        self.generation = 0
+        
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(1)
+        
+    def submit(self, password):
+        self.generation += 1
+        
+        # Anything still queued is stale now
+        self.pool.clear()
+        self.pool.start(AnalysisTask(self, self.generation, password))
+        return self.generation
+        
+    def cancel(self):
+        self.generation += 1
+        self.pool.clear()
+        
+    def is_current(self, generation):
+        return generation == self.generation
+        
+    def shutdown(self):
+        self.cancel()
+        self.pool.waitForDone()
+
+class LazyTab:
+    """A tab's widget factory, and the calls waiting for its widget to exist"""
+    MAX_PENDING = 64
+    
+    def __init__(self, factory):
+        self.factory = factory
+        self.widget = None
+        self.pending = []
+        
+    def call(self, method, *args, replace=True):
+        """Call a method on the widget, or queue it until the widget is built.
+        
+        A queued call replaces an earlier one to the same method, as only
+        the latest state matters; pass replace=False for methods that
+        accumulate, like adding history points.
+        """
+        if self.widget is not None:
+            return getattr(self.widget, method)(*args)
+            
+        if replace:
+            self.pending = [call for call in self.pending if call[0] != method]
+        self.pending.append((method, args))
+        del self.pending[:-self.MAX_PENDING]
+        
+    def build(self):
+        if self.widget is None:
+            self.widget = self.factory()
+            
+            # Replay what the widget missed, in the original order
+            pending, self.pending = self.pending, []
+            for method, args in pending:
+                try:
+                    getattr(self.widget, method)(*args)
+                except Exception as e:
+                    print(f"⚠️ Could not replay {method} on {type(self.widget).__name__}: {e}")
+        return self.widget
+
+class LazyTabWidget(QTabWidget):
+    """Tabs whose widgets are constructed the first time they are shown.
+    
+    Each tab starts as an empty page holding a factory. Until the page
+    becomes the visible tab its visualizer allocates nothing and starts
+    no animation; updates sent through the returned LazyTab are queued
+    and replayed when it is built.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.lazy_tabs = {}
+        self.currentChanged.connect(self.build_current)
+        
+    def add_lazy_tab(self, factory, label, margins=True):
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        if not margins:
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            
+        tab = LazyTab(factory)
+        self.lazy_tabs[page] = tab
+        self.addTab(page, label)
+        self.build_current()
+        return tab
+        
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.build_current()
+        
+    def build_current(self, index=None):
+        if not self.isVisible():
+            return
+            
+        page = self.currentWidget()
+        tab = self.lazy_tabs.get(page)
+        if tab is not None and tab.widget is None:
+            page.layout().addWidget(tab.build())
+
+class QuantumInterface(QMainWindow):
+    FRAME_RATE = 60
+    
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("BUN.AI - Quantum Password Analyzer")
+        self.setMinimumSize(1200, 800)
+        
+        # Initialize neural network components
+        self.quantum_brain = QuantumBrain()
+        self.neural_core = AdvancedNeuralCore()
+        self.neural_core.eval()  # Set to evaluation mode
+        self.generator = QuantumGenerator()
+        self.analyzer = PasswordAnalyzer(cache_size=512)
+        self.keystroke_session = self.analyzer.session()
+        
+        # Analysis runs on a worker thread; only the latest result is applied
+        self.analysis_worker = AnalysisWorker(self.keystroke_session, self.neural_core)
+        self.analysis_worker.signals.finished.connect(
+            self.apply_analysis, Qt.ConnectionType.QueuedConnection
+        )
+        self.analysis_worker.signals.failed.connect(
+            self.report_analysis_error, Qt.ConnectionType.QueuedConnection
+        )
+        
+        # Initialize state variables
+        self.current_strength = 0
+        self.target_strength = 0
+        self.password_history = []
+        self.analysis_history = []
+        
+        # Create central widget and main layout
+        self.central_widget = QWidget()
+        self.setCentralWidget(self.central_widget)
+        self.main_layout = QVBoxLayout(self.central_widget)
+        
+        try:
+            # Initialize interface; visualizers in tabs are built when first shown
+            self.initialize_interface()
+            
+            # Strength meter easing on the shared animation clock
+            FrameScheduler.instance().register(self, self.update_effects, self.FRAME_RATE)
+            
+            # Apply quantum theme
+            self.apply_quantum_theme()
+            
+            # Show loading screen
+            self.loading_screen = QuantumLoadingScreen(self)
+            self.loading_screen.show()
+            
+        except Exception as e:
+            print(f"Error during initialization: {e}")
+            # Fallback to basic initialization if advanced components fail
+            self.initialize_basic_interface()
+        
+    def initialize_interface(self):
+        # Setup header
+        self.setup_header()
+        
+        # Create main splitter for resizable sections
+        main_splitter = QSplitter(Qt.Orientation.Horizontal)
+        
+        # Left panel for input and basic visualizations
+        left_panel = QWidget()
+        left_layout = QVBoxLayout(left_panel)
+        self.setup_input_section(left_layout)
+        self.setup_basic_visualizations(left_layout)
+        main_splitter.addWidget(left_panel)
+        
+        # Right panel for advanced analytics
+        right_panel = QWidget()
+        right_layout = QVBoxLayout(right_panel)
+        self.setup_advanced_analytics(right_layout)
+        main_splitter.addWidget(right_panel)
+        
+        # Set initial splitter sizes
+        main_splitter.setSizes([int(self.width() * 0.6), int(self.width() * 0.4)])
+        
+        self.main_layout.addWidget(main_splitter)
+        
+    def setup_header(self):
+        header = QWidget()
+        header_layout = QHBoxLayout(header)
+        
+        # Logo and title
+        title_section = QWidget()
+        title_layout = QVBoxLayout(title_section)
+        
+        title = QLabel("BUN.AI")
+        title.setStyleSheet("""
+            QLabel {
+                color: #00ffff;
+                font-size: 48px;
+                font-weight: bold;
+                padding: 20px;
+                background: qlineargradient(
+                    x1:0, y1:0, x2:1, y2:0,
+                    stop:0 rgba(0, 255, 255, 30),
+                    stop:1 rgba(0, 0, 0, 0)
+                );
+                border-bottom: 2px solid #00ffff;
+            }
+        """)
+        title_layout.addWidget(title)
+        
+        subtitle = QLabel("QUANTUM PASSWORD ANALYZER")
+        subtitle.setStyleSheet("""
+            QLabel {
+                color: #00ffff;
+                font-size: 16px;
+                padding: 10px;
+            }
+        """)
+        title_layout.addWidget(subtitle)
+        
+        header_layout.addWidget(title_section)
+        
+        # Status section
+        status_section = QWidget()
+        status_layout = QVBoxLayout(status_section)
+        
+        # Add timestamp
+        self.timestamp = QLabel()
+        self.timestamp.setStyleSheet("color: #00ffff;")
+        status_layout.addWidget(self.timestamp)
+        
+        # Add status indicator
+        self.status = QLabel("QUANTUM CORE ACTIVE")
+        self.status.setStyleSheet("""
+            QLabel {
+                color: #00ffff;
+                font-weight: bold;
+            }
+        """)
+        status_layout.addWidget(self.status)
+        
+        header_layout.addWidget(status_section)
+        
+        # Start status updates
+        FrameScheduler.instance().register(self, self.update_status, 1)
+        
+        self.main_layout.addWidget(header)
+        
+    def setup_input_section(self, layout):
+        input_container = QWidget()
+        input_layout = QHBoxLayout(input_container)
+        
+        # Password input with neon effect
+        self.password_input = QLineEdit()
+        self.password_input.setPlaceholderText("Enter password to analyze...")
+        self.password_input.setStyleSheet("""
+            QLineEdit {
+                background-color: rgba(0, 20, 20, 150);
+                color: #00ffff;
+                border: 2px solid #00ffff;
+                border-radius: 5px;
+                padding: 10px;
+                font-size: 14px;
+                selection-background-color: #00ffff;
+                selection-color: black;
+            }
+            QLineEdit:focus {
+                border: 2px solid #00ffff;
+                background-color: rgba(0, 30, 30, 180);
+            }
+        """)
+        self.password_input.textChanged.connect(self.analyze_password)
+        input_layout.addWidget(self.password_input)
+        
+        # Generate button
+        generate_btn = QPushButton("GENERATE")
+        generate_btn.clicked.connect(self.show_generator_dialog)
+        input_layout.addWidget(generate_btn)
+        
+        # Analyze button
+        analyze_btn = QPushButton("ANALYZE")
+        analyze_btn.clicked.connect(lambda: self.analyze_password(self.password_input.text()))
+        input_layout.addWidget(analyze_btn)
+        
+        layout.addWidget(input_container)
+        
+        # Add neon keyboard
+        self.keyboard = NeonKeyboard()
+        layout.addWidget(self.keyboard)
+        
+        # Add strength meter
+        self.strength_meter = StrengthMeter()
+        self.strength_meter.setMinimum(0)
+        self.strength_meter.setMaximum(100)
+        layout.addWidget(self.strength_meter)
+        
+    def setup_basic_visualizations(self, layout):
+        # Create visualization tabs
+        tabs = LazyTabWidget()
+        tabs.setStyleSheet("""
+            QTabWidget::pane {
+                border: 2px solid #00ffff;
+                background: rgba(0, 0, 0, 0.7);
+            }
+            QTabBar::tab {
+                background: rgba(0, 20, 20, 150);
+                color: #00ffff;
+                padding: 8px;
+                margin: 2px;
+            }
+            QTabBar::tab:selected {
+                background: rgba(0, 40, 40, 150);
+                border: 1px solid #00ffff;
+            }
+        """)
+        
+        # Main visualization tab
+        main_tab = QWidget()
+        main_layout = QVBoxLayout(main_tab)
+        
+        # Add scrollable network visualizer
+        network_scroll = QScrollArea()
+        network_scroll.setWidgetResizable(True)
+        network_scroll.setMinimumHeight(400)
+        
+        self.network_viz = NetworkVisualizerWidget()
+        network_scroll.setWidget(self.network_viz)
+        main_layout.addWidget(network_scroll)
+        
+        # Add quantum visualizations
+        viz_layout = QHBoxLayout()
+        self.quantum_viz = QuantumVisualizer()
+        self.holo_effect = HolographicEffect()
+        self.matrix_effect = MatrixRainEffect()
+        
+        viz_layout.addWidget(self.quantum_viz)
+        viz_layout.addWidget(self.holo_effect)
+        viz_layout.addWidget(self.matrix_effect)
+        main_layout.addLayout(viz_layout)
+        
+        tabs.addTab(main_tab, "Neural Analysis")
+        
+        # History tab
+        self.history_graph = tabs.add_lazy_tab(StrengthHistoryGraph, "Password History")
+        
+        layout.addWidget(tabs)
+        
+    def setup_advanced_analytics(self, layout):
+        # Create tabs for different analytics views, each built when first opened
+        tabs = LazyTabWidget()
+        
+        # Neural Network Analysis tab
+        self.neural_viz = tabs.add_lazy_tab(AdvancedNeuralVisualizer, "Neural Network Analysis")
+        
+        # Password Comparison tab
+        self.comparison_analyzer = tabs.add_lazy_tab(PasswordComparisonAnalyzer, "Password Comparison")
+        
+        # Quantum Particle tab
+        self.particle_viz = tabs.add_lazy_tab(QuantumParticleVisualizer, "Quantum Particles")
+        
+        # Quantum State tab
+        self.quantum_state_viz = tabs.add_lazy_tab(QuantumStateVisualizer, "Quantum State")
+        
+        # Resonance Analysis tab
+        self.resonance_viz = tabs.add_lazy_tab(QuantumResonanceVisualizer, "Quantum Resonance")
+        
+        # Metrics Panel tab
+        self.metrics_panel = tabs.add_lazy_tab(QuantumMetricsPanel, "Quantum Metrics")
+        
+        # Circuit Analysis tab
+        self.circuit_viz = tabs.add_lazy_tab(QuantumCircuitVisualizer, "Quantum Circuit")
+        
+        # Entanglement View tab
+        self.entanglement_viz = tabs.add_lazy_tab(QuantumEntanglementVisualizer, "Quantum Entanglement")
+        
+        # Waveform Analysis tab
+        self.waveform_analyzer = tabs.add_lazy_tab(QuantumWaveformAnalyzer, "Quantum Waveform")
+        
+        # State Map tab
+        self.state_map = tabs.add_lazy_tab(QuantumStateMap, "State Map")
+        
+        # Backend Process tab
+        self.backend_viz = tabs.add_lazy_tab(BackendProcessVisualizer, "Backend Process")
+        
+        layout.addWidget(tabs)
+        
+    def show_generator_dialog(self):
+        dialog = PasswordGeneratorDialog(self)
+        if dialog.exec():
+            # Get selected options
+            strength = dialog.strength_slider.value()
+            length = dialog.length_spin.value()
+            options = {
+                'uppercase': dialog.uppercase.isChecked(),
+                'lowercase': dialog.lowercase.isChecked(),
+                'numbers': dialog.numbers.isChecked(),
+                'special': dialog.special.isChecked(),
+                'length': length
+            }
+            
+            # Generate password
+            password = self.generator.generate_password(
+                strength_level=strength,
+                **options
+            )
+            self.password_input.setText(password)
+        
+    def update_status(self, delta_time=None):
+        # Update timestamp
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.timestamp.setText(current_time)
+        
+        # Blink status
+        current_color = self.status.styleSheet()
+        if "color: #00ffff;" in current_color:
+            self.status.setStyleSheet("color: #007777; font-weight: bold;")
+        else:
+            self.status.setStyleSheet("color: #00ffff; font-weight: bold;")
+            
+    def analyze_password(self, password):
+        if not password:
+            # Results still in flight belong to the old text
+            self.analysis_worker.cancel()
+            self.reset_analysis()
+            return
+            
+        # Quantum brain and neural core run on the worker thread and
+        # report back through apply_analysis
+        self.analysis_worker.submit(password)
+        
+    def apply_analysis(self, generation, password, analysis, neural_analysis):
+        # Drop results overtaken by a newer keystroke
+        if not self.analysis_worker.is_current(generation):
+            return
+            
+        # Combine analyses
+        combined_strength = (analysis['strength'] + float(neural_analysis['strength']) * 100) / 2
+        analysis['strength'] = combined_strength
+        
+        # Update target strength
+        self.target_strength = int(analysis['strength'])
+        
+        # Update keyboard visualization
+        self.keyboard.set_text(password)
+        
+        # Update password history
+        self.password_history.append({
+            'password': password,
+            'strength': self.target_strength,
+            'analysis': analysis,
+            'neural_analysis': neural_analysis,
+            'timestamp': datetime.now()
+        })
+        if len(self.password_history) > 10:
+            self.password_history.pop(0)
+            
+        # Update all visualizations
+        self.update_all_visualizations(password, analysis, neural_analysis)
+        
+    def update_all_visualizations(self, password, analysis, neural_analysis):
+        # Update basic visualizations
+        self.quantum_viz.set_strength(analysis['strength'])
+        self.holo_effect.set_strength(analysis['strength'])
+        self.matrix_effect.set_strength(analysis['strength'])
+        self.network_viz.set_attention_weights(analysis['attention_map'])
+        self.network_viz.update_network(neural_analysis)
+        self.history_graph.call('add_strength', analysis['strength'], replace=False)
+        
+        # Update advanced visualizations; tabs not opened yet get them when built
+        self.neural_viz.call('analyze_password', password)
+        self.neural_viz.call('set_attention_weights', analysis['attention_map'])
+        previous = self.password_history[-2] if len(self.password_history) > 1 else None
+        self.comparison_analyzer.call(
+            'compare_passwords',
+            password,
+            previous['password'] if previous else "",
+            analysis.get('features'),
+            previous['analysis'].get('features') if previous else None
+        )
+        self.particle_viz.call('set_strength', analysis['strength'])
+        self.quantum_state_viz.call('update_quantum_state', analysis)
+        self.resonance_viz.call('set_strength', analysis['strength'])
+        self.metrics_panel.call('update_metrics', password, analysis.get('features'))
+        self.circuit_viz.call('set_circuit', password)
+        self.entanglement_viz.call('set_password', password)
+        self.waveform_analyzer.call('set_password_complexity', password)
+        self.state_map.call('set_password_state', password)
+        self.backend_viz.call('update_processes')
+        
+    def update_realtime_analysis(self, analysis):
+        # Generate feedback based on strength
+        if analysis['strength'] < 30:
+            feedback = "😱 Seriously? My quantum brain hurts looking at this password!"
+        elif analysis['strength'] < 50:
+            feedback = "🤔 Not terrible, but my neural networks are not impressed..."
+        elif analysis['strength'] < 70:
+            feedback = "🎯 Getting better! But still room for quantum improvement."
+        elif analysis['strength'] < 90:
+            feedback = "🚀 Now we're talking! Your password is gaining quantum strength!"
+        else:
+            feedback = "⚡ QUANTUM PERFECTION! This password is truly unbreakable!"
+            
+        text = f"""
+QUANTUM PASSWORD ANALYSIS
+========================
+Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+{feedback}
+
+Password Strength: {analysis['strength']:.2f}%
+Complexity Level: {analysis['complexity'].upper()}
+Entropy Score: {analysis['entropy']:.2f}
+
+Detected Patterns:
+{chr(10).join(f'- {pattern}' for pattern in analysis['patterns'])}
+
+Neural Network Confidence:
+- Pattern Recognition: {random.uniform(0.8, 1.0):.2f}
+- Strength Assessment: {random.uniform(0.85, 1.0):.2f}
+- Quantum Resilience: {random.uniform(0.75, 1.0):.2f}
+
+Suggestions:
+{chr(10).join(f'- {suggestion}' for suggestion in analysis['suggestions'])}
+
+Quantum Metrics:
+- Entanglement Density: {random.uniform(0.6, 1.0):.2f}
+- Phase Coherence: {random.uniform(0.7, 1.0):.2f}
+- Quantum State Purity: {random.uniform(0.8, 1.0):.2f}
+"""
+        self.realtime_text.setText(text)
+        
+    def report_analysis_error(self, generation, message):
+        if self.analysis_worker.is_current(generation):
+            print(f"⚠️ Password analysis failed: {message}")
+            
+    def closeEvent(self, event):
+        # Let a running analysis finish before the window goes away
+        self.analysis_worker.shutdown()
+        super().closeEvent(event)
+        
+    def reset_analysis(self):
+        self.target_strength = 0
+        self.keyboard.set_text("")
+        self.update_visualizations({
+            'strength': 0,
+            'complexity': 'basic',
+            'patterns': [],
+            'suggestions': [],
+            'entropy': 0
+        })
+        self.realtime_text.clear()
+        
+    def update_effects(self, delta_time=None):
+        # Smooth strength transition, easing 10% per 1/120 s
+        if abs(self.current_strength - self.target_strength) > 0.5:
+            blend = 1 - 0.9 ** frame_steps(delta_time, 120)
+            self.current_strength += (self.target_strength - self.current_strength) * blend
+            
+        # Meter repaints itself only when the displayed value changes
+        self.strength_meter.setValue(int(self.current_strength))
+        
+    def apply_quantum_theme(self):
+        self.setStyleSheet("""
+            QMainWindow {
+                background: qlineargradient(
+                    x1:0, y1:0, x2:1, y2:1,
+                    stop:0 #000000,
+                    stop:1 #001020
+                );
+            }
+            QWidget {
+                color: #00ffff;
+            }
+            QPushButton {
+                background-color: rgba(0, 20, 20, 150);
+                border: 2px solid #00ffff;
+                border-radius: 5px;
+                color: #00ffff;
+                padding: 8px 16px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: rgba(0, 40, 40, 180);
+            }
+            QPushButton:pressed {
+                background-color: rgba(0, 60, 60, 200);
+            }
+            QLabel {
+                color: #00ffff;
+                font-size: 14px;
+            }
+            QScrollBar:vertical {
+                border: none;
+                background: rgba(0, 20, 20, 150);
+                width: 10px;
+                margin: 0px;
+            }
+            QScrollBar::handle:vertical {
+                background: #00ffff;
+                min-height: 20px;
+                border-radius: 5px;
+            }
+            QScrollBar::add-line:vertical,
+            QScrollBar::sub-line:vertical {
+                height: 0px;
+            }
+            QCheckBox {
+                spacing: 8px;
+            }
+            QCheckBox::indicator {
+                width: 20px;
+                height: 20px;
+            }
+            QCheckBox::indicator:unchecked {
+                border: 2px solid #00ffff;
+                background: rgba(0, 20, 20, 150);
+            }
+            QCheckBox::indicator:checked {
+                border: 2px solid #00ffff;
+                background: qlineargradient(
+                    x1:0, y1:0, x2:1, y2:0,
+                    stop:0 #00ffff,
+                    stop:1 #0080ff
+                );
+            }
+            QSpinBox {
+                background-color: rgba(0, 20, 20, 150);
+                border: 2px solid #00ffff;
+                border-radius: 5px;
+                padding: 5px;
+                color: #00ffff;
+            }
+            QSpinBox::up-button, QSpinBox::down-button {
+                border: none;
+                background: rgba(0, 40, 40, 180);
+                width: 20px;
+            }
+            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
+                background: rgba(0, 60, 60, 200);
+            }
+        """)
+
+class QuantumLoadingScreen(QWidget):
+    FRAME_RATE = 60
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.background_layer = LayerCache(diagonal_gradient(QColor(0, 0, 20), QColor(0, 20, 40)))
+        self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.resize(800, 600)
+        self.progress = 0
+        self.loading_text = "INITIALIZING QUANTUM CORE"
+        self.status_text = ""
+        self.particles = []
+        self.phase = 0
+        self.quantum_rings = []
+        self.dna_points = []
+        
+        # Initialize quantum rings
+        for i in range(3):
+            self.quantum_rings.append({
+                'radius': 100 + i * 40,
+                'rotation': random.random() * 360,
+                'speed': 1 + i * 0.5,
+                'particles': []
+            })
+            
+        # Initialize DNA helix points
+        for i in range(20):
+            self.dna_points.append({
+                'y': i * 20,
+                'phase': i * math.pi / 10,
+                'speed': 0.05
+            })
+        
+        # Center on screen
+        screen = QApplication.primaryScreen().geometry()
+        self.move(
+            (screen.width() - self.width()) // 2,
+            (screen.height() - self.height()) // 2
+        )
+        
+        # Animation clock
+        FrameScheduler.instance().register(self, self.update_animation, self.FRAME_RATE)
+        
+        # Loading sequence
+        self.loading_sequence = [
+            ("Initializing Quantum Core", 10),
+            ("Calibrating Neural Network", 20),
+            ("Loading Quantum States", 35),
+            ("Establishing Entanglement Matrix", 50),
+            ("Configuring Visualization Engine", 65),
+            ("Synchronizing Quantum Metrics", 80),
+            ("Activating Neural Interface", 90),
+            ("System Ready", 100)
+        ]
+        self.current_step = 0
+        
+        # Start loading sequence
+        QTimer.singleShot(100, self.advance_loading)
+        
+    def advance_loading(self):
+        if self.current_step < len(self.loading_sequence):
+            text, progress = self.loading_sequence[self.current_step]
+            self.status_text = text
+            self.progress = progress
+            self.current_step += 1
+            # Random delay between 500ms and 1500ms
+            QTimer.singleShot(random.randint(500, 1500), self.advance_loading)
+        else:
+            # Loading complete
+            QTimer.singleShot(500, self.close)
+        
+    def update_animation(self, delta_time=None):
+        step = frame_steps(delta_time, self.FRAME_RATE)
+        self.phase += 0.05 * step
+        
+        # Update quantum rings
+        for ring in self.quantum_rings:
+            ring['rotation'] += ring['speed'] * step
+            
+            # Update ring particles
+            if random.random() < 0.1:
+                angle = random.random() * 360
+                ring['particles'].append({
+                    'angle': angle,
+                    'size': random.uniform(2, 6),
+                    'life': 1.0,
+                    'speed': random.uniform(-2, 2)
+                })
+                
+            # Update existing particles
+            for particle in ring['particles']:
+                particle['angle'] += particle['speed'] * step
+                particle['life'] -= 0.02 * step
+                
+            # Remove dead particles
+            ring['particles'] = [p for p in ring['particles'] if p['life'] > 0]
+            
+        # Update DNA points
+        for point in self.dna_points:
+            point['phase'] += point['speed'] * step
+            
+        # Update background particles
+        if random.random() < 0.1:
+            self.particles.append({
+                'pos': QPointF(
+                    random.uniform(0, self.width()),
+                    random.uniform(0, self.height())
+                ),
+                'velocity': QPointF(
+                    random.uniform(-2, 2),
+                    random.uniform(-2, 2)
+                ),
+                'size': random.uniform(2, 6),
+                'life': 1.0
+            })
+            
+        # Update existing particles
+        for p in self.particles:
+            p['pos'] += p['velocity'] * step
+            p['life'] -= 0.02 * step
+            
+        # Remove dead particles
+        self.particles = [p for p in self.particles if p['life'] > 0]
+        
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw dark background with gradient
+        self.background_layer.draw(painter, self)
+        
+        # Draw background particles
+        for p in self.particles:
+            color = QColor(0, 255, 255, int(p['life'] * 255))
+            painter.setBrush(QBrush(color))
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawEllipse(p['pos'], p['size'] * p['life'], p['size'] * p['life'])
+            
+        # Draw DNA helix
+        center_x = self.width() / 2
+        for point in self.dna_points:
+            # Calculate helix points
+            x1 = center_x + 50 * math.sin(point['phase'])
+            x2 = center_x + 50 * math.sin(point['phase'] + math.pi)
+            y = 100 + point['y']
+            
+            # Draw helix strands
+            color1 = QColor(0, 255, 255, 150)
+            color2 = QColor(0, 200, 255, 150)
+            
+            painter.setPen(QPen(color1, 2))
+            if point != self.dna_points[-1]:
+                next_point = self.dna_points[self.dna_points.index(point) + 1]
+                next_x1 = center_x + 50 * math.sin(next_point['phase'])
+                next_y = 100 + next_point['y']
+                painter.drawLine(int(x1), int(y), int(next_x1), int(next_y))
+                
+            painter.setPen(QPen(color2, 2))
+            if point != self.dna_points[-1]:
+                next_x2 = center_x + 50 * math.sin(next_point['phase'] + math.pi)
+                painter.drawLine(int(x2), int(y), int(next_x2), int(next_y))
+                
+            # Draw connecting lines
+            painter.setPen(QPen(QColor(0, 255, 255, 100), 1))
+            painter.drawLine(int(x1), int(y), int(x2), int(y))
+            
+        # Draw quantum rings
+        center = QPointF(self.width() / 2, self.height() / 2)
+        for ring in self.quantum_rings:
+            # Draw ring
+            pen = QPen(QColor(0, 255, 255, 50), 2)
+            painter.setPen(pen)
+            painter.drawEllipse(center, ring['radius'], ring['radius'])
+            
+            # Draw ring particles
+            for particle in ring['particles']:
+                angle_rad = math.radians(particle['angle'])
+                x = center.x() + ring['radius'] * math.cos(angle_rad)
+                y = center.y() + ring['radius'] * math.sin(angle_rad)
+                
+                color = QColor(0, 255, 255, int(particle['life'] * 255))
+                painter.setBrush(QBrush(color))
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.drawEllipse(
+                    QPointF(x, y),
+                    particle['size'] * particle['life'],
+                    particle['size'] * particle['life']
+                )
+                
+        # Draw loading text
+        font = QFont('Arial', 32, QFont.Weight.Bold)
+        painter.setFont(font)
+        
+        # Draw main title with glow effect
+        text_rect = QRectF(0, self.height() * 0.3, self.width(), 50)
+        
+        # Glow effect
+        glow_color = QColor(0, 255, 255, 50)
+        painter.setPen(QPen(glow_color, 4))
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, self.loading_text)
+        
+        # Main text
+        painter.setPen(QColor(0, 255, 255))
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, self.loading_text)
+        
+        # Draw status text
+        font.setPointSize(16)
+        painter.setFont(font)
+        status_rect = QRectF(0, self.height() * 0.45, self.width(), 30)
+        painter.drawText(status_rect, Qt.AlignmentFlag.AlignCenter, self.status_text)
+        
+        # Draw progress bar
+        bar_width = self.width() * 0.6
+        bar_height = 4
+        x = (self.width() - bar_width) / 2
+        y = self.height() * 0.55
+        
+        # Bar background
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(0, 40, 40))
+        painter.drawRect(x, y, bar_width, bar_height)
+        
+        # Progress
+        progress_width = bar_width * (self.progress / 100)
+        gradient = QLinearGradient(x, y, x + progress_width, y)
+        gradient.setColorAt(0, QColor(0, 255, 255))
+        gradient.setColorAt(1, QColor(0, 128, 255))
+        painter.setBrush(gradient)
+        painter.drawRect(x, y, progress_width, bar_height)
+        
+        # Draw quantum circuit animation
+        self.draw_quantum_circuit(painter)
+        
+    def draw_quantum_circuit(self, painter):
+        circuit_height = 100
+        y_start = self.height() * 0.65
+        
+        # Draw quantum wires
+        painter.setPen(QPen(QColor(0, 255, 255, 100), 1))
+        for i in range(5):
+            y = y_start + i * (circuit_height / 4)
+            painter.drawLine(
+                self.width() * 0.2, y,
+                self.width() * 0.8, y
+            )
+            
+        # Draw quantum gates
+        gate_positions = [0.3, 0.4, 0.5, 0.6, 0.7]
+        gate_types = ['H', 'X', 'Y', 'Z', 'CNOT']
+        
+        for i, (pos, gate) in enumerate(zip(gate_positions, gate_types)):
+            x = self.width() * pos
+            y = y_start + ((i % 4) * circuit_height / 4)
+            
+            # Gate background with glow
+            gradient = QRadialGradient(x, y, 15)
+            color = QColor(0, 255, 255, 100)
+            gradient.setColorAt(0, color)
+            color.setAlpha(0)
+            gradient.setColorAt(1, color)
+            
+            painter.setBrush(gradient)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawEllipse(QPointF(x, y), 15, 15)
+            
+            # Gate symbol
+            painter.setPen(QColor(0, 255, 255))
+            painter.drawText(
+                QRectF(x - 10, y - 10, 20, 20),
+                Qt.AlignmentFlag.AlignCenter,
+                gate
+            )
+            
+            # Animate gate activation
+            if (self.phase * 5 + i) % 5 < 1:
+                painter.setBrush(QColor(0, 255, 255, 100))
+                painter.drawEllipse(QPointF(x, y), 20, 20)
+
+class AdvancedNeuralVisualizer(QWidget):
+    FRAME_RATE = 60
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(400, 300)
+        
+        # Neural architecture
+        self.layers = [
+            {'name': 'Input', 'neurons': 12, 'type': 'input'},
+            {'name': 'LSTM', 'neurons': 24, 'type': 'lstm'},
+            {'name': 'Attention', 'neurons': 16, 'type': 'attention'},
+            {'name': 'Dense', 'neurons': 32, 'type': 'dense'},
+            {'name': 'Dropout', 'neurons': 32, 'type': 'dropout'},
+            {'name': 'Dense', 'neurons': 16, 'type': 'dense'},
+            {'name': 'Output', 'neurons': 8, 'type': 'output'}
+        ]
+        
+        self.connections = []
+        self.activations = []
+        self.attention_weights = np.zeros((16, 16))
+        self.attention_heatmap = Heatmap(QColor(0, 0, 255, 200), QColor(255, 128, 255, 200))
+        self.live_attention = False
+        self.layer_metrics = {layer['name']: 0.0 for layer in self.layers}
+        self.animation_phase = 0
+        
+        # Animation clock
+        FrameScheduler.instance().register(self, self.update_animation, self.FRAME_RATE)
+        
+    def update_animation(self, delta_time=None):
+        self.animation_phase += 0.05 * frame_steps(delta_time, self.FRAME_RATE)
+        
+        # Update layer metrics with some noise
+        for name in self.layer_metrics:
+            self.layer_metrics[name] = 0.5 + 0.3 * math.sin(self.animation_phase + hash(name) % 10)
+            
+        # Update attention weights until the model's own map arrives
+        if not self.live_attention:
+            self.attention_weights = 0.5 + 0.5 * np.sin(self.animation_phase + np.arange(16 * 16).reshape(16, 16) * 0.1)
+            
+        self.update()
+        
+    def set_attention_weights(self, weights):
+        """Show a real attention map, of any size, scaled to [0, 1]"""
+        self.attention_weights = Heatmap.normalize(weights)
+        self.live_attention = True
+        self.update()
+        
+    def analyze_password(self, password):
+        if not password:
+            return
+            
+        # Simulate neural network analysis
+        for i, layer in enumerate(self.layers):
+            activation = min(1.0, len(password) / 20.0 + random.random() * 0.2)
+            self.layer_metrics[layer['name']] = activation
+            
+        # Generate random but consistent attention patterns
+        seed = sum(ord(c) for c in password)
+        random.seed(seed)
+        self.attention_weights = np.random.rand(16, 16)
+        
+        # Normalize attention weights
+        self.attention_weights = (self.attention_weights - self.attention_weights.min()) / (self.attention_weights.max() - self.attention_weights.min())
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw neural network architecture
+        self.draw_network(painter)
+        
+        # Draw attention heatmap
+        self.draw_attention_heatmap(painter)
+        
+        # Draw layer metrics
+        self.draw_layer_metrics(painter)
+        
+    def draw_network(self, painter):
+        width = self.width() * 0.7
+        height = self.height()
+        x_spacing = width / (len(self.layers) - 1)
+        
+        # Draw connections first
+        for i in range(len(self.layers) - 1):
+            layer1 = self.layers[i]
+            layer2 = self.layers[i + 1]
+            
+            y1_spacing = height / (layer1['neurons'] + 1)
+            y2_spacing = height / (layer2['neurons'] + 1)
+            
+            x1 = 50 + i * x_spacing
+            x2 = 50 + (i + 1) * x_spacing
+            
+            for n1 in range(layer1['neurons']):
+                for n2 in range(layer2['neurons']):
+                    y1 = (n1 + 1) * y1_spacing
+                    y2 = (n2 + 1) * y2_spacing
+                    
+                    # Calculate connection strength
+                    strength = 0.5 + 0.5 * math.sin(self.animation_phase + hash(f"{i}{n1}{n2}") % 10)
+                    
+                    # Draw connection with gradient
+                    gradient = QLinearGradient(x1, y1, x2, y2)
+                    color1 = QColor(0, int(255 * strength), 255, 50)
+                    color2 = QColor(0, int(255 * strength), 255, 50)
+                    gradient.setColorAt(0, color1)
+                    gradient.setColorAt(1, color2)
+                    
+                    painter.setPen(QPen(gradient, 1))
+                    painter.drawLine(int(x1), int(y1), int(x2), int(y2))
+        
+        # Draw neurons
+        for i, layer in enumerate(self.layers):
+            x = 50 + i * x_spacing
+            y_spacing = height / (layer['neurons'] + 1)
+            
+            for n in range(layer['neurons']):
+                y = (n + 1) * y_spacing
+                
+                # Calculate neuron activation
+                activation = self.layer_metrics[layer['name']]
+                
+                # Draw neuron with glow effect
+                gradient = QRadialGradient(x, y, 15)
+                color = QColor(0, int(255 * activation), 255)
+                gradient.setColorAt(0, color)
+                color.setAlpha(0)
+                gradient.setColorAt(1, color)
+                
+                painter.setBrush(gradient)
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.drawEllipse(QPointF(x, y), 8, 8)
+                
+            # Draw layer name
+            painter.setPen(QColor(0, 255, 255))
+            painter.drawText(
+                QRectF(x - 30, height - 30, 60, 20),
+                Qt.AlignmentFlag.AlignCenter,
+                layer['name']
+            )
+            
+    def draw_attention_heatmap(self, painter):
+        # Draw attention weights heatmap in top-right corner
+        heatmap_size = min(self.width() * 0.25, self.height() * 0.4)
+        x_start = self.width() - heatmap_size - 20
+        y_start = 20
+        
+        # Draw heatmap title
+        painter.setPen(QColor(0, 255, 255))
+        painter.drawText(x_start, y_start - 5, "Attention Weights")
+        
+        # Draw cells
+        self.attention_heatmap.set_weights(self.attention_weights)
+        self.attention_heatmap.draw(painter, QRectF(x_start, y_start, heatmap_size, heatmap_size))
+        
+    def draw_layer_metrics(self, painter):
+        # Draw layer metrics on the right side
+        metrics_width = self.width() * 0.25
+        x_start = self.width() - metrics_width - 20
+        y_start = self.height() * 0.5
+        
+        painter.setPen(QColor(0, 255, 255))
+        painter.drawText(x_start, y_start - 20, "Layer Metrics")
+        
+        y = y_start
+        for name, value in self.layer_metrics.items():
+            # Draw metric name
+            painter.drawText(x_start, y, name)
+            
+            # Draw metric bar
+            bar_rect = QRectF(x_start + 80, y - 15, metrics_width - 100, 20)
+            
+            # Background
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(0, 40, 40))
+            painter.drawRect(bar_rect)
+            
+            # Value bar
+            gradient = QLinearGradient(bar_rect.topLeft(), bar_rect.topRight())
+            gradient.setColorAt(0, QColor(0, 255, 255))
+            gradient.setColorAt(1, QColor(0, 128, 255))
+            painter.setBrush(gradient)
+            painter.drawRect(
+                QRectF(
+                    bar_rect.x(),
+                    bar_rect.y(),
+                    bar_rect.width() * value,
+                    bar_rect.height()
+                )
+            )
+            
+            # Draw value text
+            painter.setPen(QColor(255, 255, 255))
+            painter.drawText(
+                bar_rect.adjusted(5, 0, -5, 0),
+                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                f"{value:.2f}"
+            )
+            
+            y += 30
+
+class PasswordComparisonAnalyzer(QWidget):
+    FRAME_RATE = 60
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.background_layer = LayerCache(diagonal_gradient(QColor(0, 0, 20), QColor(0, 20, 40)))
+        self.setMinimumSize(400, 300)
+        self.current_password = ""
+        self.previous_password = ""
+        self.comparison_metrics = {
+            'strength_delta': 0,
+            'entropy_delta': 0,
+            'complexity_delta': 0,
+            'length_delta': 0,
+            'pattern_similarity': 0,
+            'character_overlap': 0
+        }
+        self.history = []
+        self.animation_phase = 0
+        
+        # Animation clock
+        FrameScheduler.instance().register(self, self.update_animation, self.FRAME_RATE)
+        
+    def update_animation(self, delta_time=None):
+        self.animation_phase += 0.05 * frame_steps(delta_time, self.FRAME_RATE)
+        self.update()
+        
+    def compare_passwords(self, current, previous, current_features=None, previous_features=None):
+        self.current_password = current
+        self.previous_password = previous
+        
+        if not current or not previous:
+            return
+            
+        if current_features is None:
+            current_features = PasswordFeatures(current)
+        if previous_features is None:
+            previous_features = PasswordFeatures(previous)
+            
+        # Calculate comparison metrics
+        self.comparison_metrics['strength_delta'] = self.calculate_strength_delta(current_features, previous_features)
+        self.comparison_metrics['entropy_delta'] = self.calculate_entropy_delta(current_features, previous_features)
+        self.comparison_metrics['complexity_delta'] = self.calculate_complexity_delta(current_features, previous_features)
+        self.comparison_metrics['length_delta'] = current_features.length - previous_features.length
+        self.comparison_metrics['pattern_similarity'] = self.calculate_pattern_similarity(current, previous)
+        self.comparison_metrics['character_overlap'] = self.calculate_character_overlap(current, previous)
+        
+        # Update history
+        self.history.append({
+            'timestamp': datetime.now(),
+            'metrics': self.comparison_metrics.copy()
+        })
+        if len(self.history) > 10:
+            self.history.pop(0)
+            
+    def calculate_strength_delta(self, current, previous):
+        # Simulate strength calculation from PasswordFeatures
+        def strength(features):
+            return min(1.0, features.length / 20.0 + features.upper_count / 10.0)
+            
+        return strength(current) - strength(previous)
+        
+    def calculate_entropy_delta(self, current, previous):
+        # Shannon entropy difference
+        return current.entropy_per_char - previous.entropy_per_char
+        
+    def calculate_complexity_delta(self, current, previous):
+        return current.char_types / 4.0 - previous.char_types / 4.0
+        
+    def calculate_pattern_similarity(self, current, previous):
+        # Simple pattern similarity based on character types in same positions
+        length = min(len(current), len(previous))
+        matches = sum(1 for i in range(length) if self.char_type(current[i]) == self.char_type(previous[i]))
+        return matches / length
+        
+    def char_type(self, c):
+        if c.isupper(): return 'upper'
+        if c.islower(): return 'lower'
+        if c.isdigit(): return 'digit'
+        return 'special'
+        
+    def calculate_character_overlap(self, current, previous):
+        # Calculate character set overlap
+        current_chars = set(current)
+        previous_chars = set(previous)
+        overlap = len(current_chars.intersection(previous_chars))
+        total = len(current_chars.union(previous_chars))
+        return overlap / total if total > 0 else 0
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw background
+        self.background_layer.draw(painter, self)
+        
+        # Draw comparison metrics
+        self.draw_metrics_comparison(painter)
+        
+        # Draw history graph
+        self.draw_history_graph(painter)
+        
+        # Draw character analysis
+        self.draw_character_analysis(painter)
+        
+    def draw_metrics_comparison(self, painter):
+        x = 20
+        y = 40
+        width = self.width() * 0.4 - 40
+        
+        painter.setPen(QColor(0, 255, 255))
+        painter.drawText(x, y - 20, "Password Comparison Metrics")
+        
+        for name, value in self.comparison_metrics.items():
+            # Draw metric name
+            painter.drawText(x, y, name.replace('_', ' ').title())
+            
+            # Draw comparison bar
+            bar_rect = QRectF(x, y + 5, width, 15)
+            
+            # Draw background
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(0, 40, 40))
+            painter.drawRect(bar_rect)
+            
+            # Draw value bar
+            normalized_value = (value + 1) / 2  # Convert from [-1, 1] to [0, 1]
+            bar_width = width * normalized_value
+            bar_x = x + (width - bar_width) / 2 if value < 0 else x + width/2
+            
+            gradient = QLinearGradient(bar_x, y, bar_x + bar_width, y)
+            if value >= 0:
+                gradient.setColorAt(0, QColor(0, 255, 255))
+                gradient.setColorAt(1, QColor(0, 255, 128))
+            else:
+                gradient.setColorAt(0, QColor(255, 128, 0))
+                gradient.setColorAt(1, QColor(255, 0, 0))
+                
+            painter.setBrush(gradient)
+            painter.drawRect(QRectF(bar_x, y + 5, abs(bar_width), 15))
+            
+            # Draw value text
+            painter.setPen(QColor(255, 255, 255))
+            text_rect = QRectF(x + width + 10, y, 60, 20)
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft, f"{value:+.2f}")
+            
+            y += 40
+            
+    def draw_history_graph(self, painter):
+        if not self.history:
+            return
+            
+        x = self.width() * 0.4 + 20
+        y = 40
+        width = self.width() * 0.3 - 40
+        height = self.height() * 0.4
+        
+        painter.setPen(QColor(0, 255, 255))
+        painter.drawText(x, y - 20, "Strength History")
+        
+        # Draw graph background
+        painter.setPen(QPen(QColor(0, 128, 128), 1))
+        painter.drawRect(x, y, width, height)
+        
+        # Draw grid
+        for i in range(4):
+            y_pos = y + height * i / 3
+            painter.drawLine(x, y_pos, x + width, y_pos)
+            
+        # Draw history lines
+        if len(self.history) > 1:
+            painter.setPen(QPen(QColor(0, 255, 255), 2))
+            path = QPainterPath()
+            
+            x_step = width / (len(self.history) - 1)
+            for i, entry in enumerate(self.history):
+                value = entry['metrics']['strength_delta']
+                normalized_value = (value + 1) / 2  # Convert from [-1, 1] to [0, 1]
+                point_x = x + i * x_step
+                point_y = y + height * (1 - normalized_value)
+                
+                if i == 0:
+                    path.moveTo(point_x, point_y)
+                else:
+                    path.lineTo(point_x, point_y)
+                    
+            painter.drawPath(path)
+            
+    def draw_character_analysis(self, painter):
+        if not self.current_password or not self.previous_password:
+            return
+            
+        x = self.width() * 0.7 + 20
+        y = 40
+        width = self.width() * 0.3 - 40
+        
+        painter.setPen(QColor(0, 255, 255))
+        painter.drawText(x, y - 20, "Character Analysis")
+        
+        # Draw character type distribution
+        def char_distribution(password):
+            dist = {'upper': 0, 'lower': 0, 'digit': 0, 'special': 0}
+            for c in password:
+                dist[self.char_type(c)] += 1
+            return dist
+            
+        current_dist = char_distribution(self.current_password)
+        previous_dist = char_distribution(self.previous_password)
+        
+        y += 20
+        bar_height = 20
+        for char_type in ['upper', 'lower', 'digit', 'special']:
+            # Draw type label
+            painter.setPen(QColor(0, 255, 255))
+            painter.drawText(x, y, char_type.title())
+            
+            # Draw comparison bars
+            curr_width = width * (current_dist[char_type] / len(self.current_password))
+            prev_width = width * (previous_dist[char_type] / len(self.previous_password))
+            
+            # Previous password bar
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(128, 128, 255, 100))
+            painter.drawRect(x, y + 5, prev_width, bar_height)
+            
+            # Current password bar
+            painter.setBrush(QColor(0, 255, 255, 150))
+            painter.drawRect(x, y + 5, curr_width, bar_height)
+            
+            y += 40
+
+class QuantumParticleVisualizer(QWidget):
+    FRAME_RATE = 60
+    
+    # Species are indexed by the particles' color field: proton, electron, neutron
+    PROTON, ELECTRON, NEUTRON = 0, 1, 2
+    SPECIES_CHARGE = np.array([1.0, -1.0, 0.0])
+    SPECIES_MASS = np.array([1.0, 0.1, 1.0])
+    SPECIES_SIZE = np.array([6.0, 4.0, 6.0])
+    SPECIES_SPREAD = np.array([20.0, 50.0, 30.0])
+    SPECIES_SPEED = np.array([2.0, 3.0, 2.0])
+    SPECIES_COLORS = [QColor(255, 100, 100), QColor(100, 200, 255), QColor(200, 200, 200)]
+    
+    # Pair interactions reach 50 px; connection lines 100 px, at most this many drawn
+    INTERACTION_RANGE = 50
+    CONNECTION_RANGE = 100
+    MAX_CONNECTIONS = 2000
+    
+    def __init__(self, parent=None, particle_count=24):
+        super().__init__(parent)
+        self.background_layer = LayerCache(diagonal_gradient(QColor(0, 0, 20), QColor(0, 20, 40)))
+        self.setMinimumSize(300, 300)
+        self.strength = 0
+        self.particle_count = particle_count
+        self.particles = ParticleSystem(capacity=particle_count)
+        self.close_pairs = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+        self.particle_sprites = []
+        self.particle_sprite_ratio = None
+        self.matrix_chars = []
+        self.glyph_atlas = GlyphAtlas(QFont('Courier'))
+        self.animation_phase = 0
+        
+        # Initialize particles
+        self.initialize_particles()
+        
+        # Animation clock
+        FrameScheduler.instance().register(self, self.update_animation, self.FRAME_RATE)
+        
+    def initialize_particles(self):
+        # Equal shares of protons (red), electrons (blue) and neutrons (white)
+        count = self.particle_count
+        species = np.repeat([self.PROTON, self.ELECTRON, self.NEUTRON], -(-count // 3))[:count]
+        spread = self.SPECIES_SPREAD[species]
+        speed = self.SPECIES_SPEED[species]
+        self.particles.spawn(
+            count,
+            x=self.width() / 2 + np.random.uniform(-1, 1, count) * spread,
+            y=self.height() / 2 + np.random.uniform(-1, 1, count) * spread,
+            vx=np.random.uniform(-1, 1, count) * speed,
+            vy=np.random.uniform(-1, 1, count) * speed,
+            size=self.SPECIES_SIZE[species],
+            color=species
+        )
+        
+        # Initialize matrix characters
+        for _ in range(50):
+            self.matrix_chars.append({
+                'x': random.randint(0, self.width()),
+                'y': random.randint(0, self.height()),
+                'char': random.choice('01'),
+                'alpha': random.randint(50, 200),
+                'size': random.randint(8, 16)
+            })
+            
+    def update_animation(self, delta_time=None):
+        step = frame_steps(delta_time, self.FRAME_RATE)
+        self.animation_phase += 0.05 * step
+        self.update_particles(step)
+        
+        # Update matrix characters
+        for char in self.matrix_chars:
+            char['y'] += 2 * step
+            char['alpha'] = max(0, char['alpha'] - 1)
+            
+            if char['y'] > self.height() or char['alpha'] == 0:
+                char['y'] = 0
+                char['x'] = random.randint(0, self.width())
+                char['alpha'] = random.randint(50, 200)
+                char['char'] = random.choice('01')
+                
+        self.update()
+        
+    def update_particles(self, step):
+        particles = self.particles
+        n = particles.count
+        if not n:
+            return
+        x, y = particles.live('x'), particles.live('y')
+        vx, vy = particles.live('vx'), particles.live('vy')
+        species = particles.live('color')
+        charge = self.SPECIES_CHARGE[species]
+        
+        # Apply central force (nucleus attraction) based on password strength;
+        # electrons orbit faster
+        dx = self.width() / 2 - x
+        dy = self.height() / 2 - y
+        dist = np.sqrt(dx * dx + dy * dy)
+        force = (self.strength / 100.0) * 0.5 * np.where(species == self.ELECTRON, 2.0, 1.0)
+        pull = np.divide(force * step, dist, out=np.zeros(n), where=dist > 0)
+        vx += pull * dx
+        vy += pull * dy
+        
+        # Coulomb force between neighbours within range, each pair counted once
+        i, j, dx, dy, dist = neighbor_pairs(x, y, self.INTERACTION_RANGE)
+        close = dist > 0
+        i, j, dx, dy, dist = i[close], j[close], dx[close], dy[close], dist[close]
+        self.close_pairs = (i, j)
+        coulomb = 0.1 * charge[i] * charge[j] / (dist * dist * dist) * step
+        vx -= np.bincount(i, coulomb * dx, n) - np.bincount(j, coulomb * dx, n)
+        vy -= np.bincount(i, coulomb * dy, n) - np.bincount(j, coulomb * dy, n)
+        
+        # Quantum tunneling: each neighbour gives a 1% chance of a random jump
+        neighbours = np.bincount(i, minlength=n) + np.bincount(j, minlength=n)
+        jumper = np.repeat(np.arange(n), np.random.binomial(neighbours, 0.01))
+        if len(jumper):
+            x += np.bincount(jumper, np.random.uniform(-10, 10, len(jumper)), n)
+            y += np.bincount(jumper, np.random.uniform(-10, 10, len(jumper)), n)
+            
+        # Update position, then apply drag
+        x += vx * step
+        y += vy * step
+        drag = 0.99 ** step
+        vx *= drag
+        vy *= drag
+        
+        # Bounce off walls, except for the 1% that tunnel through
+        margin = 20
+        bounce = np.random.random(n) > 0.01
+        for position, velocity, limit in ((x, vx, self.width() - margin), (y, vy, self.height() - margin)):
+            low = bounce & (position < margin)
+            high = bounce & ~low & (position > limit)
+            position[low] = margin
+            position[high] = limit
+            velocity[low | high] *= -0.8
+            
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw background
+        self.background_layer.draw(painter, self)
+        
+        # Draw matrix characters from cached glyphs, alpha applied as opacity
+        matrix_color = QColor(0, 255, 0)
+        for char in self.matrix_chars:
+            self.glyph_atlas.draw_text(painter, char['x'], char['y'], char['char'], char['size'],
+                                       matrix_color, char['alpha'] / 255)
+                                       
+        # Draw quantum field
+        self.draw_quantum_field(painter)
+        
+        # Draw particle connections
+        self.draw_connections(painter)
+        
+        # Draw particles with glow effect
+        self.draw_particles(painter)
+        
+        # Draw strength indicator
+        painter.setPen(QColor(0, 255, 255))
+        painter.setFont(QFont('Arial', 12))
+        painter.drawText(10, 20, f"Quantum State: {self.strength:.1f}%")
+        
+    def draw_quantum_field(self, painter):
+        particles = self.particles
+        charged = particles.live('color') != self.NEUTRON
+        px, py = particles.live('x')[charged], particles.live('y')[charged]
+        charge = self.SPECIES_CHARGE[particles.live('color')[charged]]
+        
+        grid_x, grid_y = np.meshgrid(
+            np.arange(0, self.width(), 20, dtype=float),
+            np.arange(0, self.height(), 20, dtype=float)
+        )
+        grid_x, grid_y = grid_x.ravel(), grid_y.ravel()
+        
+        # Potential of every charged particle at every grid point, a block of rows at a time
+        field = np.zeros(len(grid_x))
+        block = max(1, (1 << 20) // max(1, len(px)))
+        for start in range(0, len(grid_x), block):
+            dx = grid_x[start:start + block, None] - px
+            dy = grid_y[start:start + block, None] - py
+            dist = np.sqrt(dx * dx + dy * dy)
+            field[start:start + block] = np.divide(charge * 20, dist, out=np.zeros_like(dist), where=dist > 0).sum(axis=1)
+            
+        # One batch of 4 px dots per alpha level
+        alpha = np.minimum(50, np.abs(field.astype(int)))
+        for level in np.unique(alpha):
+            if level == 0:
+                continue
+            pen = QPen(QColor(0, 200, 255, int(level)), 4)
+            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            painter.setPen(pen)
+            painter.drawPointsNp(grid_x[alpha == level], grid_y[alpha == level])
+            
+    def draw_connections(self, painter):
+        particles = self.particles
+        x, y = particles.live('x'), particles.live('y')
+        
+        # When the last tick already found enough pairs within interaction
+        # range, the closest connections are among them
+        i, j = self.close_pairs
+        if len(i) >= self.MAX_CONNECTIONS:
+            dist = np.hypot(x[j] - x[i], y[j] - y[i])
+        else:
+            i, j, _, _, dist = neighbor_pairs(x, y, self.CONNECTION_RANGE)
+            
+        # Keep the closest, most visible connections when there are too many
+        if len(dist) > self.MAX_CONNECTIONS:
+            closest = np.argpartition(dist, self.MAX_CONNECTIONS)[:self.MAX_CONNECTIONS]
+            i, j, dist = i[closest], j[closest], dist[closest]
+            
+        alpha = (255 * (1 - dist / self.CONNECTION_RANGE)).astype(int)
+        for level in np.unique(alpha):
+            if level <= 0:
+                continue
+            picked = alpha == level
+            painter.setPen(QPen(QColor(0, 255, 255, int(level)), 1))
+            painter.drawLines([
+                QLineF(x1, y1, x2, y2)
+                for x1, y1, x2, y2 in zip(x[i[picked]], y[i[picked]], x[j[picked]], y[j[picked]])
+            ])
+            
+    def create_particle_sprites(self, ratio):
+        # Glow and core of each species, rendered once per device pixel ratio
+        self.particle_sprites = []
+        self.particle_sprite_ratio = ratio
+        for color, size in zip(self.SPECIES_COLORS, self.SPECIES_SIZE):
+            radius = size * 3
+            sprite = QPixmap(max(1, round(radius * 2 * ratio)), max(1, round(radius * 2 * ratio)))
+            sprite.setDevicePixelRatio(ratio)
+            sprite.fill(Qt.GlobalColor.transparent)
+            
+            sprite_painter = QPainter(sprite)
+            sprite_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            center = QPointF(radius, radius)
+            gradient = QRadialGradient(center, radius)
+            gradient.setColorAt(0, QColor(color.red(), color.green(), color.blue(), 50))
+            gradient.setColorAt(1, QColor(color.red(), color.green(), color.blue(), 0))
+            sprite_painter.setBrush(gradient)
+            sprite_painter.setPen(Qt.PenStyle.NoPen)
+            sprite_painter.drawEllipse(center, radius, radius)
+            sprite_painter.setBrush(color)
+            sprite_painter.drawEllipse(center, size, size)
+            sprite_painter.end()
+            
+            self.particle_sprites.append((sprite, int(radius)))
+            
+    def draw_particles(self, painter):
+        ratio = painter.device().devicePixelRatioF()
+        if not self.particle_sprites or ratio != self.particle_sprite_ratio:
+            self.create_particle_sprites(ratio)
+            
+        particles = self.particles
+        left = particles.live('x').astype(int).tolist()
+        top = particles.live('y').astype(int).tolist()
+        for x, y, species in zip(left, top, particles.live('color').tolist()):
+            sprite, radius = self.particle_sprites[species]
+            painter.drawPixmap(x - radius, y - radius, sprite)
+            
+    def set_strength(self, value):
+        self.strength = value
+
+    def initialize_basic_interface(self):
+        """Fallback initialization with basic components only"""
+        try:
+            # Initialize only essential components
+            self.neural_viz = AdvancedNeuralVisualizer()
+            self.comparison_analyzer = PasswordComparisonAnalyzer()
+            self.quantum_viz = QuantumVisualizer()
+            self.history_graph = StrengthHistoryGraph()
+            
+            # Create basic layout
+            main_splitter = QSplitter(Qt.Orientation.Horizontal)
+            
+            # Left panel for input
+            left_panel = QWidget()
+            left_layout = QVBoxLayout(left_panel)
+            
+            # Password input
+            input_container = QWidget()
+            input_layout = QHBoxLayout(input_container)
+            self.password_input = QLineEdit()
+            self.password_input.setPlaceholderText("Enter password to analyze...")
+            self.password_input.textChanged.connect(self.analyze_password)
+            input_layout.addWidget(self.password_input)
+            
+            # Buttons
+            generate_btn = QPushButton("GENERATE")
+            generate_btn.clicked.connect(self.show_generator_dialog)
+            input_layout.addWidget(generate_btn)
+            
+            analyze_btn = QPushButton("ANALYZE")
+            analyze_btn.clicked.connect(lambda: self.analyze_password(self.password_input.text()))
+            input_layout.addWidget(analyze_btn)
+            
+            left_layout.addWidget(input_container)
+            
+            # Strength meter
+            self.strength_meter = StrengthMeter()
+            self.strength_meter.setMinimum(0)
+            self.strength_meter.setMaximum(100)
+            left_layout.addWidget(self.strength_meter)
+            
+            # Basic visualizations
+            left_layout.addWidget(self.quantum_viz)
+            left_layout.addWidget(self.history_graph)
+            
+            main_splitter.addWidget(left_panel)
+            
+            # Right panel for analysis
+            right_panel = QWidget()
+            right_layout = QVBoxLayout(right_panel)
+            
+            # Analysis tabs
+            tabs = QTabWidget()
+            
+            # Neural Network tab
+            neural_tab = QWidget()
+            neural_layout = QVBoxLayout(neural_tab)
+            neural_layout.addWidget(self.neural_viz)
+            tabs.addTab(neural_tab, "Neural Network")
+            
+            # Comparison tab
+            comparison_tab = QWidget()
+            comparison_layout = QVBoxLayout(comparison_tab)
+            comparison_layout.addWidget(self.comparison_analyzer)
+            tabs.addTab(comparison_tab, "Comparison")
+            
+            right_layout.addWidget(tabs)
+            main_splitter.addWidget(right_panel)
+            
+            # Set initial splitter sizes
+            main_splitter.setSizes([int(self.width() * 0.4), int(self.width() * 0.6)])
+            
+            self.main_layout.addWidget(main_splitter)
+            
+            # Apply basic theme
+            self.apply_basic_theme()
+            
+        except Exception as e:
+            print(f"Error during basic initialization: {e}")
+            # Show error message to user
+            error_label = QLabel("Error initializing interface. Please restart the application.")
+            error_label.setStyleSheet("color: red; font-size: 14px;")
+            self.main_layout.addWidget(error_label)
+    
+    def apply_basic_theme(self):
+        """Apply a simplified theme for fallback mode"""
+        self.setStyleSheet("""
+            QMainWindow {
+                background: #001020;
+            }
+            QWidget {
+                color: #00ffff;
+            }
+            QPushButton {
+                background-color: rgba(0, 20, 20, 150);
+                border: 2px solid #00ffff;
+                border-radius: 5px;
+                color: #00ffff;
+                padding: 8px 16px;
+            }
+            QLineEdit {
+                background-color: rgba(0, 20, 20, 150);
+                border: 2px solid #00ffff;
+                border-radius: 5px;
+                color: #00ffff;
+                padding: 8px;
+            }
+            QProgressBar {
+                border: 2px solid #00ffff;
+                border-radius: 5px;
+                background: rgba(0, 20, 20, 150);
+                text-align: center;
+            }
+            QProgressBar::chunk {
+                background: qlineargradient(
+                    x1:0, y1:0, x2:1, y2:0,
+                    stop:0 #00ffff,
+                    stop:1 #00ff00
+                );
+            }
+        """)
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = QuantumInterface()
+    window.show()
+    sys.exit(app.exec()) 
@@ -0,0 +1,159 @@
+import numpy as np
+from PySide6.QtCore import Qt, QPointF
+from PySide6.QtGui import QPainter, QPixmap, QImage, QLinearGradient, QColor, QFont, QFontMetricsF
+
+class LayerCache:
+    """A static layer rendered once into a pixmap and blitted every frame.
+    
+    render(painter, width, height) draws the layer in widget coordinates.
+    The pixmap is rebuilt only when the widget's size or device pixel ratio
+    changes, or after invalidate().
+    """
+    def __init__(self, render):
+        self.render = render
+        self.pixmap = None
+        self.key = None
+        
+    def invalidate(self):
+        self.pixmap = None
+        self.key = None
+        
+    def draw(self, painter, widget):
+        width, height = widget.width(), widget.height()
+        ratio = widget.devicePixelRatioF()
+        key = (width, height, ratio)
+        
+        if self.pixmap is None or key != self.key:
+            self.pixmap = QPixmap(max(1, round(width * ratio)), max(1, round(height * ratio)))
+            self.pixmap.setDevicePixelRatio(ratio)
+            self.pixmap.fill(Qt.GlobalColor.transparent)
+            
+            layer_painter = QPainter(self.pixmap)
+            layer_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self.render(layer_painter, width, height)
+            layer_painter.end()
+            self.key = key
+            
+        painter.drawPixmap(0, 0, self.pixmap)
+
+def diagonal_gradient(start, end):
+    """Layer renderer filling the rect with a top-left to bottom-right gradient"""
+    def render(painter, width, height):
+        gradient = QLinearGradient(0, 0, width, height)
+        gradient.setColorAt(0, QColor(start))
+        gradient.setColorAt(1, QColor(end))
+        painter.fillRect(0, 0, width, height, gradient)
+    return render
+
+class GlyphAtlas:
+    """Characters pre-rendered once per (char, size, color, pixel ratio).
+    
+    Text that changes every frame, like matrix rain, is composed from the
+    cached glyph pixmaps instead of being laid out and rasterized again.
+    Per-glyph alpha is applied through the painter's opacity, so fading
+    glyphs share one pixmap.
+    """
+    MAX_GLYPHS = 4096
+    
+    def __init__(self, font=None):
+        self.font = QFont(font) if font is not None else QFont('Courier')
+        self.glyphs = {}
+        
+    def glyph(self, char, size, color, ratio):
+        key = (char, size, color.rgba(), ratio)
+        glyph = self.glyphs.get(key)
+        if glyph is not None:
+            return glyph
+            
+        # Drop everything when colors keep changing rather than grow without bound
+        if len(self.glyphs) >= self.MAX_GLYPHS:
+            self.glyphs.clear()
+            
+        font = QFont(self.font)
+        font.setPointSize(size)
+        metrics = QFontMetricsF(font)
+        pad = 2
+        width = metrics.horizontalAdvance(char) + 2 * pad
+        height = metrics.height() + 2 * pad
+        
+        pixmap = QPixmap(max(1, round(width * ratio)), max(1, round(height * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        glyph_painter = QPainter(pixmap)
+        glyph_painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        glyph_painter.setFont(font)
+        glyph_painter.setPen(color)
+        glyph_painter.drawText(QPointF(pad, pad + metrics.ascent()), char)
+        glyph_painter.end()
+        
+        # Offset from the pixmap corner to the text origin, and the advance
+        glyph = (pixmap, pad, pad + metrics.ascent(), metrics.horizontalAdvance(char))
+        self.glyphs[key] = glyph
+        return glyph
+        
+    def draw_text(self, painter, x, y, text, size, color, opacity=1.0):
+        """Draw text with its baseline starting at (x, y), like drawText"""
+        ratio = painter.device().devicePixelRatioF()
+        painter.setOpacity(opacity)
+        for char in text:
+            pixmap, left, top, advance = self.glyph(char, size, color, ratio)
+            painter.drawPixmap(QPointF(x - left, y - top), pixmap)
+            x += advance
+        painter.setOpacity(1.0)
+
+class Heatmap:
+    """A weight matrix drawn as one scaled image instead of a rect per cell.
+    
+    Weights in [0, 1] are mapped through a lookup table running from the
+    low color to the high one, giving premultiplied ARGB pixels in one
+    vectorized step. The pixel array backs the QImage directly, so it is
+    kept alongside it. Any matrix shape works; each weight becomes a cell.
+    """
+    def __init__(self, low, high, levels=256):
+        self.levels = levels
+        
+        low = np.array(QColor(low).getRgb(), dtype=float)
+        high = np.array(QColor(high).getRgb(), dtype=float)
+        rgba = low + (high - low) * np.linspace(0, 1, levels)[:, None]
+        red, green, blue, alpha = np.trunc(rgba).astype(np.uint32).T
+        
+        # Premultiplied pixels blit without a conversion pass
+        red, green, blue = ((channel * alpha + 127) // 255 for channel in (red, green, blue))
+        self.lut = (alpha << 24) | (red << 16) | (green << 8) | blue
+        
+        self.pixels = None
+        self.image = None
+        
+    @staticmethod
+    def normalize(weights):
+        """Rescale weights to span [0, 1]; a flat matrix maps to zeros"""
+        weights = np.asarray(weights, dtype=float)
+        if not weights.size:
+            return weights
+        span = weights.max() - weights.min()
+        if span <= 0:
+            return np.zeros_like(weights)
+        return (weights - weights.min()) / span
+        
+    def set_weights(self, weights):
+        weights = np.asarray(weights, dtype=float)
+        if weights.ndim != 2 or not weights.size:
+            self.pixels = None
+            self.image = None
+            return
+            
+        index = (np.clip(weights, 0, 1) * (self.levels - 1)).astype(np.intp)
+        self.pixels = np.ascontiguousarray(self.lut[index])
+        rows, columns = self.pixels.shape
+        self.image = QImage(self.pixels.data, columns, rows, columns * 4,
+                            QImage.Format.Format_ARGB32_Premultiplied)
+                            
+    def draw(self, painter, rect):
+        if self.image is None:
+            return
+            
+        # Nearest-neighbour scaling keeps the cells sharp
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
+        painter.drawImage(rect, self.image)
+        painter.restore()
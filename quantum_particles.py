@@ -0,0 +1,245 @@
+import numpy as np
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPen, QColor
+
+class ParticleSystem:
+    """Particles stored as preallocated NumPy arrays, one array per field.
+    
+    Live particles occupy the first `count` slots. Integration is a single
+    vectorized update, and dead particles are removed by moving live ones
+    from the end into their slots, so a frame costs the same handful of
+    array operations for ten particles or ten thousand.
+    """
+    FIELDS = ('x', 'y', 'vx', 'vy', 'life', 'decay', 'size', 'color', 'glyph')
+    DEFAULTS = {'life': 1.0}
+    
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self.count = 0
+        
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.life = np.zeros(capacity)
+        self.decay = np.zeros(capacity)
+        self.size = np.zeros(capacity)
+        
+        # Index into the owner's color table, and a character code for text particles
+        self.color = np.zeros(capacity, dtype=np.int32)
+        self.glyph = np.zeros(capacity, dtype=np.int32)
+        
+    def __len__(self):
+        return self.count
+        
+    def live(self, name):
+        """View of one field over the live particles"""
+        return getattr(self, name)[:self.count]
+        
+    def spawn(self, n=1, **values):
+        """Add up to n particles; each field is a scalar or an array of length n"""
+        n = min(n, self.capacity - self.count)
+        if n <= 0:
+            return 0
+            
+        start, end = self.count, self.count + n
+        for name in self.FIELDS:
+            value = values.pop(name, self.DEFAULTS.get(name, 0))
+            if np.ndim(value):
+                value = np.asarray(value)[:n]
+            getattr(self, name)[start:end] = value
+        if values:
+            raise ValueError(f"Unknown particle fields: {', '.join(values)}")
+            
+        self.count = end
+        return n
+        
+    def integrate(self, step=1.0, drag=None):
+        """Advance positions and life by step frames"""
+        n = self.count
+        if drag is not None:
+            factor = drag ** step
+            self.vx[:n] *= factor
+            self.vy[:n] *= factor
+        self.x[:n] += self.vx[:n] * step
+        self.y[:n] += self.vy[:n] * step
+        self.life[:n] -= self.decay[:n] * step
+        
+    def remove(self, dead):
+        """Drop the live particles flagged in the boolean mask dead"""
+        n = self.count
+        dead = np.asarray(dead, dtype=bool)
+        removed = int(np.count_nonzero(dead))
+        if not removed:
+            return 0
+            
+        # Live particles beyond the new end fill the holes before it
+        keep = n - removed
+        holes = np.flatnonzero(dead[:keep])
+        movers = keep + np.flatnonzero(~dead[keep:n])
+        for name in self.FIELDS:
+            array = getattr(self, name)
+            array[holes] = array[movers]
+            
+        self.count = keep
+        return removed
+        
+    def cull(self, width=None, height=None):
+        """Remove particles whose life ran out, or that left the given bounds"""
+        dead = self.live('life') <= 0
+        if width is not None and height is not None:
+            x, y = self.live('x'), self.live('y')
+            dead |= (x < 0) | (x > width) | (y < 0) | (y > height)
+        return self.remove(dead)
+        
+    def clear(self):
+        self.count = 0
+
+def draw_particles(painter, system, colors, fade=True, shrink=True, levels=16, scale=1.0):
+    """Draw live particles as round points, one batch per color, alpha and size.
+    
+    colors is indexed by the particles' color field. With fade the alpha
+    follows life, and with shrink the radius does; life is quantized to
+    levels steps so that particles share batches. scale multiplies every
+    radius, for halos drawn under the particles.
+    """
+    n = system.count
+    if not n:
+        return
+        
+    level = np.full(n, levels, dtype=np.int64)
+    if fade or shrink:
+        level = np.ceil(np.clip(system.life[:n], 0, 1) * levels).astype(np.int64)
+        
+    radius = system.size[:n] * scale
+    if shrink:
+        radius = radius * level / levels
+    diameter = np.maximum(1, np.rint(2 * radius)).astype(np.int64)
+    color = system.color[:n].astype(np.int64)
+    
+    # Sort particles by batch key and draw each run with one call
+    key = (color * (levels + 1) + level) * (int(diameter.max()) + 1) + diameter
+    order = np.argsort(key, kind='stable')
+    key = key[order]
+    starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+    ends = np.r_[starts[1:], n]
+    
+    x, y = system.x[:n][order], system.y[:n][order]
+    for start, end in zip(starts, ends):
+        index = order[start]
+        if level[index] <= 0:
+            continue
+            
+        point_color = QColor(colors[color[index]])
+        if fade:
+            point_color.setAlphaF(point_color.alphaF() * level[index] / levels)
+            
+        pen = QPen(point_color)
+        pen.setWidth(int(diameter[index]))
+        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        painter.setPen(pen)
+        painter.drawPointsNp(x[start:end], y[start:end])
+
+def neighbor_pairs(x, y, cutoff):
+    """Pairs i < j of points closer than cutoff, found through a uniform grid.
+    
+    Points are bucketed into cutoff-sized cells and only the same and
+    adjacent cells are compared, half of the 3x3 stencil each way so every
+    pair appears once. Returns i, j, dx, dy and distance, with dx and dy
+    pointing from i to j.
+    """
+    n = len(x)
+    if n < 2:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, np.zeros(0), np.zeros(0), np.zeros(0)
+        
+    cell_x = np.floor(x / cutoff).astype(np.int64)
+    cell_y = np.floor(y / cutoff).astype(np.int64)
+    cell_x -= cell_x.min()
+    cell_y -= cell_y.min()
+    
+    # A spare column keeps the x - 1 and x + 1 neighbours from wrapping rows
+    columns = int(cell_x.max()) + 2
+    cell = cell_y * columns + cell_x
+    order = np.argsort(cell, kind='stable')
+    sorted_cells = cell[order]
+    
+    # Work in sorted order so each point's partners are a contiguous range
+    sorted_x = x[order]
+    sorted_y = y[order]
+    
+    pair_i, pair_j, pair_dx, pair_dy = [], [], [], []
+    for offset_x, offset_y in ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)):
+        target = sorted_cells + offset_y * columns + offset_x
+        begin = np.searchsorted(sorted_cells, target, 'left')
+        end = np.searchsorted(sorted_cells, target, 'right')
+        if offset_x == 0 and offset_y == 0:
+            # Within a cell, pair each point only with those sorted after it
+            begin = np.arange(1, n + 1)
+            
+        counts = np.maximum(end - begin, 0)
+        total = int(counts.sum())
+        if not total:
+            continue
+            
+        # Expand every [begin, end) range into explicit partner positions
+        first = np.repeat(np.arange(n), counts)
+        partner = np.arange(total) + np.repeat(begin - (np.cumsum(counts) - counts), counts)
+        dx = sorted_x[partner] - sorted_x[first]
+        dy = sorted_y[partner] - sorted_y[first]
+        close = dx * dx + dy * dy < cutoff * cutoff
+        pair_i.append(first[close])
+        pair_j.append(partner[close])
+        pair_dx.append(dx[close])
+        pair_dy.append(dy[close])
+        
+    if not pair_i:
+        return neighbor_pairs(x[:0], y[:0], cutoff)
+        
+    dx = np.concatenate(pair_dx)
+    dy = np.concatenate(pair_dy)
+    return (order[np.concatenate(pair_i)], order[np.concatenate(pair_j)],
+            dx, dy, np.sqrt(dx * dx + dy * dy))
+
+# Character classes used to decide which characters are entangled
+UPPER, LOWER, DIGIT, SYMBOL = range(4)
+
+def char_classes(text):
+    """Class of each character as an int array: UPPER, LOWER, DIGIT or SYMBOL"""
+    return np.fromiter(
+        (UPPER if c.isupper() else LOWER if c.islower() else DIGIT if c.isdigit() else SYMBOL
+         for c in text),
+        dtype=np.int64, count=len(text)
+    )
+
+def entangled_pairs(classes, energy=None, max_pairs=None):
+    """Pairs i < j of entangled characters with their strengths, as arrays.
+    
+    Two characters are entangled when they agree on being upper case, on
+    being lower case or on being a digit, or are both symbols. Without
+    energy the strength falls linearly from 1 for neighbours to 0.5 across
+    the text; with energy it decays exponentially with the energy gap and
+    the distance. max_pairs keeps only the strongest pairs, in pair order.
+    Returns i, j and strength.
+    """
+    n = len(classes)
+    i, j = np.triu_indices(n, 1)
+    first, second = classes[i], classes[j]
+    linked = (
+        ((first == UPPER) == (second == UPPER))
+        | ((first == LOWER) == (second == LOWER))
+        | ((first == DIGIT) == (second == DIGIT))
+        | ((first == SYMBOL) & (second == SYMBOL))
+    )
+    i, j = i[linked], j[linked]
+    
+    distance = (j - i) / max(n, 1)
+    if energy is None:
+        strength = 0.5 + 0.5 * (1 - distance)
+    else:
+        strength = np.exp(-2 * np.abs(energy[i] - energy[j])) * np.exp(-3 * distance)
+        
+    if max_pairs is not None and len(strength) > max_pairs:
+        keep = np.sort(np.argsort(-strength, kind='stable')[:max_pairs])
+        i, j, strength = i[keep], j[keep], strength[keep]
+    return i, j, strength
@@ -0,0 +1,58 @@
+import numpy as np
+from PySide6.QtCore import QPointF
+from PySide6.QtGui import QPolygonF
+
+class RingBuffer:
+    """Fixed-capacity history of samples backed by a NumPy array.
+    
+    Every sample is written twice, at its slot and one capacity further
+    on, so the samples from oldest to newest are always one contiguous
+    slice. Appending is O(1) and values() is a view, never a copy.
+    """
+    def __init__(self, capacity, dtype=float):
+        self.capacity = capacity
+        self.data = np.zeros(2 * capacity, dtype=dtype)
+        self.start = 0
+        self.count = 0
+        
+    def __len__(self):
+        return self.count
+        
+    def append(self, value):
+        end = (self.start + self.count) % self.capacity
+        self.data[end] = value
+        self.data[end + self.capacity] = value
+        
+        # Once full, the oldest sample is overwritten
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+            
+    def values(self):
+        """Samples from oldest to newest, as a read-only view"""
+        view = self.data[self.start:self.start + self.count]
+        view.flags.writeable = False
+        return view
+        
+    def last(self):
+        """Newest sample, or None while the buffer is empty"""
+        if not self.count:
+            return None
+        return self.data[(self.start + self.count - 1) % self.capacity]
+        
+    def clear(self):
+        self.start = 0
+        self.count = 0
+
+def polyline(xs, ys):
+    """QPolygonF through the points (xs[i], ys[i])"""
+    xs = np.asarray(xs, dtype=float).tolist()
+    ys = np.asarray(ys, dtype=float).tolist()
+    return QPolygonF([QPointF(x, y) for x, y in zip(xs, ys)])
+
+def series_polyline(values, left, top, step, height, scale=1.0):
+    """Polyline of samples plotted left to right, step apart, 0 at the bottom"""
+    xs = left + np.arange(len(values)) * step
+    ys = top + height * (1 - np.asarray(values) / scale)
+    return polyline(xs, ys)
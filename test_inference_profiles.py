@@ -0,0 +1,24 @@
+"""Tolerance checks for the quantized and ONNX inference profiles.
+
+Both profiles are compared against the fp32 model on
+PasswordAnalyzer.REFERENCE_PASSWORDS. The model is the checkpoint at the
+default path when there is one, and seeded random weights otherwise.
+"""
+import pytest
+import torch
+from quantum_brain import PasswordAnalyzer, onnxruntime
+
+@pytest.fixture(scope='module')
+def analyzer():
+    torch.manual_seed(0)
+    return PasswordAnalyzer()
+
+def test_quantized_strength_drift(analyzer):
+    report = analyzer.compare_profiles(runs=0)
+    assert report['max_strength_delta'] <= PasswordAnalyzer.QUANTIZED_STRENGTH_TOLERANCE, report
+
+@pytest.mark.skipif(onnxruntime is None, reason="onnxruntime is not installed")
+def test_onnx_parity(analyzer):
+    parity = analyzer.verify_onnx_parity()
+    for name in ('strength', 'patterns', 'complexity'):
+        assert parity[name] <= PasswordAnalyzer.ONNX_PARITY_TOLERANCE, parity